@@ -39,7 +39,6 @@ Main modules are:
 """
 
 import enum
-import itertools
 import os
 import sys
 
@@ -70,11 +69,13 @@ from astroid.nodes import *
 from astroid import inference
 
 # more stuff available
+from astroid import context as contextmod
 from astroid import raw_building
 from astroid.bases import BaseInstance, Instance, BoundMethod, UnboundMethod
 from astroid.node_classes import are_exclusive, unpack_infer
 from astroid.scoped_nodes import builtin_lookup
 from astroid.builder import parse, extract_node
+from astroid.context import InferenceBudget
 from astroid.util import Uninferable
 
 # make a manager instance (borg) accessible from astroid package
@@ -86,22 +87,27 @@ del AstroidManager
 # transform utilities (filters and decorator)
 
 
-# pylint: disable=dangerous-default-value
 @wrapt.decorator
-def _inference_tip_cached(func, instance, args, kwargs, _cache={}):
+def _inference_tip_cached(func, instance, args, kwargs):
     """Cache decorator used for inference tips"""
     node = args[0]
-    try:
-        return iter(_cache[func, node])
-    except KeyError:
-        result = func(*args, **kwargs)
-        # Need to keep an iterator around
-        original, copy = itertools.tee(result)
-        _cache[func, node] = list(copy)
-        return original
-
-
-# pylint: enable=dangerous-default-value
+    manager = node.manager
+    cache = manager.inference_tip_cache
+    results = cache.get(func, node)
+    profiler = manager.inference_profiler
+    if profiler is not None:
+        name = profiler.tip_name(func)
+        profiler.record_lookup("tip", name, results is not None)
+    if results is not None:
+        return iter(results)
+    if profiler is not None:
+        results = list(profiler.profile("tip", name, func(*args, **kwargs)))
+    else:
+        results = list(func(*args, **kwargs))
+    if contextmod.budget_exhausted():
+        return iter(results)
+    # Another thread may have cached its results meanwhile, use the same ones.
+    return iter(cache.store(func, node, results))
 
 
 def inference_tip(infer_function, raise_on_overwrite=False):
@@ -156,7 +162,7 @@ def register_module_extender(manager, module_name, get_extension_mod):
                 if obj.parent is extension_module:
                     obj.parent = node
 
-    manager.register_transform(Module, transform, lambda n: n.name == module_name)
+    manager.register_transform(Module, transform, key=module_name)
 
 
 # load brain plugins
@@ -164,7 +170,8 @@ BRAIN_MODULES_DIR = os.path.join(os.path.dirname(__file__), "brain")
 if BRAIN_MODULES_DIR not in sys.path:
     # add it to the end of the list so user path take precedence
     sys.path.append(BRAIN_MODULES_DIR)
-# load modules in this directory
-for module in os.listdir(BRAIN_MODULES_DIR):
-    if module.endswith(".py"):
-        __import__(module[:-3])
+# load the generic modules of this directory, the others are loaded
+# when the modules they are about are built
+from astroid import plugins
+
+plugins.PluginRegistry(BRAIN_MODULES_DIR).install(MANAGER)
@@ -29,5 +29,5 @@ def _looks_like_namespace(node):
 
 
 MANAGER.register_transform(
-    nodes.Call, inference_tip(infer_namespace), _looks_like_namespace
+    nodes.Call, inference_tip(infer_namespace), _looks_like_namespace, key="Namespace"
 )
@@ -207,6 +207,7 @@ def register_builtin_transform(transform, builtin_name):
         nodes.Call,
         inference_tip(_transform_wrapper),
         partial(_builtin_filter_predicate, builtin_name=builtin_name),
+        key=builtin_name.rpartition(".")[2],
     )
 
 
@@ -160,4 +160,5 @@ MANAGER.register_transform(
     astroid.Call,
     astroid.inference_tip(_functools_partial_inference),
     _looks_like_partial,
+    key="partial",
 )
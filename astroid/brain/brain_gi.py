@@ -250,5 +250,8 @@ def _register_require_version(node):
 
 MANAGER.register_failed_import_hook(_import_gi_module)
 MANAGER.register_transform(
-    nodes.Call, _register_require_version, _looks_like_require_version
+    nodes.Call,
+    _register_require_version,
+    _looks_like_require_version,
+    key="require_version",
 )
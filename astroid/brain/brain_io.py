@@ -19,7 +19,7 @@ BufferedWriter = "BufferedWriter"
 def _generic_io_transform(node, name, cls):
     """Transform the given name, by adding the given *class* as a member of the node."""
 
-    io_module = astroid.MANAGER.ast_from_module_name("_io")
+    io_module = node.manager.ast_from_module_name("_io")
     attribute_object = io_module[cls]
     instance = attribute_object.instantiate_class()
     node.locals[name] = [instance]
@@ -37,11 +37,10 @@ def _transform_buffered(node):
     return _generic_io_transform(node, name="raw", cls=FileIO)
 
 
+for buffered in sorted(BUFFERED):
+    astroid.MANAGER.register_transform(
+        astroid.ClassDef, _transform_buffered, key=buffered
+    )
 astroid.MANAGER.register_transform(
-    astroid.ClassDef, _transform_buffered, lambda node: node.name in BUFFERED
-)
-astroid.MANAGER.register_transform(
-    astroid.ClassDef,
-    _transform_text_io_wrapper,
-    lambda node: node.name == TextIOWrapper,
+    astroid.ClassDef, _transform_text_io_wrapper, key=TextIOWrapper
 )
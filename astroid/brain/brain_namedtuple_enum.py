@@ -175,10 +175,16 @@ def infer_named_tuple(node, context=None):
     )
     call_site = arguments.CallSite.from_call(node, context=context)
     func = next(extract_node("import collections; collections.namedtuple").infer())
-    try:
-        rename = next(call_site.infer_argument(func, "rename", context)).bool_value()
-    except InferenceError:
+    if func is util.Uninferable:
+        # collections is out of the search path of the manager.
         rename = False
+    else:
+        try:
+            rename = next(
+                call_site.infer_argument(func, "rename", context)
+            ).bool_value()
+        except InferenceError:
+            rename = False
 
     if rename:
         attributes = _get_renamed_namedtuple_attributes(attributes)
@@ -453,9 +459,14 @@ def infer_typing_namedtuple(node, context=None):
 
 
 MANAGER.register_transform(
-    nodes.Call, inference_tip(infer_named_tuple), _looks_like_namedtuple
+    nodes.Call,
+    inference_tip(infer_named_tuple),
+    _looks_like_namedtuple,
+    key="namedtuple",
+)
+MANAGER.register_transform(
+    nodes.Call, inference_tip(infer_enum), _looks_like_enum, key="Enum"
 )
-MANAGER.register_transform(nodes.Call, inference_tip(infer_enum), _looks_like_enum)
 MANAGER.register_transform(
     nodes.ClassDef,
     infer_enum_class,
@@ -470,7 +481,11 @@ MANAGER.register_transform(
     nodes.FunctionDef,
     inference_tip(infer_typing_namedtuple_function),
     lambda node: node.name == "NamedTuple" and node.parent.name == "typing",
+    key="NamedTuple",
 )
 MANAGER.register_transform(
-    nodes.Call, inference_tip(infer_typing_namedtuple), _looks_like_typing_namedtuple
+    nodes.Call,
+    inference_tip(infer_typing_namedtuple),
+    _looks_like_typing_namedtuple,
+    key="NamedTuple",
 )
@@ -75,5 +75,5 @@ astroid.register_module_extender(
     astroid.MANAGER, "nose.tools.trivial", _nose_tools_trivial_transform
 )
 astroid.MANAGER.register_transform(
-    astroid.Module, _nose_tools_transform, lambda n: n.name == "nose.tools"
+    astroid.Module, _nose_tools_transform, key="nose.tools"
 )
@@ -28,4 +28,5 @@ for func_name, func_src in METHODS_TO_BE_INFERRED.items():
         astroid.Attribute,
         astroid.inference_tip(inference_function),
         functools.partial(looks_like_numpy_member, func_name),
+        key=func_name,
     )
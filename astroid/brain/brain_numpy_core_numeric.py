@@ -42,4 +42,5 @@ for method_name, function_src in METHODS_TO_BE_INFERRED.items():
         astroid.Attribute,
         astroid.inference_tip(inference_function),
         functools.partial(looks_like_numpy_member, method_name),
+        key=method_name,
     )
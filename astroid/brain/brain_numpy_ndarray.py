@@ -152,4 +152,5 @@ astroid.MANAGER.register_transform(
     astroid.Attribute,
     astroid.inference_tip(infer_numpy_ndarray),
     _looks_like_numpy_ndarray,
+    key="ndarray",
 )
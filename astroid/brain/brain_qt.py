@@ -82,4 +82,5 @@ MANAGER.register_transform(
     nodes.ClassDef,
     transform_pyside_signal,
     lambda node: node.qname() in ("PySide.QtCore.Signal", "PySide2.QtCore.Signal"),
+    key="Signal",
 )
@@ -71,5 +71,8 @@ def _looks_like_random_sample(node):
 
 
 MANAGER.register_transform(
-    astroid.Call, astroid.inference_tip(infer_random_sample), _looks_like_random_sample
+    astroid.Call,
+    astroid.inference_tip(infer_random_sample),
+    _looks_like_random_sample,
+    key="sample",
 )
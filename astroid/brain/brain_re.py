@@ -82,5 +82,8 @@ def infer_pattern_match(node: nodes.Call, ctx: context.InferenceContext = None):
 
 if PY37:
     MANAGER.register_transform(
-        nodes.Call, inference_tip(infer_pattern_match), _looks_like_pattern_or_match
+        nodes.Call,
+        inference_tip(infer_pattern_match),
+        _looks_like_pattern_or_match,
+        key="type",
     )
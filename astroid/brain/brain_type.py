@@ -59,5 +59,8 @@ def infer_type_sub(node, context=None):
 
 if PY39:
     MANAGER.register_transform(
-        nodes.Name, inference_tip(infer_type_sub), _looks_like_type_subscript
+        nodes.Name,
+        inference_tip(infer_type_sub),
+        _looks_like_type_subscript,
+        key="type",
     )
@@ -165,13 +165,12 @@ def infer_typing_attr(
         if (
             isinstance(node.parent, nodes.ClassDef)
             and node in node.parent.bases
-            and getattr(node.parent, "__cache", None)
+            and node.parent._cache
         ):
-            # node.parent.slots is evaluated and cached before the inference tip
-            # is first applied. Remove the last result to allow a recalculation of slots
-            cache = getattr(node.parent, "__cache")
-            if cache.get(node.parent.slots) is not None:
-                del cache[node.parent.slots]
+            # node.parent.slots, and the mro it is computed from, are evaluated
+            # and cached before the inference tip is first applied. Remove the
+            # cached values to allow a recalculation of slots
+            node.parent._cache = None
         return iter([value])
 
     node = extract_node(TYPING_TYPE_TEMPLATE.format(value.qname().split(".")[-1]))
@@ -298,21 +297,29 @@ def infer_typing_alias(
     return iter([class_def])
 
 
-MANAGER.register_transform(
-    nodes.Call,
-    inference_tip(infer_typing_typevar_or_newtype),
-    looks_like_typing_typevar_or_newtype,
-)
+for typevar in sorted(TYPING_TYPEVARS):
+    MANAGER.register_transform(
+        nodes.Call,
+        inference_tip(infer_typing_typevar_or_newtype),
+        looks_like_typing_typevar_or_newtype,
+        key=typevar,
+    )
 MANAGER.register_transform(
     nodes.Subscript, inference_tip(infer_typing_attr), _looks_like_typing_subscript
 )
 
 if PY39:
     MANAGER.register_transform(
-        nodes.FunctionDef, inference_tip(infer_typedDict), _looks_like_typedDict
+        nodes.FunctionDef,
+        inference_tip(infer_typedDict),
+        _looks_like_typedDict,
+        key="TypedDict",
     )
 
 if PY37:
     MANAGER.register_transform(
-        nodes.Call, inference_tip(infer_typing_alias), _looks_like_typing_alias
+        nodes.Call,
+        inference_tip(infer_typing_alias),
+        _looks_like_typing_alias,
+        key="_alias",
     )
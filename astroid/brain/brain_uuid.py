@@ -18,5 +18,8 @@ def _patch_uuid_class(node):
 
 
 MANAGER.register_transform(
-    nodes.ClassDef, _patch_uuid_class, lambda node: node.qname() == "uuid.UUID"
+    nodes.ClassDef,
+    _patch_uuid_class,
+    lambda node: node.qname() == "uuid.UUID",
+    key="UUID",
 )
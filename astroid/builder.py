@@ -19,18 +19,25 @@ The builder is not thread safe and can't be used to parse different sources
 at the same time.
 """
 
+import enum
+import marshal
 import os
+import sys
 import textwrap
 from tokenize import detect_encoding
 
+import astroid
 from astroid._ast import get_parser_module
 from astroid import bases
+from astroid import decorators
 from astroid import exceptions
 from astroid import manager
 from astroid import modutils
+from astroid import node_classes
 from astroid import raw_building
 from astroid import rebuilder
 from astroid import nodes
+from astroid import scoped_nodes
 from astroid import util
 
 objects = util.lazy_import("objects")
@@ -55,6 +62,32 @@ def open_source_file(filename):
     return stream, encoding, data
 
 
+def _init_worker(settings):
+    """Configure the manager of a worker of AstroidManager.build_many like
+    the manager which started it, as given by its ``_worker_settings``.
+    """
+    for name, value in settings.items():
+        setattr(MANAGER, name, value)
+
+
+def _build_in_worker(path, modname):
+    """Build the tree of a source file in a worker of AstroidManager.build_many.
+
+    The tree is sent back serialized, or None if it could not be built or
+    serialized, in which case the parent process builds it by itself. The
+    description of any other error is sent back as ``(None, error)``.
+    """
+    try:
+        module, encoding = AstroidBuilder(MANAGER)._file_tree(
+            path, modname, lazy_bodies=False
+        )
+        return dump(module), encoding
+    except (exceptions.AstroidBuildingError, RecursionError, ValueError):
+        return None
+    except Exception as exc:  # pylint: disable=broad-except
+        return None, "{}: {}".format(type(exc).__name__, exc)
+
+
 def _can_assign_attr(node, attrname):
     try:
         slots = node.slots()
@@ -78,8 +111,7 @@ class AstroidBuilder(raw_building.InspectBuilder):
 
     # pylint: disable=redefined-outer-name
     def __init__(self, manager=None, apply_transforms=True):
-        super().__init__()
-        self._manager = manager or MANAGER
+        super().__init__(manager)
         self._apply_transforms = apply_transforms
 
     def module_build(self, module, modname=None):
@@ -97,7 +129,8 @@ class AstroidBuilder(raw_building.InspectBuilder):
             if self._apply_transforms:
                 # We have to handle transformation by ourselves since the
                 # rebuilder isn't called for builtin nodes
-                node = self._manager.visit_transforms(node)
+                with node_classes._not_memoized():
+                    node = self._manager.visit_transforms(node)
         return node
 
     def file_build(self, path, modname=None):
@@ -105,6 +138,11 @@ class AstroidBuilder(raw_building.InspectBuilder):
 
         *path* is expected to be a python source file
         """
+        module, encoding = self._file_tree(path, modname)
+        return self._post_build(module, encoding)
+
+    def _file_tree(self, path, modname=None, lazy_bodies=None):
+        """Get the tree of a source file, before the post build steps."""
         try:
             stream, encoding, data = open_source_file(path)
         except OSError as exc:
@@ -135,8 +173,18 @@ class AstroidBuilder(raw_building.InspectBuilder):
                 except ImportError:
                     modname = os.path.splitext(os.path.basename(path))[0]
             # build astroid representation
-            module = self._data_build(data, modname, path)
-            return self._post_build(module, encoding)
+            disk_cache = self._manager.disk_cache
+            module = None
+            if disk_cache is not None:
+                module = disk_cache.load(data, modname, path)
+            if module is None:
+                if disk_cache is not None:
+                    # The stored trees are complete.
+                    lazy_bodies = False
+                module = self._data_build(data, modname, path, lazy_bodies)
+                if disk_cache is not None:
+                    disk_cache.store(data, modname, path, module)
+            return module, encoding
 
     def string_build(self, data, modname="", path=None):
         """Build astroid from source code string."""
@@ -154,17 +202,26 @@ class AstroidBuilder(raw_building.InspectBuilder):
                 for symbol, _ in from_node.names:
                     module.future_imports.add(symbol)
             self.add_from_names_to_locals(from_node)
-        # handle delayed assattr nodes
-        for delayed in module._delayed_assattr:
-            self.delayed_assattr(delayed)
-
-        # Visit the transforms
-        if self._apply_transforms:
-            module = self._manager.visit_transforms(module)
+        # The tree is not complete until then, the inferences run
+        # meanwhile must not be memoized.
+        with node_classes._not_memoized():
+            # handle delayed assattr nodes
+            for delayed in module._delayed_assattr:
+                self.delayed_assattr(delayed)
+
+            # Visit the transforms
+            if self._apply_transforms:
+                module = self._manager.visit_transforms(module)
         return module
 
-    def _data_build(self, data, modname, path):
-        """Build tree node from data and add some informations"""
+    def _data_build(self, data, modname, path, lazy_bodies=None):
+        """Build tree node from data and add some informations
+
+        The bodies of the functions and of the classes are built on first
+        access if *lazy_bodies* is true, which defaults to the
+        ``lazy_bodies`` option of the manager. They are never built lazily
+        by a thread safe manager.
+        """
         try:
             node, parser_module = _parse_string(data, type_comments=True)
         except (TypeError, ValueError, SyntaxError) as exc:
@@ -188,12 +245,33 @@ class AstroidBuilder(raw_building.InspectBuilder):
                 path is not None
                 and os.path.splitext(os.path.basename(path))[0] == "__init__"
             )
-        builder = rebuilder.TreeRebuilder(self._manager, parser_module)
+        if lazy_bodies is None:
+            lazy_bodies = self._manager.lazy_bodies
+        if self._manager.thread_safe:
+            # The state of the rebuilder is not shared safely between threads.
+            lazy_bodies = False
+        if lazy_bodies:
+            builder = rebuilder.TreeRebuilder(self._manager, parser_module, data)
+            builder.lazy_body_built = self._post_build_body
+        else:
+            builder = rebuilder.TreeRebuilder(self._manager, parser_module)
         module = builder.visit_module(node, modname, node_file, package)
         module._import_from_nodes = builder._import_from_nodes
         module._delayed_assattr = builder._delayed_assattr
         return module
 
+    def _post_build_body(self, node, import_from_nodes, delayed_assattr):
+        """Run the post build steps on a body built lazily, once its module
+        was built.
+        """
+        for from_node in import_from_nodes:
+            self.add_from_names_to_locals(from_node)
+        with node_classes._not_memoized():
+            for delayed in delayed_assattr:
+                self.delayed_assattr(delayed)
+            if self._apply_transforms:
+                self._manager.visit_body_transforms(node)
+
     def add_from_names_to_locals(self, node):
         """Store imported names to the locals
 
@@ -257,6 +335,10 @@ class AstroidBuilder(raw_building.InspectBuilder):
                     values.insert(0, node)
                 else:
                     values.append(node)
+                root = frame.root()
+                if inferred.root() is not root:
+                    root._foreign_attrs.append((iattrs, node))
+                    self._manager._forget_inferences_of(inferred.root())
         except exceptions.InferenceError:
             pass
 
@@ -280,6 +362,230 @@ def parse(code, module_name="", path=None, apply_transforms=True):
     return builder.string_build(code, modname=module_name, path=path)
 
 
+# Bump when the layout produced by dump() changes.
+TREE_FORMAT_VERSION = 2
+_TREE_FORMAT_MAGIC = b"astroid-tree"
+
+# Kinds of the node attributes, as stored by dump().
+_PLAIN = "v"  # a value without nodes, stored as is
+_NODE = "n"  # a node
+_NODE_LIST = "l"  # a list of nodes
+_NESTED = "r"  # lists and tuples of nodes, None and strings
+_LOCALS = "d"  # a dictionary of names to lists of nodes, such as locals
+_CONTEXT = "c"  # a Load, Store or Del context
+_SAME_LOCALS = "a"  # the locals dictionary of the node, such as Module.globals
+_NAMESPACE = "s"  # the locals or the instance_attrs of a class
+
+_NODE_CLASSES = {cls.__name__: cls for cls in nodes.ALL_NODE_CLASSES}
+
+
+def _node_attributes(node):
+    """Get the names and values of the attributes set on *node*.
+
+    The values cached by the decorators are left out.
+    """
+    cached = decorators._cachedproperty_names(type(node))
+    return {
+        name: value
+        for name, value in vars(node).items()
+        if name not in ("_cache", "_manager") and name not in cached
+    }
+
+
+def dump(module):
+    """Serialize the tree of a module built by the rebuilder to bytes.
+
+    The tree must be the one produced before the post build steps and the
+    transforms, as returned by the internal ``_data_build``, since those
+    steps add references to other modules and to registered functions.
+    Use :func:`load` to get the tree back.
+
+    The format is a :mod:`marshal` encoded tuple
+    ``(magic, version, python_version, shapes, records)``:
+
+    * *shapes* is a list of ``(class name, attribute names, attribute kinds)``
+      entries, one for each combination of node class and attributes found
+      in the tree. Kinds are one letter codes telling how each attribute
+      is stored, see the ``_PLAIN`` ... ``_NAMESPACE`` constants.
+    * *records* holds one ``(shape index, parent index, values...)`` tuple
+      per node, the module being the first one. Nodes are referenced by
+      their index in *records*, so that parent links and locals tables are
+      restored as references to the loaded nodes.
+
+    :raises ValueError: If the tree references nodes of other modules or
+        holds values which cannot be serialized.
+    :rtype: bytes
+    """
+    index = {module: 0}
+    order = [module]
+    shapes = {}
+    records = []
+
+    def ref(node):
+        try:
+            return index[node]
+        except KeyError:
+            pass
+        if node.__class__.__name__ not in _NODE_CLASSES:
+            raise ValueError("Cannot serialize {!r}.".format(node))
+        if isinstance(node, nodes.Module):
+            raise ValueError("{!r} references nodes of other modules.".format(module))
+        index[node] = len(order)
+        order.append(node)
+        return index[node]
+
+    def nested(value):
+        if isinstance(value, node_classes.NodeNG):
+            return ref(value)
+        if isinstance(value, (list, tuple)):
+            return type(value)(nested(item) for item in value)
+        if value is None or isinstance(value, str):
+            return value
+        raise ValueError("Cannot serialize {!r} with nodes.".format(value))
+
+    position = 0
+    while position < len(order):
+        node = order[position]
+        position += 1
+        names = []
+        kinds = []
+        values = []
+        attributes = _node_attributes(node)
+        for name, value in attributes.items():
+            if name == "parent":
+                continue
+            if isinstance(value, node_classes.NodeNG):
+                kind, value = _NODE, ref(value)
+            elif isinstance(value, enum.Enum):
+                kind, value = _CONTEXT, value.name
+            elif isinstance(value, scoped_nodes._Namespace):
+                kind = _NAMESPACE
+                value = {
+                    key: [ref(item) for item in items] for key, items in value.items()
+                }
+            elif isinstance(value, dict) and value:
+                if value is attributes.get("locals") and name != "locals":
+                    kind, value = _SAME_LOCALS, None
+                elif all(
+                    isinstance(key, str)
+                    and isinstance(items, list)
+                    and all(isinstance(item, node_classes.NodeNG) for item in items)
+                    for key, items in value.items()
+                ):
+                    kind = _LOCALS
+                    value = {
+                        key: [ref(item) for item in items]
+                        for key, items in value.items()
+                    }
+                else:
+                    kind = _PLAIN
+            elif (
+                isinstance(value, list)
+                and value
+                and all(isinstance(item, node_classes.NodeNG) for item in value)
+            ):
+                kind, value = _NODE_LIST, [ref(item) for item in value]
+            elif isinstance(value, (list, tuple)) and _holds_nodes(value):
+                kind, value = _NESTED, nested(value)
+            else:
+                kind = _PLAIN
+            names.append(name)
+            kinds.append(kind)
+            values.append(value)
+        shape = (node.__class__.__name__, tuple(names), "".join(kinds))
+        shape_index = shapes.setdefault(shape, len(shapes))
+        parent = attributes.get("parent")
+        parent_index = None if parent is None else ref(parent)
+        records.append((shape_index, parent_index, *values))
+
+    try:
+        return marshal.dumps(
+            (
+                _TREE_FORMAT_MAGIC,
+                TREE_FORMAT_VERSION,
+                sys.version_info[:2],
+                list(shapes),
+                records,
+            )
+        )
+    except ValueError as exc:
+        raise ValueError("Cannot serialize {!r}: {}".format(module, exc)) from exc
+
+
+def _holds_nodes(value):
+    for item in value:
+        if isinstance(item, node_classes.NodeNG):
+            return True
+        if isinstance(item, (list, tuple)) and _holds_nodes(item):
+            return True
+    return False
+
+
+def load(data):
+    """Get back the tree of a module serialized by :func:`dump`.
+
+    Like the tree given to :func:`dump`, it belongs to the shared manager
+    until it is cached by another one, through the post build steps of
+    an :class:`AstroidBuilder` or ``AstroidManager.cache_module``.
+
+    :raises ValueError: If *data* was not produced by :func:`dump`, or
+        by another version of astroid's format or of Python.
+    :rtype: Module
+    """
+    try:
+        magic, version, python_version, shapes, records = marshal.loads(data)
+    except (EOFError, TypeError, ValueError) as exc:
+        raise ValueError("Invalid serialized tree.") from exc
+    if (
+        magic != _TREE_FORMAT_MAGIC
+        or version != TREE_FORMAT_VERSION
+        or tuple(python_version) != sys.version_info[:2]
+    ):
+        raise ValueError("Incompatible serialized tree.")
+
+    loaders = []
+    for class_name, names, kinds in shapes:
+        refs = tuple((name, kind) for name, kind in zip(names, kinds) if kind != _PLAIN)
+        loaders.append((_NODE_CLASSES[class_name], names, refs))
+    built = [loaders[record[0]][0].__new__(loaders[record[0]][0]) for record in records]
+
+    def nested(value):
+        if isinstance(value, int):
+            return built[value]
+        if isinstance(value, (list, tuple)):
+            return type(value)(nested(item) for item in value)
+        return value
+
+    for node, record in zip(built, records):
+        _, names, refs = loaders[record[0]]
+        attrs = dict(zip(names, record[2:]))
+        parent = record[1]
+        attrs["parent"] = None if parent is None else built[parent]
+        for name, kind in refs:
+            value = attrs[name]
+            if kind == _NODE:
+                attrs[name] = built[value]
+            elif kind == _NODE_LIST:
+                attrs[name] = [built[item] for item in value]
+            elif kind == _LOCALS:
+                attrs[name] = {
+                    key: [built[item] for item in items] for key, items in value.items()
+                }
+            elif kind == _NAMESPACE:
+                attrs[name] = scoped_nodes._Namespace(
+                    (key, [built[item] for item in items])
+                    for key, items in value.items()
+                )
+            elif kind == _SAME_LOCALS:
+                attrs[name] = attrs["locals"]
+            elif kind == _CONTEXT:
+                attrs[name] = getattr(astroid, value)
+            else:
+                attrs[name] = nested(value)
+        node.__dict__ = attrs
+    return built[0]
+
+
 def _extract_expressions(node):
     """Find expressions in a call to _TRANSIENT_FUNCTION and extract them.
 
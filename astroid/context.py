@@ -12,9 +12,114 @@
 """Various context related utilities, including inference and call contexts."""
 import contextlib
 import pprint
+import threading
+import time
 from typing import Optional
 
 
+class InferenceBudget:
+    """Limits of the work done by a top-level inference.
+
+    A budget is spent by the ``infer()`` call it is given to, through
+    :attr:`InferenceContext.budget` or ``AstroidManager.inference_budget``,
+    and by every inference nested in it, whatever their context. Once it
+    is exhausted, the nested inferences yield ``Uninferable`` instead of
+    running, and their results are not cached.
+
+    :param max_visits: The number of nodes which can be inferred.
+    :type max_visits: int or None
+    :param max_depth: The number of inferences which can be nested.
+    :type max_depth: int or None
+    :param timeout: The number of seconds the inference can last.
+    :type timeout: float or None
+    """
+
+    __slots__ = (
+        "max_visits",
+        "max_depth",
+        "timeout",
+        "visits",
+        "depth",
+        "deadline",
+        "exhausted",
+    )
+
+    def __init__(self, max_visits=None, max_depth=None, timeout=None):
+        self.max_visits = max_visits
+        self.max_depth = max_depth
+        self.timeout = timeout
+        self.visits = 0
+        self.depth = 0
+        self.deadline = None
+        self.exhausted = False
+
+    def copy(self):
+        """Get an unspent budget with the same limits."""
+        return InferenceBudget(self.max_visits, self.max_depth, self.timeout)
+
+    def start(self):
+        """Reset the spending, when the top-level inference starts."""
+        self.visits = 0
+        self.depth = 0
+        self.exhausted = False
+        if self.timeout is not None:
+            self.deadline = time.monotonic() + self.timeout
+
+    def enter(self):
+        """Account for the inference of a node.
+
+        :returns: Whether the inference can go on, in which case
+            :meth:`leave` must be called once it is finished.
+        :rtype: bool
+        """
+        if self.exhausted:
+            return False
+        self.visits += 1
+        if self.max_visits is not None and self.visits > self.max_visits:
+            self.exhausted = True
+        elif self.max_depth is not None and self.depth >= self.max_depth:
+            self.exhausted = True
+        elif self.deadline is not None and time.monotonic() > self.deadline:
+            self.exhausted = True
+        else:
+            self.depth += 1
+        return not self.exhausted
+
+    def leave(self):
+        self.depth -= 1
+
+    def __repr__(self):
+        return "<InferenceBudget visits={}/{} depth={}/{} timeout={}{}>".format(
+            self.visits,
+            self.max_visits,
+            self.depth,
+            self.max_depth,
+            self.timeout,
+            " exhausted" if self.exhausted else "",
+        )
+
+
+class _ActiveBudget(threading.local):
+    # The budget of the top-level inference running in this thread.
+    budget = None
+
+
+_ACTIVE = _ActiveBudget()
+
+
+def active_budget():
+    """Get the budget of the top-level inference running in this thread, if any."""
+    return _ACTIVE.budget
+
+
+def budget_exhausted():
+    """Whether the running inference ran out of budget, in which case its
+    results must not be cached.
+    """
+    budget = _ACTIVE.budget
+    return budget is not None and budget.exhausted
+
+
 class InferenceContext:
     """Provide context for inference
 
@@ -29,9 +134,10 @@ class InferenceContext:
         "boundnode",
         "inferred",
         "extra_context",
+        "budget",
     )
 
-    def __init__(self, path=None, inferred=None):
+    def __init__(self, path=None, inferred=None, budget=None):
         self.path = path or set()
         """
         :type: set(tuple(NodeNG, optional(str)))
@@ -79,6 +185,14 @@ class InferenceContext:
         Context that needs to be passed down through call stacks
         for call arguments
         """
+        self.budget = budget
+        """
+        :type: optional[InferenceBudget]
+
+        The budget of an inference started with this context, spent by
+        the inferences nested in it. Ignored by the nested inferences,
+        which spend the budget of the top-level one.
+        """
 
     def push(self, node):
         """Push node into inference path
@@ -106,6 +220,7 @@ class InferenceContext:
         clone.callcontext = self.callcontext
         clone.boundnode = self.boundnode
         clone.extra_context = self.extra_context
+        clone.budget = self.budget
         return clone
 
     @contextlib.contextmanager
@@ -18,6 +18,7 @@
 """ A few useful function/method decorators."""
 
 import functools
+import threading
 
 import wrapt
 
@@ -26,17 +27,46 @@ from astroid import exceptions
 from astroid import util
 
 
+# Held while creating the cache of an instance, which threads must share.
+_CACHE_LOCK = threading.Lock()
+
+
+def _own_cache(instance):
+    # Not getattr, since proxies would look the cache up on the proxied object.
+    try:
+        return object.__getattribute__(instance, "_cache")
+    except AttributeError:
+        return None
+
+
+def _cache_of(instance):
+    cache = _own_cache(instance)
+    if cache is None:
+        with _CACHE_LOCK:
+            # Another thread may have created it meanwhile.
+            cache = _own_cache(instance)
+            if cache is None:
+                instance._cache = cache = {}
+    return cache
+
+
 @wrapt.decorator
 def cached(func, instance, args, kwargs):
-    """Simple decorator to cache result of method calls without args."""
-    cache = getattr(instance, "__cache", None)
-    if cache is None:
-        instance.__cache = cache = {}
+    """Simple decorator to cache result of method calls without args.
+
+    The results are stored in the ``_cache`` dictionary of the instance.
+    """
+    cache = _cache_of(instance)
     try:
         return cache[func]
     except KeyError:
-        cache[func] = result = func(*args, **kwargs)
+        pass
+    result = func(*args, **kwargs)
+    if contextmod.budget_exhausted():
+        # Computed with some inferences cut short.
         return result
+    # The first result cached wins, when computed by several threads.
+    return cache.setdefault(func, result)
 
 
 class cachedproperty:
@@ -74,8 +104,29 @@ class cachedproperty:
         if inst is None:
             return self
         val = self.wrapped(inst)
-        setattr(inst, self.wrapped.__name__, val)
-        return val
+        if contextmod.budget_exhausted():
+            return val
+        # The first value cached wins, when computed by several threads.
+        return vars(inst).setdefault(self.wrapped.__name__, val)
+
+
+_CACHEDPROPERTY_NAMES = {}
+
+
+def _cachedproperty_names(cls):
+    """Get the names of the cached properties of *cls*, which are those
+    of the values that they store in the instance dictionary.
+    """
+    try:
+        return _CACHEDPROPERTY_NAMES[cls]
+    except KeyError:
+        names = _CACHEDPROPERTY_NAMES[cls] = frozenset(
+            name
+            for klass in cls.__mro__
+            for name, value in vars(klass).items()
+            if isinstance(value, cachedproperty)
+        )
+        return names
 
 
 def path_wrapper(func):
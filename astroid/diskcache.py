@@ -0,0 +1,252 @@
+# Licensed under the LGPL: https://www.gnu.org/licenses/old-licenses/lgpl-2.1.en.html
+# For details: https://github.com/PyCQA/astroid/blob/master/LICENSE
+
+"""Persistent, on-disk cache of rebuilt module trees.
+
+Building a module from source is dominated by parsing it and by rebuilding
+the resulting ``ast`` tree into astroid nodes. For files which rarely change,
+such as the standard library or third party dependencies, this work can be
+done once and reused by later processes.
+
+The cache stores the tree as produced by the :class:`~astroid.rebuilder.TreeRebuilder`,
+that is, *before* the post build steps and the transforms are applied. Those
+steps depend on other modules and on the registered brain plugins, so they
+are always run again after a tree is loaded, which means that enabling or
+disabling plugins never invalidates the cache. Trees are stored in the
+format of :func:`astroid.builder.dump`. Entries are keyed on the content of
+the source file, its path and name, the Python version and the astroid
+version.
+
+The cache is opt-in::
+
+    from astroid import MANAGER
+    from astroid.diskcache import DiskCache
+
+    MANAGER.disk_cache = DiskCache("~/.cache/astroid")
+
+It can be inspected and pruned from the command line with
+``python -m astroid.diskcache``.
+"""
+
+import argparse
+import hashlib
+import marshal
+import os
+import struct
+import sys
+import tempfile
+import time
+
+from astroid import builder
+from astroid.__pkginfo__ import version as astroid_version
+
+
+# Bump when the layout of the stored entries changes.
+CACHE_FORMAT_VERSION = 3
+CACHE_SUFFIX = ".astroid"
+# Entries start with the size of their marshalled metadata.
+_HEADER = struct.Struct("<I")
+
+
+def _read_metadata(stream):
+    (size,) = _HEADER.unpack(stream.read(_HEADER.size))
+    return marshal.loads(stream.read(size))
+
+
+class DiskCache:
+    """A directory holding rebuilt module trees, one file per entry.
+
+    Writers never modify an entry in place: the entry is written to a
+    temporary file which is then atomically renamed, so that concurrent
+    processes sharing the same directory either see a complete entry or
+    no entry at all. Entries which cannot be read back are treated as
+    misses and removed.
+    """
+
+    def __init__(self, directory):
+        self.directory = os.path.abspath(os.path.expanduser(directory))
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, data, modname, path):
+        """Get the key under which the tree built from *data* is stored."""
+        hasher = hashlib.sha256()
+        for part in (
+            str(CACHE_FORMAT_VERSION),
+            astroid_version,
+            sys.version,
+            modname,
+            os.path.abspath(path),
+        ):
+            hasher.update(part.encode("utf-8"))
+            hasher.update(b"\0")
+        hasher.update(data.encode("utf-8", "surrogatepass"))
+        return hasher.hexdigest()
+
+    def _entry_path(self, key):
+        return os.path.join(self.directory, key[:2], key + CACHE_SUFFIX)
+
+    def load(self, data, modname, path):
+        """Get the cached tree built from *data*, or None on a miss."""
+        entry_path = self._entry_path(self.key(data, modname, path))
+        try:
+            with open(entry_path, "rb") as stream:
+                _read_metadata(stream)
+                module = builder.load(stream.read())
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception:  # pylint: disable=broad-except
+            # Truncated or stale entry, drop it and rebuild.
+            self.misses += 1
+            self._remove(entry_path)
+            return None
+        try:
+            # Record the access so that prune() evicts the least recently used.
+            os.utime(entry_path)
+        except OSError:
+            pass
+        self.hits += 1
+        return module
+
+    def store(self, data, modname, path, module):
+        """Store the tree built from *data*.
+
+        Failures are silently ignored, the cache being only an optimization.
+        """
+        metadata = {
+            "modname": modname,
+            "path": os.path.abspath(path),
+            "python": sys.version,
+            "astroid": astroid_version,
+            "created": time.time(),
+        }
+        try:
+            tree = builder.dump(module)
+        except (ValueError, RecursionError):
+            return
+        metadata = marshal.dumps(metadata)
+        payload = _HEADER.pack(len(metadata)) + metadata + tree
+        entry_path = self._entry_path(self.key(data, modname, path))
+        entry_dir = os.path.dirname(entry_path)
+        try:
+            os.makedirs(entry_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=entry_dir, suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "wb") as stream:
+                stream.write(payload)
+            os.replace(tmp_path, entry_path)
+        except OSError:
+            self._remove(tmp_path)
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _entry_paths(self):
+        try:
+            subdirs = os.listdir(self.directory)
+        except OSError:
+            return
+        for subdir in subdirs:
+            subdir = os.path.join(self.directory, subdir)
+            if not os.path.isdir(subdir):
+                continue
+            for filename in os.listdir(subdir):
+                if filename.endswith(CACHE_SUFFIX):
+                    yield os.path.join(subdir, filename)
+
+    def entries(self):
+        """Get the metadata of every entry, without loading the trees.
+
+        :returns: dictionaries with the ``modname``, ``path``, ``python``,
+            ``astroid``, ``created``, ``accessed`` and ``size`` of each entry.
+        :rtype: iterable(dict)
+        """
+        for entry_path in self._entry_paths():
+            try:
+                with open(entry_path, "rb") as stream:
+                    metadata = _read_metadata(stream)
+                stat = os.stat(entry_path)
+            except Exception:  # pylint: disable=broad-except
+                continue
+            metadata.update(entry=entry_path, accessed=stat.st_mtime, size=stat.st_size)
+            yield metadata
+
+    def prune(self, max_age=None, max_size=None):
+        """Remove entries not accessed for *max_age* seconds, then remove the
+        least recently used entries until the cache is at most *max_size* bytes.
+
+        :returns: The number of removed entries.
+        :rtype: int
+        """
+        entries = []
+        for entry_path in self._entry_paths():
+            try:
+                stat = os.stat(entry_path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry_path))
+        entries.sort()
+        removed = 0
+        now = time.time()
+        total_size = sum(size for _, size, _ in entries)
+        for accessed, size, entry_path in entries:
+            too_old = max_age is not None and now - accessed > max_age
+            too_big = max_size is not None and total_size > max_size
+            if not (too_old or too_big):
+                continue
+            self._remove(entry_path)
+            total_size -= size
+            removed += 1
+        return removed
+
+    def clear(self):
+        """Remove every entry."""
+        return self.prune(max_age=-1)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m astroid.diskcache",
+        description="Inspect and prune a persistent astroid cache.",
+    )
+    parser.add_argument("directory", help="the cache directory")
+    commands = parser.add_subparsers(dest="command")
+    commands.required = True
+    commands.add_parser("info", help="show the number and size of entries")
+    commands.add_parser("list", help="list the cached modules")
+    prune = commands.add_parser("prune", help="remove old or excess entries")
+    prune.add_argument(
+        "--max-age", type=float, help="remove entries unused for this many days"
+    )
+    prune.add_argument(
+        "--max-size", type=float, help="shrink the cache to this many megabytes"
+    )
+    commands.add_parser("clear", help="remove every entry")
+    args = parser.parse_args(argv)
+
+    cache = DiskCache(args.directory)
+    if args.command == "info":
+        entries = list(cache.entries())
+        size = sum(entry["size"] for entry in entries)
+        print(f"{cache.directory}: {len(entries)} entries, {size / 2 ** 20:.1f} MB")
+    elif args.command == "list":
+        for entry in sorted(cache.entries(), key=lambda entry: entry["modname"]):
+            print("{modname}\t{size}\t{path}".format(**entry))
+    elif args.command == "prune":
+        max_age = args.max_age * 86400 if args.max_age is not None else None
+        max_size = args.max_size * 2 ** 20 if args.max_size is not None else None
+        print(f"removed {cache.prune(max_age, max_size)} entries")
+    else:
+        print(f"removed {cache.clear()} entries")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -35,14 +35,12 @@ from astroid import context as contextmod
 from astroid import exceptions
 from astroid import decorators
 from astroid import helpers
-from astroid import manager
 from astroid import nodes
 from astroid.interpreter import dunder_lookup
 from astroid import protocols
 from astroid import util
 
 
-MANAGER = manager.AstroidManager()
 # Prevents circular imports
 objects = util.lazy_import("objects")
 
@@ -863,7 +861,9 @@ def infer_empty_node(self, context=None):
         yield util.Uninferable
     else:
         try:
-            yield from MANAGER.infer_ast_from_something(self.object, context=context)
+            yield from self.manager.infer_ast_from_something(
+                self.object, context=context
+            )
         except exceptions.AstroidError:
             yield util.Uninferable
 
@@ -954,18 +954,18 @@ def infer_ifexp(self, context=None):
 nodes.IfExp._infer = infer_ifexp
 
 
-# pylint: disable=dangerous-default-value
 @wrapt.decorator
-def _cached_generator(func, instance, args, kwargs, _cache={}):
-    node = args[0]
-    try:
-        return iter(_cache[func, id(node)])
-    except KeyError:
-        result = func(*args, **kwargs)
-        # Need to keep an iterator around
-        original, copy = itertools.tee(result)
-        _cache[func, id(node)] = list(copy)
-        return original
+def _cached_generator(func, instance, args, kwargs):
+    node = instance
+    cache = node.manager.inference_generator_cache
+    results = cache.get(func, node)
+    if results is None:
+        results = list(func(*args, **kwargs))
+        if contextmod.budget_exhausted():
+            return iter(results)
+        # Another thread may have cached its results meanwhile, use the same ones.
+        results = cache.store(func, node, results)
+    return iter(results)
 
 
 # When inferring a property, we instantiate a new `objects.Property` object,
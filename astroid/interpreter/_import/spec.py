@@ -15,10 +15,13 @@
 
 import abc
 import collections
+import contextlib
 import distutils
 import enum
 import os
 import sys
+import threading
+import time
 import zipimport
 
 import importlib.machinery
@@ -68,6 +71,93 @@ class ModuleSpec(_ModuleSpec):
         )
 
 
+# Seconds after its last modification during which a directory is listed
+# again on every use, since files added during the same tick of the clock
+# of its file system would not change its modification time.
+_RACY_DELAY = 2.0
+
+_Listing = collections.namedtuple("_Listing", "mtime files directories")
+_NO_LISTING = _Listing(None, frozenset(), frozenset())
+
+# absolute path of a directory -> _Listing of its entries
+_LISTINGS = {}
+
+
+class _Recording(threading.local):
+    # absolute path of a directory -> its modification time, or None
+    listings = None
+
+
+_RECORDING = _Recording()
+
+
+@contextlib.contextmanager
+def record_listings():
+    """Record the directories used meanwhile by the current thread to find
+    modules, in the dictionary given by the context manager, mapping them
+    to their modification time in nanoseconds, or None if missing.
+    """
+    outer = _RECORDING.listings
+    listings = _RECORDING.listings = {}
+    try:
+        yield listings
+    finally:
+        _RECORDING.listings = outer
+        if outer is not None:
+            outer.update(listings)
+
+
+def _listing(directory):
+    """Get the names of the files and of the directories found in *directory*.
+
+    The listing is cached until the modification time of the directory
+    changes, so that finding a module costs a stat of the directories
+    searched instead of a stat of each file which could be the module.
+    """
+    if not os.path.isabs(directory):
+        directory = os.path.abspath(directory)
+    try:
+        mtime = os.stat(directory).st_mtime_ns
+    except OSError:
+        mtime = None
+    if _RECORDING.listings is not None:
+        _RECORDING.listings[directory] = mtime
+    if mtime is None:
+        return _NO_LISTING
+    listing = _LISTINGS.get(directory)
+    if listing is not None and listing.mtime == mtime:
+        return listing
+    files = set()
+    directories = set()
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_file():
+                        files.add(entry.name)
+                    elif entry.is_dir():
+                        directories.add(entry.name)
+                except OSError:
+                    continue
+    except OSError:
+        return _NO_LISTING
+    listing = _Listing(mtime, frozenset(files), frozenset(directories))
+    if time.time() - mtime / 1e9 > _RACY_DELAY:
+        _LISTINGS[directory] = listing
+    else:
+        _LISTINGS.pop(directory, None)
+    return listing
+
+
+def invalidate_caches():
+    """Forget the listings of the directories searched for modules.
+
+    They are listed again anyway once modified, unless the clock of their
+    file system does not change their modification time.
+    """
+    _LISTINGS.clear()
+
+
 class Finder:
     """A finder is a class which knows how to find a particular module."""
 
@@ -132,22 +222,24 @@ class ImportlibFinder(Finder):
             submodule_path = sys.path
 
         for entry in submodule_path:
-            package_directory = os.path.join(entry, modname)
-            for suffix in [".py", importlib.machinery.BYTECODE_SUFFIXES[0]]:
-                package_file_name = "__init__" + suffix
-                file_path = os.path.join(package_directory, package_file_name)
-                if os.path.isfile(file_path):
-                    return ModuleSpec(
-                        name=modname,
-                        location=package_directory,
-                        module_type=ModuleType.PKG_DIRECTORY,
-                    )
+            listing = _listing(entry)
+            if modname in listing.directories:
+                package_directory = os.path.join(entry, modname)
+                package_files = _listing(package_directory).files
+                for suffix in [".py", importlib.machinery.BYTECODE_SUFFIXES[0]]:
+                    if "__init__" + suffix in package_files:
+                        return ModuleSpec(
+                            name=modname,
+                            location=package_directory,
+                            module_type=ModuleType.PKG_DIRECTORY,
+                        )
             for suffix, type_ in ImportlibFinder._SUFFIXES:
                 file_name = modname + suffix
-                file_path = os.path.join(entry, file_name)
-                if os.path.isfile(file_path):
+                if file_name in listing.files:
                     return ModuleSpec(
-                        name=modname, location=file_path, module_type=type_
+                        name=modname,
+                        location=os.path.join(entry, file_name),
+                        module_type=type_,
                     )
         return None
 
@@ -327,8 +419,9 @@ def _search_zip(modpath, pic):
 
 
 def _find_spec_with_path(search_path, modname, module_parts, processed, submodule_path):
-    finders = [finder(search_path) for finder in _SPEC_FINDERS]
-    for finder in finders:
+    # Created one after the other, the first ones usually finding the module.
+    for finder_class in _SPEC_FINDERS:
+        finder = finder_class(search_path)
         spec = finder.find_module(modname, module_parts, processed, submodule_path)
         if spec is None:
             continue
@@ -21,8 +21,13 @@ from astroid import exceptions
 def _lookup_in_mro(node, name):
     attrs = node.locals.get(name, [])
 
+    klass = node._proxied if isinstance(node, astroid.Instance) else node
+    if isinstance(klass, astroid.ClassDef):
+        ancestors = klass._ancestors_defining(name)
+    else:
+        ancestors = node.ancestors(recurs=True)
     nodes = itertools.chain.from_iterable(
-        ancestor.locals.get(name, []) for ancestor in node.ancestors(recurs=True)
+        ancestor.locals.get(name, []) for ancestor in ancestors
     )
     values = list(itertools.chain(attrs, nodes))
     if not values:
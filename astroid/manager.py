@@ -23,16 +23,211 @@ possible by providing a class responsible to get astroid representation
 from various source and using a cache of built modules)
 """
 
+import collections
+import concurrent.futures
+import contextlib
+import marshal
 import os
+import sys
+import tempfile
+import threading
+import time
 import zipimport
 
+from astroid import decorators
 from astroid import exceptions
+from astroid.__pkginfo__ import version as astroid_version
 from astroid.interpreter._import import spec
+from astroid import modulecache
 from astroid import modutils
+from astroid import profiling
 from astroid import transforms
 
 
 ZIP_IMPORT_EXTS = (".zip", ".egg", ".whl")
+# Bump when the layout of the files saved by save_module_files changes.
+MODULE_FILES_FORMAT_VERSION = 1
+# Module types whose files are not found from the listings of directories.
+_UNSAVED_MODULE_TYPES = (spec.ModuleType.PY_NAMESPACE, spec.ModuleType.PY_ZIPMODULE)
+
+
+class _ActingManager(threading.local):
+    # the isolated manager running brain code on this thread
+    manager = None
+
+
+_ACTING = _ActingManager()
+
+
+def acting_manager():
+    """Get the isolated manager running the transforms, inference tips or
+    failed import hooks on this thread, if any.
+
+    The builders asked for the shared manager meanwhile, such as those of
+    :func:`~astroid.builder.parse` and :func:`~astroid.builder.extract_node`,
+    build with this one, so that the nodes made by the brain plugins
+    belong to it.
+    """
+    return _ACTING.manager
+
+
+class _ThreadGuards:
+    """The locks of a manager, which only lock something in thread safe mode.
+
+    :attr:`lock` guards the caches, :attr:`build_locks` maps the names of
+    the modules to the lock held while building them, if thread safe.
+    """
+
+    def __init__(self, thread_safe=False):
+        self.lock = threading.RLock() if thread_safe else modulecache.NO_LOCK
+        self.build_locks = {} if thread_safe else None
+        # module name -> thread holding its build lock
+        self._builders = {}
+        # thread -> name of the module whose build lock it waits for
+        self._waiting = {}
+
+    @contextlib.contextmanager
+    def build_lock(self, modname, unless_circular=False):
+        """Hold the lock of the build of the module called *modname*, if
+        thread safe, yielding whether it is held.
+
+        With *unless_circular*, the lock is not waited for when its holder
+        waits, directly or not, for a build lock held by this thread, which
+        would deadlock.
+        """
+        if self.build_locks is None:
+            yield True
+            return
+        # setdefault is atomic, so that every thread gets the same lock.
+        lock = self.build_locks.setdefault(modname, threading.RLock())
+        thread = threading.get_ident()
+        with self.lock:
+            circular = unless_circular and self._waits_for(modname, thread)
+            if not circular:
+                self._waiting[thread] = modname
+        if circular:
+            yield False
+            return
+        try:
+            lock.acquire()
+        finally:
+            with self.lock:
+                del self._waiting[thread]
+        with self.lock:
+            # The lock is reentrant, only the outermost build unregisters.
+            outermost = modname not in self._builders
+            self._builders[modname] = thread
+        try:
+            yield True
+        finally:
+            if outermost:
+                with self.lock:
+                    del self._builders[modname]
+            lock.release()
+
+    def _waits_for(self, modname, thread):
+        """Tell whether the holder of the build lock of *modname* is another
+        thread waiting, directly or not, for a build lock held by *thread*.
+        """
+        holder = self._builders.get(modname)
+        seen = set()
+        while holder is not None and holder not in seen:
+            if holder == thread:
+                return bool(seen)
+            seen.add(holder)
+            holder = self._builders.get(self._waiting.get(holder))
+        return False
+
+    def wait_for_build(self, modname):
+        """Wait until the module called *modname* is built, if another thread
+        is building it.
+
+        Modules are cached before their post build steps and transforms,
+        for circular imports. The module is used unfinished, as in a
+        circular import, if the building thread waits for this one.
+        """
+        if modname in self._builders:
+            with self.build_lock(modname, unless_circular=True):
+                pass
+
+
+class _ImportGraph:
+    """The names of the imported modules, mapped to those of their importers.
+
+    This is used to find the modules to refresh when a module is invalidated.
+    """
+
+    def __init__(self):
+        self._importers = collections.defaultdict(set)
+
+    def add(self, importer, imported):
+        self._importers[imported].add(importer)
+
+    def importers_of(self, modname):
+        """Get the names of the modules which imported the module called
+        *modname*, directly or not.
+        """
+        importers = set()
+        to_visit = [modname]
+        while to_visit:
+            for importer in self._importers.get(to_visit.pop(), ()):
+                if importer not in importers and importer != modname:
+                    importers.add(importer)
+                    to_visit.append(importer)
+        return importers
+
+    def forget_importer(self, modname):
+        """Forget the imports made by the module called *modname*."""
+        for importers in self._importers.values():
+            importers.discard(modname)
+
+    def clear(self):
+        self._importers.clear()
+
+
+class _ModuleFiles(dict):
+    """The specs of the module files, or the errors raised when looking for
+    them, by module name and directory of the context file or None.
+
+    :attr:`path` is the search path with which they were found, and
+    :attr:`listings` maps the keys to the directories listed to find them,
+    if they are saved, see AstroidManager.load_module_files.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.path = []
+        self.listings = None
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        if self.listings is not None:
+            self.listings.pop(key, None)
+
+    def clear(self):
+        super().clear()
+        if self.listings is not None:
+            self.listings.clear()
+
+
+class _InferenceState:
+    """The caches, switches and statistics of the inferences run with a manager."""
+
+    def __init__(self):
+        self.tip_cache = modulecache.InferenceCache()
+        # Results of the inferences which do not depend on their context.
+        self.memo = modulecache.InferenceCache()
+        # Results of the inference functions decorated with
+        # inference._cached_generator.
+        self.generator_cache = modulecache.InferenceCache()
+        self.memoize = True
+        # (module name, line, node class) -> inferences out of budget
+        self.budget_exhaustions = collections.Counter()
+        # statistics of the inferences, see AstroidManager.profile_inference
+        self.profiler = None
+
+    def caches(self):
+        return (self.tip_cache, self.memo, self.generator_cache)
 
 
 def safe_repr(obj):
@@ -46,28 +241,249 @@ class AstroidManager:
     """the astroid manager, responsible to build astroid from files
      or modules.
 
-    Use the Borg pattern.
+    Use the Borg pattern: every manager shares the same state, unless it
+    is created with *isolated* set. An isolated manager has its own caches,
+    search path, transforms and options, so that analyses with different
+    settings can run side by side. It starts with a copy of the transforms
+    and failed import hooks of the shared manager, getting those of the
+    brain plugins loaded later on as well, unless *with_brain* is unset: it
+    then starts without any transform and is left out of the brain plugins
+    registry. The nodes find the manager which built their module through
+    :attr:`NodeNG.manager <astroid.node_classes.NodeNG.manager>`, the nodes
+    built by the brain plugins for an isolated manager belonging to it.
+
+    The builtins module is shared by all the managers, since its classes
+    are the proxies of the constants of every tree.
+
+    A manager used by several threads at once must be made
+    :attr:`thread_safe` first.
     """
 
     name = "astroid loader"
     brain = {}
+    # opt-in persistent cache of rebuilt trees, see astroid.diskcache
+    disk_cache = None
+    # opt-in lazy building of the bodies of functions and classes, which
+    # are rebuilt from the source when they are first accessed
+    lazy_bodies = False
+    # registry loading the brain plugins on demand, see astroid.plugins
+    brain_plugins = None
+    # where to look for modules, sys.path if None
+    search_path = None
+    # opt-in limits of every top-level inference, see context.InferenceBudget
+    inference_budget = None
+    # guards of the caches and of the builds, see thread_safe
+    _guards = _ThreadGuards()
 
-    def __init__(self):
-        self.__dict__ = AstroidManager.brain
+    def __init__(self, isolated=False, with_brain=True):
+        if not (isolated or with_brain):
+            raise ValueError("Only an isolated manager can leave out the brain.")
+        self.__dict__ = {} if isolated else AstroidManager.brain
         if not self.__dict__:
             # NOTE: cache entries are added by the [re]builder
-            self.astroid_cache = {}
-            self._mod_file_cache = {}
+            self.astroid_cache = modulecache.ModuleCache()
+            self.astroid_cache.eviction_callbacks.append(self._drop_module_caches)
+            self._inference = _InferenceState()
+            self._mod_file_cache = _ModuleFiles()
             self._failed_import_hooks = []
             self.always_load_extensions = False
             self.optimize_ast = False
             self.extension_package_whitelist = set()
+            self._import_graph = _ImportGraph()
             self._transform = transforms.TransformVisitor()
 
             # Export these APIs for convenience
             self.register_transform = self._transform.register_transform
             self.unregister_transform = self._transform.unregister_transform
             self.max_inferable_values = 100
+            if isolated:
+                if with_brain:
+                    self._copy_shared_setup()
+                self.bootstrap()
+
+    def __reduce__(self):
+        # Modules refer to the manager which built them, the shared one
+        # standing for it once they are unpickled.
+        return AstroidManager, ()
+
+    @property
+    def isolated(self):
+        """Whether this manager has its own state."""
+        return self.__dict__ is not AstroidManager.brain
+
+    @property
+    def inference_tip_cache(self):
+        """The results of the inference tips.
+
+        :type: modulecache.InferenceCache
+        """
+        return self._inference.tip_cache
+
+    @property
+    def inference_memo(self):
+        """The results of the inferences which do not depend on their context.
+
+        :type: modulecache.InferenceCache
+        """
+        return self._inference.memo
+
+    @property
+    def inference_generator_cache(self):
+        """The results of the inference functions decorated with
+        ``inference._cached_generator``.
+
+        :type: modulecache.InferenceCache
+        """
+        return self._inference.generator_cache
+
+    @property
+    def memoize_inference(self):
+        """Whether the results of the context free inferences are memoized.
+
+        :type: bool
+        """
+        return self._inference.memoize
+
+    @memoize_inference.setter
+    def memoize_inference(self, enabled):
+        self._inference.memoize = enabled
+
+    @property
+    def budget_exhaustions(self):
+        """The numbers of inferences which ran out of budget, by module name,
+        line and node class.
+
+        :type: collections.Counter
+        """
+        return self._inference.budget_exhaustions
+
+    @property
+    def inference_profiler(self):
+        """The statistics of the inferences, see :meth:`profile_inference`.
+
+        :type: profiling.InferenceProfiler or None
+        """
+        return self._inference.profiler
+
+    @property
+    def thread_safe(self):
+        """Whether this manager can be used by several threads at once.
+
+        In thread safe mode, a module is built by a single thread, the
+        others asking for it meanwhile waiting until its transforms ran,
+        and the module and inference caches are updated under a lock. A
+        thread only gets a module unfinished, as in a circular import, when
+        the building thread waits for a module which it builds. The bodies
+        of the functions and classes are not built lazily, whatever
+        :attr:`lazy_bodies` says. Set it before sharing the manager, the
+        shared one included, between threads.
+        """
+        return self._guards.build_locks is not None
+
+    @thread_safe.setter
+    def thread_safe(self, enabled):
+        self._guards = _ThreadGuards(enabled)
+        for cache in (self.astroid_cache,) + self._inference.caches():
+            cache.lock = self._guards.lock
+
+    def _built_meanwhile(self, modname, filepath=None):
+        """Get the module called *modname* if another thread built it while
+        this one was waiting for its build lock.
+        """
+        if not self.thread_safe:
+            return None
+        with self._guards.lock:
+            if modname not in self.astroid_cache:
+                return None
+            module = self.astroid_cache[modname]
+        if filepath is not None and module.file != filepath:
+            return None
+        return module
+
+    def profile_inference(self, enabled=True):
+        """Start or stop recording the statistics of the inferences, in a new
+        :class:`~astroid.profiling.InferenceProfiler` when starting.
+        """
+        self._inference.profiler = profiling.InferenceProfiler() if enabled else None
+
+    def inference_stats(self):
+        """Get the statistics recorded since the profiling was started.
+
+        :returns: The statistics of each node class and inference tip, as
+            given by :meth:`~astroid.profiling.InferenceProfiler.stats`.
+        :rtype: list(dict)
+        """
+        if self.inference_profiler is None:
+            return []
+        return self.inference_profiler.stats()
+
+    def profile_transforms(self, enabled=True):
+        """Start or stop recording the statistics of the transforms, see
+        :meth:`TransformVisitor.profile_transforms
+        <astroid.transforms.TransformVisitor.profile_transforms>`.
+        """
+        self._transform.profile_transforms(enabled)
+
+    def transform_stats(self):
+        """Get the statistics of the transforms recorded since the profiling
+        was started, see :meth:`TransformVisitor.transform_stats
+        <astroid.transforms.TransformVisitor.transform_stats>`.
+
+        :rtype: list(dict)
+        """
+        return self._transform.transform_stats()
+
+    def record_budget_exhaustion(self, node):
+        """Count an inference of *node* which ran out of budget."""
+        key = (node.root().name, node.fromlineno, node.__class__.__name__)
+        with self._guards.lock:
+            self.budget_exhaustions[key] += 1
+
+    def _copy_shared_setup(self):
+        shared = AstroidManager()
+        if shared.brain_plugins is not None:
+            shared.brain_plugins.attach(self)
+        else:
+            self._add_setup(
+                shared._transform._registrations, shared._failed_import_hooks
+            )
+
+    def _add_setup(self, registrations, hooks):
+        """Register the given transform registrations and failed import hooks,
+        made with another manager.
+        """
+        for node_class, key, transform, predicate in registrations:
+            self.register_transform(node_class, transform, predicate, key=key)
+        self._failed_import_hooks.extend(hooks)
+
+    @contextlib.contextmanager
+    def _running_brain(self):
+        """Make this manager, if isolated, the one of the nodes built by the
+        brain code running meanwhile on this thread.
+        """
+        if not self.isolated:
+            yield
+            return
+        previous = _ACTING.manager
+        _ACTING.manager = self
+        try:
+            yield
+        finally:
+            _ACTING.manager = previous
+
+    def _infer_with_brain(self, inference_tip, node, context, kwargs):
+        """Iterate over the results of *inference_tip*, running it as this
+        manager, the tip being called again for each result.
+        """
+        with self._running_brain():
+            results = iter(inference_tip(node, context, **kwargs))
+        while True:
+            with self._running_brain():
+                try:
+                    result = next(results)
+                except StopIteration:
+                    return
+            yield result
 
     @property
     def builtins_module(self):
@@ -75,7 +491,15 @@ class AstroidManager:
 
     def visit_transforms(self, node):
         """Visit the transforms and apply them to the given *node*."""
-        return self._transform.visit(node)
+        if self.brain_plugins is not None:
+            self.brain_plugins.load_for(node.name)
+        with self._running_brain():
+            return self._transform.visit(node)
+
+    def visit_body_transforms(self, node):
+        """Apply the transforms to the body of the given *node*."""
+        with self._running_brain():
+            self._transform.visit_body(node)
 
     def ast_from_file(self, filepath, modname=None, fallback=True, source=False):
         """given a module name, return the astroid object"""
@@ -85,26 +509,145 @@ class AstroidManager:
         except modutils.NoSourceFile:
             pass
         if modname is None:
-            try:
-                modname = ".".join(modutils.modpath_from_file(filepath))
-            except ImportError:
-                modname = filepath
-        if (
-            modname in self.astroid_cache
-            and self.astroid_cache[modname].file == filepath
-        ):
-            return self.astroid_cache[modname]
+            modname = _modname_from_file(filepath)
+        module = self.astroid_cache.get(modname)
+        if module is not None and module.file == filepath:
+            self._guards.wait_for_build(modname)
+            return module
         if source:
             # pylint: disable=import-outside-toplevel; circular import
             from astroid.builder import AstroidBuilder
 
-            return AstroidBuilder(self).file_build(filepath, modname)
+            with self._guards.build_lock(modname):
+                module = self._built_meanwhile(modname, filepath)
+                if module is not None:
+                    return module
+                return AstroidBuilder(self).file_build(filepath, modname)
         if fallback and modname:
             return self.ast_from_module_name(modname)
         raise exceptions.AstroidBuildingError(
             "Unable to build an AST for {path}.", path=filepath
         )
 
+    def build_many(self, filepaths, workers=None):
+        """Build the modules of many python source files at once.
+
+        The files are parsed and rebuilt by *workers* processes, configured
+        like this manager, then the post build steps and the transforms are
+        applied in this process, where the modules are added to the cache.
+        Modules already in the cache are not built again.
+
+        :param filepaths: The paths of the source files.
+        :type filepaths: iterable(str)
+        :param workers: The number of worker processes, the number of
+            processors by default. With 1, the files are built in this process.
+        :type workers: int or None
+        :returns: The module built for each path, or the
+            :class:`~astroid.exceptions.AstroidBuildingError` raised
+            while building it.
+        :rtype: dict(str, Module or AstroidBuildingError)
+        """
+        # pylint: disable=import-outside-toplevel; circular import
+        from astroid import builder
+
+        results = {}
+        to_build = []
+        for filepath in filepaths:
+            try:
+                source = modutils.get_source_file(filepath, include_no_ext=True)
+            except modutils.NoSourceFile:
+                results[filepath] = exceptions.AstroidBuildingError(
+                    "Unable to build an AST for {path}.", path=filepath
+                )
+                continue
+            modname = _modname_from_file(source)
+            module = self.astroid_cache.get(modname)
+            if module is not None and module.file == os.path.abspath(source):
+                self._guards.wait_for_build(modname)
+                results[filepath] = module
+            else:
+                to_build.append((filepath, source, modname))
+
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers <= 1 or len(to_build) <= 1:
+            for filepath, source, modname in to_build:
+                results[filepath] = self._finish_build(source, modname, None)
+            return results
+
+        chunksize = max(1, len(to_build) // (workers * 4))
+        with concurrent.futures.ProcessPoolExecutor(
+            workers,
+            initializer=builder._init_worker,
+            initargs=(self._worker_settings(),),
+        ) as executor:
+            built = executor.map(
+                builder._build_in_worker,
+                [source for _, source, _ in to_build],
+                [modname for _, _, modname in to_build],
+                chunksize=chunksize,
+            )
+            # Finish the modules while the workers build the next ones.
+            for (filepath, source, modname), result in zip(to_build, built):
+                results[filepath] = self._finish_build(source, modname, result)
+        return results
+
+    def _worker_settings(self):
+        """Get the settings of this manager which the build_many workers use.
+
+        The transforms are not part of them, being applied in this process.
+        """
+        return {
+            "disk_cache": self.disk_cache,
+            "search_path": self.search_path,
+            "optimize_ast": self.optimize_ast,
+            "always_load_extensions": self.always_load_extensions,
+            "extension_package_whitelist": self.extension_package_whitelist,
+        }
+
+    def _finish_build(self, filepath, modname, result):
+        """Cache the module of *filepath* built by a build_many worker, as
+        *result*, or build it in this process if the worker could not.
+
+        The error met while building it is returned instead, as an
+        :class:`~astroid.exceptions.AstroidBuildingError`.
+        """
+        # pylint: disable=import-outside-toplevel; circular import
+        from astroid import builder
+
+        with self._guards.build_lock(modname):
+            module = self.astroid_cache.get(modname)
+            if module is not None and module.file == os.path.abspath(filepath):
+                # Imported, hence built, by a module finished before or by
+                # another thread.
+                return module
+            try:
+                if result is None:
+                    return builder.AstroidBuilder(self).file_build(filepath, modname)
+                if result[0] is None:
+                    # The worker failed on an unexpected error.
+                    return exceptions.AstroidBuildingError(
+                        "Unable to build an AST for {path}:\n{error}",
+                        modname=modname,
+                        path=filepath,
+                        error=result[1],
+                    )
+                payload, encoding = result
+                return builder.AstroidBuilder(self)._post_build(
+                    builder.load(payload), encoding
+                )
+            except exceptions.AstroidBuildingError as exc:
+                return exc
+            except Exception as exc:  # pylint: disable=broad-except
+                error = exceptions.AstroidBuildingError(
+                    "Unable to build an AST for {path}:\n{error}",
+                    modname=modname,
+                    path=filepath,
+                    error=exc,
+                )
+                error.__cause__ = exc
+                return error
+
     def ast_from_string(self, data, modname="", filepath=None):
         """ Given some source code as a string, return its corresponding astroid object"""
         # pylint: disable=import-outside-toplevel; circular import
@@ -137,14 +680,23 @@ class AstroidManager:
 
     def ast_from_module_name(self, modname, context_file=None):
         """given a module name, return the astroid object"""
-        if modname in self.astroid_cache:
-            return self.astroid_cache[modname]
+        module = self.astroid_cache.get(modname)
+        if module is not None:
+            self._guards.wait_for_build(modname)
+            return module
+        with self._guards.build_lock(modname):
+            module = self._built_meanwhile(modname)
+            if module is not None:
+                return module
+            return self._ast_from_module_name(modname, context_file)
+
+    def _ast_from_module_name(self, modname, context_file):
         if modname == "__main__":
             return self._build_stub_module(modname)
-        if context_file:
-            old_cwd = os.getcwd()
-            os.chdir(os.path.dirname(context_file))
         try:
+            # The directory of the context file is searched first, as an
+            # explicit path: the working directory of the process is shared
+            # by its threads.
             found_spec = self.file_from_module_name(modname, context_file)
             if found_spec.type == spec.ModuleType.PY_ZIPMODULE:
                 module = self.zip_import_data(found_spec.location)
@@ -191,15 +743,16 @@ class AstroidManager:
 
             return self.ast_from_file(found_spec.location, modname, fallback=False)
         except exceptions.AstroidBuildingError as e:
+            if self.brain_plugins is not None:
+                # The plugins may register hooks for this module.
+                self.brain_plugins.load_for(modname)
             for hook in self._failed_import_hooks:
                 try:
-                    return hook(modname)
+                    with self._running_brain():
+                        return hook(modname)
                 except exceptions.AstroidBuildingError:
                     pass
             raise e
-        finally:
-            if context_file:
-                os.chdir(old_cwd)
 
     def zip_import_data(self, filepath):
         if zipimport is None:
@@ -227,14 +780,43 @@ class AstroidManager:
                 continue
         return None
 
+    def _check_search_path(self):
+        """Forget the module files found with another search path, returning
+        the current one.
+        """
+        path = self.search_path or sys.path
+        if path != self._mod_file_cache.path:
+            self._mod_file_cache.clear()
+            self._mod_file_cache.path = list(path)
+        return path
+
     def file_from_module_name(self, modname, contextfile):
+        self._check_search_path()
+        if contextfile is not None:
+            # Looked for next to the context file first, in a directory shared
+            # with the siblings of the file.
+            value = self._find_module_file(modname, os.path.dirname(contextfile))
+            if not isinstance(value, exceptions.AstroidBuildingError):
+                return value
+        value = self._find_module_file(modname, None)
+        if isinstance(value, exceptions.AstroidBuildingError):
+            # we remove the traceback here to save on memory usage (since these exceptions are cached)
+            raise value.with_traceback(None)
+        return value
+
+    def _find_module_file(self, modname, directory):
+        """Find the spec of the module called *modname* in *directory*, or in
+        the search path if None, caching it or the import error.
+        """
+        key = (modname, directory)
         try:
-            value = self._mod_file_cache[(modname, contextfile)]
+            return self._mod_file_cache[key]
         except KeyError:
+            pass
+        path = self.search_path if directory is None else [directory]
+        with spec.record_listings() as listings:
             try:
-                value = modutils.file_info_from_modpath(
-                    modname.split("."), context_file=contextfile
-                )
+                value = modutils.file_info_from_modpath(modname.split("."), path=path)
             except ImportError as ex:
                 value = exceptions.AstroidImportError(
                     "Failed to import module {modname} with error:\n{error}.",
@@ -242,17 +824,113 @@ class AstroidManager:
                     # we remove the traceback here to save on memory usage (since these exceptions are cached)
                     error=ex.with_traceback(None),
                 )
-            self._mod_file_cache[(modname, contextfile)] = value
-        if isinstance(value, exceptions.AstroidBuildingError):
-            # we remove the traceback here to save on memory usage (since these exceptions are cached)
-            raise value.with_traceback(None)
+        self._mod_file_cache[key] = value
+        if self._mod_file_cache.listings is not None:
+            self._mod_file_cache.listings[key] = listings
         return value
 
+    def load_module_files(self, filename):
+        """Load the module files saved by :meth:`save_module_files`.
+
+        The modules are found in the same files as long as the search path,
+        the versions of Python and astroid and the directories listed to
+        find them did not change. The others are ignored. The directories
+        listed by the manager are recorded from then on, for the next save:
+        load a file which does not exist yet on the first run.
+
+        :returns: The number of modules loaded.
+        :rtype: int
+        """
+        if self._mod_file_cache.listings is None:
+            self._mod_file_cache.listings = {}
+        try:
+            with open(filename, "rb") as stream:
+                saved = marshal.load(stream)
+        except (OSError, EOFError, ValueError, TypeError):
+            return 0
+        header = _module_files_header(self._check_search_path())
+        if not isinstance(saved, dict) or saved.get("header") != header:
+            return 0
+        loaded = 0
+        mtimes = {}
+        for modname, directory, value, listings in saved["entries"]:
+            if any(
+                _modification_time(listed, mtimes) != mtime
+                for listed, mtime in listings.items()
+            ):
+                continue
+            if isinstance(value, str):
+                value = exceptions.AstroidImportError(
+                    "Failed to import module {modname} with error:\n{error}.",
+                    modname=modname,
+                    error=value,
+                )
+            else:
+                name, module_type, location, origin, locations = value
+                value = spec.ModuleSpec(
+                    name,
+                    spec.ModuleType[module_type],
+                    location,
+                    origin,
+                    locations,
+                )
+            self._mod_file_cache[modname, directory] = value
+            self._mod_file_cache.listings[modname, directory] = listings
+            loaded += 1
+        return loaded
+
+    def save_module_files(self, filename):
+        """Save the files in which the modules were found, for the later runs
+        calling :meth:`load_module_files` first.
+
+        Only the modules found since then are saved, except those
+        of namespace packages and zip files, and those found in directories
+        modified too recently to tell whether they change meanwhile.
+        """
+        if self._mod_file_cache.listings is None:
+            return
+        racy = (time.time() - spec._RACY_DELAY) * 1e9
+        entries = []
+        for key, value in list(self._mod_file_cache.items()):
+            listings = self._mod_file_cache.listings.get(key)
+            if listings is None or any(
+                mtime is not None and mtime > racy for mtime in listings.values()
+            ):
+                continue
+            if isinstance(value, exceptions.AstroidBuildingError):
+                value = str(value.error)
+            elif value.type in _UNSAVED_MODULE_TYPES:
+                continue
+            else:
+                value = (
+                    value.name,
+                    value.type.name,
+                    value.location,
+                    value.origin,
+                    value.submodule_search_locations,
+                )
+            entries.append(key + (value, listings))
+        saved = {
+            "header": _module_files_header(self._check_search_path()),
+            "entries": entries,
+        }
+        directory = os.path.dirname(os.path.abspath(filename))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as stream:
+                marshal.dump(saved, stream)
+            os.replace(tmp_path, filename)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
     def ast_from_module(self, module, modname=None):
         """given an imported module, return the astroid object"""
         modname = modname or module.__name__
-        if modname in self.astroid_cache:
-            return self.astroid_cache[modname]
+        cached = self.astroid_cache.get(modname)
+        if cached is not None:
+            self._guards.wait_for_build(modname)
+            return cached
         try:
             # some builtin modules don't have __file__ attribute
             filepath = module.__file__
@@ -336,8 +1014,109 @@ class AstroidManager:
         self._failed_import_hooks.append(hook)
 
     def cache_module(self, module):
-        """Cache a module if no module with the same name is known yet."""
-        self.astroid_cache.setdefault(module.name, module)
+        """Cache a module if no module with the same name is known yet,
+        and record this manager as the one which built it.
+        """
+        module._manager = self
+        if module.name not in self.astroid_cache:
+            self.astroid_cache[module.name] = module
+
+    def record_import(self, importer, imported):
+        """Record that the *importer* module imported the *imported* one.
+
+        This is used to find the modules to refresh when a module is invalidated.
+        """
+        if importer.name != imported.name:
+            with self._guards.lock:
+                self._import_graph.add(importer.name, imported.name)
+
+    def invalidate_module(self, modname):
+        """Forget the module called *modname*, usually because its source changed.
+
+        The module is rebuilt the next time it is imported. The modules which
+        imported it, directly or not, are kept, but every inference result
+        computed for their nodes is dropped. Modules which wildcard imported
+        an invalidated module are invalidated as well, since their locals
+        depend on its content.
+        """
+        with self._guards.lock:
+            self._invalidate_module(modname)
+
+    def _invalidate_module(self, modname):
+        invalidated = {modname}
+        dependents = self._import_graph.importers_of(modname)
+        changed = True
+        while changed:
+            changed = False
+            for name in sorted(dependents):
+                module = self.astroid_cache.get(name)
+                if module is None or _wildcard_imports(module) & invalidated:
+                    dependents.discard(name)
+                    invalidated.add(name)
+                    changed = True
+
+        for name in invalidated:
+            module = self.astroid_cache.pop(name, None)
+            self._import_graph.forget_importer(name)
+            for key in [key for key in self._mod_file_cache if key[0] == name]:
+                del self._mod_file_cache[key]
+            if module is not None:
+                self._forget_module(module)
+        self._forget_results_of_importers(dependents)
+
+    def _forget_results_of_importers(self, names):
+        """Drop the values inferred for the nodes of the modules called
+        *names*, which imported a module that is to be rebuilt.
+        """
+        for name in names:
+            module = self.astroid_cache.peek(name)
+            if module is not None:
+                self._drop_inference_caches(module)
+                _clear_cached_values(module)
+
+    def _forget_inferences_of(self, module):
+        """Drop the values inferred for the nodes of *module* and of the
+        modules which imported it, another module assigning an attribute
+        of one of its objects.
+        """
+        with self._guards.lock:
+            self._drop_inference_caches(module)
+            for name in self._import_graph.importers_of(module.name):
+                importer = self.astroid_cache.peek(name)
+                if importer is not None:
+                    self._drop_inference_caches(importer)
+
+    def _drop_inference_caches(self, module):
+        """Drop the inference results cached for the nodes of *module*.
+
+        The results cached for the nodes of the other modules may hold nodes
+        of *module* only if they imported it, their caches being dropped too.
+        """
+        for cache in self._inference.caches():
+            cache.drop_module(module)
+
+    def _forget_module(self, module):
+        """Drop the caches holding nodes of *module* and undo the attributes
+        it assigned in the other modules, since it is to be rebuilt.
+        """
+        self._drop_inference_caches(module)
+        for namespace, node in module._foreign_attrs:
+            values = namespace.get(node.attrname)
+            if values is None or node not in values:
+                continue
+            values.remove(node)
+            if not values:
+                del namespace[node.attrname]
+
+    def _drop_module_caches(self, module):
+        """Forget a module evicted from the cache.
+
+        The files of the modules imported by it are kept, being shared with
+        the other modules of its directory. The modules which imported it
+        are kept as well, but lose the values inferred from its nodes.
+        """
+        self._forget_module(module)
+        self._forget_results_of_importers(self._import_graph.importers_of(module.name))
 
     def bootstrap(self):
         """Bootstrap the required AST modules needed for the manager to work
@@ -345,11 +1124,91 @@ class AstroidManager:
         The bootstrap usually involves building the AST for the builtins
         module, which is required by the rest of astroid to work correctly.
         """
+        if self.isolated:
+            self.astroid_cache["builtins"] = AstroidManager().builtins_module
+            return
         from astroid import raw_building  # pylint: disable=import-outside-toplevel
 
         raw_building._astroid_bootstrapping()
 
     def clear_cache(self):
-        """Clear the underlying cache. Also bootstraps the builtins module."""
+        """Clear the underlying caches. Also bootstraps the builtins module."""
         self.astroid_cache.clear()
+        self._import_graph.clear()
+        for cache in self._inference.caches():
+            cache.clear()
+        spec.invalidate_caches()
         self.bootstrap()
+
+
+def _modname_from_file(filepath):
+    try:
+        return ".".join(modutils.modpath_from_file(filepath))
+    except ImportError:
+        return filepath
+
+
+def _module_files_header(path):
+    """Get what the files of the modules saved with *path* depend on, the
+    relative directories being relative to the working directory.
+    """
+    return (
+        MODULE_FILES_FORMAT_VERSION,
+        astroid_version,
+        sys.version,
+        os.getcwd(),
+        list(path),
+    )
+
+
+def _modification_time(directory, mtimes):
+    try:
+        return mtimes[directory]
+    except KeyError:
+        pass
+    try:
+        mtime = os.stat(directory).st_mtime_ns
+    except OSError:
+        mtime = None
+    mtimes[directory] = mtime
+    return mtime
+
+
+def _wildcard_imports(module):
+    """Get the absolute names of the modules wildcard imported by *module*."""
+    return {
+        module.relative_to_absolute_name(node.modname, node.level)
+        for node in getattr(module, "_import_from_nodes", ())
+        if node.names[0][0] == "*"
+    }
+
+
+def _clear_cached_values(module):
+    """Clear the values cached on the function and class definitions of *module*.
+
+    Those values, such as the type of a method or the slots of a class,
+    may have been computed by inferring nodes of other modules.
+    """
+    seen = set()
+    to_visit = [module]
+    while to_visit:
+        scope = to_visit.pop()
+        # Left aside by the classes whose methods are not built yet.
+        namespace = getattr(scope, "_pending_locals", None)
+        if namespace is None:
+            namespace = scope.locals
+        for values in namespace.values():
+            for node in values:
+                lazy = getattr(node, "_lazy_body", None) is not None
+                pending = lazy or getattr(node, "_lazy_methods", False)
+                if node in seen or not (pending or hasattr(node, "locals")):
+                    continue
+                seen.add(node)
+                if node.root() is not module:
+                    continue
+                node._cache = None
+                for name in decorators._cachedproperty_names(type(node)):
+                    node.__dict__.pop(name, None)
+                if not lazy:
+                    # Nothing was cached yet for the nodes of a pending body.
+                    to_visit.append(node)
@@ -0,0 +1,374 @@
+# Licensed under the LGPL: https://www.gnu.org/licenses/old-licenses/lgpl-2.1.en.html
+# For details: https://github.com/PyCQA/astroid/blob/master/LICENSE
+
+"""The caches of built modules and of inference results used by the AstroidManager.
+
+By default every module built by the manager is kept for the lifetime of
+the process. Long running processes can bound the cache by giving it one
+of the eviction policies defined here::
+
+    from astroid import MANAGER
+    from astroid.modulecache import LRUPolicy
+
+    MANAGER.astroid_cache.policy = LRUPolicy(maxsize=500)
+
+Pinned modules, ``builtins`` by default, are never evicted.
+
+Both caches guard their updates with their :attr:`lock`, which does nothing
+unless the manager is thread safe, see ``AstroidManager.thread_safe``.
+"""
+
+import collections
+import collections.abc
+import contextlib
+import itertools
+import time
+
+# The lock of the caches which are not shared between threads.
+NO_LOCK = contextlib.nullcontext()
+
+
+class CachePolicy:
+    """Base class for eviction policies.
+
+    A policy is asked which modules should be evicted every time a module
+    is added to the cache.
+    """
+
+    def weight(self, module):  # pylint: disable=unused-argument
+        """Get the weight of the given *module*, as accounted by this policy."""
+        return 1
+
+    def to_evict(self, cache, candidates):
+        """Get the names of the modules which must be evicted.
+
+        :param cache: The cache to shrink.
+        :type cache: ModuleCache
+        :param candidates: The names of the modules which can be evicted,
+            least recently used first, found as they are read: a policy
+            should stop reading them once it has selected its modules.
+        :type candidates: iterator(str)
+        :rtype: iterable(str)
+        """
+        raise NotImplementedError
+
+
+class UnboundedPolicy(CachePolicy):
+    """Never evict anything. This is the default policy."""
+
+    def to_evict(self, cache, candidates):
+        return ()
+
+
+class LRUPolicy(CachePolicy):
+    """Keep at most *maxsize* unpinned modules, evicting the least recently used."""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+
+    def to_evict(self, cache, candidates):
+        excess = cache.unpinned_size() - self.maxsize
+        return itertools.islice(candidates, max(excess, 0))
+
+
+class SizePolicy(CachePolicy):
+    """Keep at most *max_nodes* nodes in the unpinned modules.
+
+    The size of a module is approximated by the number of nodes of its tree,
+    computed once when the module is added to the cache. The bodies which
+    are not built yet, see ``AstroidManager.lazy_bodies``, are not counted.
+    """
+
+    def __init__(self, max_nodes):
+        self.max_nodes = max_nodes
+
+    def weight(self, module):
+        count = 0
+        stack = [module]
+        while stack:
+            node = stack.pop()
+            count += 1
+            if node._lazy_body is None:
+                stack.extend(node.get_children())
+        return count
+
+    def to_evict(self, cache, candidates):
+        total = cache.unpinned_weight()
+        for name in candidates:
+            if total <= self.max_nodes:
+                break
+            total -= cache.weight(name)
+            yield name
+
+
+class IdlePolicy(CachePolicy):
+    """Evict the modules which were not accessed for *max_idle* seconds.
+
+    Like every policy, it is only applied when a module is added to the
+    cache: idle modules stay cached while no module is built, unless
+    :meth:`ModuleCache.enforce` is called.
+    """
+
+    def __init__(self, max_idle):
+        self.max_idle = max_idle
+
+    def to_evict(self, cache, candidates):
+        deadline = time.monotonic() - self.max_idle
+        for name in candidates:
+            if cache.last_access(name) > deadline:
+                break
+            yield name
+
+
+class ModuleCache(collections.abc.MutableMapping):
+    """A mapping of module names to their :class:`~astroid.scoped_nodes.Module`.
+
+    Lookups through ``cache[name]`` and ``cache.get(name)`` are accounted as
+    hits or misses and mark the module as recently used, while ``name in cache``
+    is a plain membership test.
+
+    Updates and evictions are done under :attr:`lock`, which must be
+    reentrant if it is not :data:`NO_LOCK`.
+
+    Callables in :attr:`eviction_callbacks` are called with every module
+    evicted by the policy, so that caches depending on it can be dropped.
+    """
+
+    def __init__(self, policy=None, pinned=("builtins",)):
+        self._modules = collections.OrderedDict()
+        self._accessed = {}
+        self._weights = {}
+        # sum of the values of _weights
+        self._total_weight = 0
+        self._policy = policy or UnboundedPolicy()
+        self.pinned = set(pinned)
+        self.eviction_callbacks = []
+        self.lock = NO_LOCK
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def policy(self):
+        return self._policy
+
+    @policy.setter
+    def policy(self, policy):
+        with self.lock:
+            self._policy = policy or UnboundedPolicy()
+            self._weights = {
+                name: self._policy.weight(module)
+                for name, module in self._modules.items()
+            }
+            self._total_weight = sum(self._weights.values())
+            self.enforce()
+
+    def pin(self, name):
+        """Never evict the module called *name*."""
+        self.pinned.add(name)
+
+    def unpin(self, name):
+        self.pinned.discard(name)
+
+    def weight(self, name):
+        return self._weights.get(name, 1)
+
+    def unpinned_size(self):
+        """Get the number of modules which can be evicted."""
+        return len(self._modules) - sum(name in self._modules for name in self.pinned)
+
+    def unpinned_weight(self):
+        """Get the total weight of the modules which can be evicted."""
+        return self._total_weight - sum(
+            self._weights.get(name, 0) for name in self.pinned
+        )
+
+    def last_access(self, name):
+        return self._accessed[name]
+
+    def __getitem__(self, name):
+        with self.lock:
+            try:
+                module = self._modules[name]
+            except KeyError:
+                self.misses += 1
+                raise
+            self.hits += 1
+            self._modules.move_to_end(name)
+            self._accessed[name] = time.monotonic()
+            return module
+
+    def __setitem__(self, name, module):
+        with self.lock:
+            self._modules[name] = module
+            self._modules.move_to_end(name)
+            self._accessed[name] = time.monotonic()
+            weight = self._policy.weight(module)
+            self._total_weight += weight - self._weights.get(name, 0)
+            self._weights[name] = weight
+            self.enforce()
+
+    def __delitem__(self, name):
+        with self.lock:
+            del self._modules[name]
+            del self._accessed[name]
+            self._total_weight -= self._weights.pop(name, 0)
+
+    def peek(self, name, default=None):
+        """Get the module called *name*, or *default* if it is not cached,
+        without counting it as an access.
+        """
+        return self._modules.get(name, default)
+
+    def __contains__(self, name):
+        return name in self._modules
+
+    def __iter__(self):
+        return iter(self._modules)
+
+    def __len__(self):
+        return len(self._modules)
+
+    def clear(self):
+        """Remove every module, pinned ones included, without eviction callbacks."""
+        with self.lock:
+            self._modules.clear()
+            self._accessed.clear()
+            self._weights.clear()
+            self._total_weight = 0
+
+    def enforce(self):
+        """Evict the modules selected by the policy."""
+        if isinstance(self._policy, UnboundedPolicy):
+            return
+        with self.lock:
+            candidates = (name for name in self._modules if name not in self.pinned)
+            # The most recently used module is never evicted, since it is
+            # usually the one being built.
+            newest = next(reversed(self._modules), None)
+            evicted = [
+                name
+                for name in self._policy.to_evict(self, candidates)
+                if name != newest
+            ]
+            for name in evicted:
+                module = self._modules[name]
+                del self[name]
+                self.evictions += 1
+                for callback in self.eviction_callbacks:
+                    callback(module)
+
+    def stats(self):
+        """Get the cache statistics.
+
+        :rtype: dict
+        """
+        return {
+            "size": len(self._modules),
+            "weight": self._total_weight,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+class InferenceCache:
+    """Cached inference results, keyed by a tag, such as a function, and a node.
+
+    The results are indexed by the module holding the node, so that they can
+    be dropped along with the module. The cache is unbounded by default;
+    giving it a *maxsize* makes it evict the least recently used results.
+
+    Lookups do not take the :attr:`lock`, only the updates do.
+    """
+
+    def __init__(self, maxsize=None):
+        self._results = collections.OrderedDict()
+        self._keys_by_module = collections.defaultdict(set)
+        self._maxsize = maxsize
+        self.lock = NO_LOCK
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def maxsize(self):
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize):
+        self._maxsize = maxsize
+        self._enforce()
+
+    def get(self, func, node):
+        """Get the results of *func* for *node*, or None if they are not cached."""
+        key = (func, node)
+        try:
+            results = self._results[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        if self._maxsize is not None:
+            try:
+                self._results.move_to_end(key)
+            except KeyError:
+                # Evicted by another thread in the meantime.
+                pass
+        return results
+
+    def store(self, func, node, results):
+        """Cache the *results* of *func* for *node*, unless some are already
+        cached, and return the cached results.
+        """
+        key = (func, node)
+        root = node.root()
+        with self.lock:
+            results = self._results.setdefault(key, results)
+            self._keys_by_module[root].add(key)
+            self._enforce()
+        return results
+
+    def _enforce(self):
+        if self._maxsize is None:
+            return
+        with self.lock:
+            while len(self._results) > self._maxsize:
+                key, _ = self._results.popitem(last=False)
+                self._unindex(key)
+                self.evictions += 1
+
+    def _unindex(self, key):
+        root = key[1].root()
+        keys = self._keys_by_module.get(root)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_module[root]
+
+    def drop_module(self, module):
+        """Drop the results cached for the nodes of *module*."""
+        with self.lock:
+            for key in self._keys_by_module.pop(module, ()):
+                self._results.pop(key, None)
+
+    def clear(self):
+        with self.lock:
+            self._results.clear()
+            self._keys_by_module.clear()
+
+    def __len__(self):
+        return len(self._results)
+
+    def stats(self):
+        """Get the cache statistics.
+
+        :rtype: dict
+        """
+        return {
+            "size": len(self._results),
+            "modules": len(self._keys_by_module),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
@@ -33,6 +33,9 @@
 :type BUILTIN_MODULES: dict
 :var BUILTIN_MODULES: dictionary with builtin module names has key
 """
+import concurrent.futures
+import fnmatch
+import importlib.machinery
 import importlib.util
 import os
 import platform
@@ -162,18 +165,6 @@ def _path_from_filename(filename, is_jython=IS_JYTHON):
     return filename
 
 
-def _handle_blacklist(blacklist, dirnames, filenames):
-    """remove files/directories in the black list
-
-    dirnames/filenames are usually from os.walk
-    """
-    for norecurs in blacklist:
-        if norecurs in dirnames:
-            dirnames.remove(norecurs)
-        elif norecurs in filenames:
-            filenames.remove(norecurs)
-
-
 _NORM_PATH_CACHE = {}
 
 
@@ -442,6 +433,161 @@ def get_module_part(dotted_name, context_file=None):
     return dotted_name
 
 
+class _ModuleFilesScanner:
+    """Scanner of the directories of a package, for :func:`iter_module_files`."""
+
+    def __init__(
+        self, src_directory, blacklist, list_all, *, patterns, ignore_patterns
+    ):
+        self.src_directory = src_directory
+        self.blacklist = blacklist
+        self.list_all = list_all
+        self.patterns = patterns
+        self.ignore_patterns = ignore_patterns
+
+    def _ignored(self, entry):
+        if entry.name in self.blacklist:
+            return True
+        if not self.ignore_patterns:
+            return False
+        relative = os.path.relpath(entry.path, self.src_directory)
+        relative = relative.replace(os.sep, "/")
+        return any(
+            fnmatch.fnmatch(entry.name, pattern) or fnmatch.fnmatch(relative, pattern)
+            for pattern in self.ignore_patterns
+        )
+
+    def _wanted(self, filename):
+        if not _is_python_file(filename):
+            return False
+        return self.patterns is None or any(
+            fnmatch.fnmatch(filename, pattern) for pattern in self.patterns
+        )
+
+    def scan(self, directory, package):
+        """Scan *directory*, the package called *package* if not empty.
+
+        :returns: The module name and path of its python files, and the path
+            and package name of its subdirectories to scan.
+        :rtype: tuple(list(tuple(str, str)), list(tuple(str, str)))
+        """
+        try:
+            with os.scandir(directory) as entries:
+                entries = [entry for entry in entries if not self._ignored(entry)]
+        except OSError:
+            return [], []
+        files = []
+        subdirectories = []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if not is_dir:
+                files.append(entry)
+            elif not entry.is_symlink():
+                # Like os.walk, which does not follow the symbolic links.
+                subdirectories.append(entry)
+        name_prefix = package + "." if package else ""
+        if directory in self.blacklist:
+            # Its subdirectories are still scanned, as they always were.
+            return [], [
+                (entry.path, name_prefix + entry.name) for entry in subdirectories
+            ]
+        has_init = any(entry.name == "__init__.py" for entry in files)
+        if not (self.list_all or has_init):
+            return [], []
+        modules = []
+        for entry in files:
+            if self._wanted(entry.name):
+                name = entry.name.partition(".")[0]
+                modname = package if name == "__init__" else name_prefix + name
+                modules.append((modname, entry.path))
+        return modules, [
+            (entry.path, name_prefix + entry.name) for entry in subdirectories
+        ]
+
+
+def iter_module_files(
+    src_directory,
+    blacklist=(),
+    list_all=False,
+    *,
+    patterns=None,
+    ignore_patterns=(),
+    workers=1,
+):
+    """given a package directory yield all available python module's files
+    in the package and its subpackages, as soon as they are found
+
+    :type src_directory: str
+    :param src_directory:
+      path of the directory corresponding to the package
+
+    :type blacklist: list or tuple
+    :param blacklist: iterable
+      list of files or directories to ignore.
+
+    :type list_all: bool
+    :param list_all:
+        get files from all paths, including ones without __init__.py
+
+    :type patterns: list(str) or None
+    :param patterns:
+      glob patterns which the names of the files must match, if given
+
+    :type ignore_patterns: list(str)
+    :param ignore_patterns:
+      glob patterns of the names, or of the paths relative to
+      `src_directory`, of the files and directories to ignore
+
+    :type workers: int
+    :param workers:
+      number of threads scanning the directories concurrently, the files
+      being yielded in no particular order with more than one
+
+    :rtype: iterable(tuple(str, str))
+    :return:
+      the name of the module of each file, relative to the directory
+      holding `src_directory` if it is a package, else to `src_directory`,
+      and its path
+    """
+    scanner = _ModuleFilesScanner(
+        src_directory,
+        blacklist,
+        list_all,
+        patterns=patterns,
+        ignore_patterns=ignore_patterns,
+    )
+    if os.path.isfile(os.path.join(src_directory, "__init__.py")):
+        package = os.path.basename(os.path.abspath(src_directory))
+    else:
+        package = ""
+    if workers <= 1:
+        to_scan = [(src_directory, package)]
+        while to_scan:
+            modules, subdirectories = scanner.scan(*to_scan.pop())
+            yield from modules
+            to_scan.extend(reversed(subdirectories))
+        return
+    with concurrent.futures.ThreadPoolExecutor(workers) as executor:
+        pending = {executor.submit(scanner.scan, src_directory, package)}
+        try:
+            while pending:
+                done, pending = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    modules, subdirectories = future.result()
+                    for subdirectory in subdirectories:
+                        pending.add(executor.submit(scanner.scan, *subdirectory))
+                    yield from modules
+        finally:
+            # The iteration was stopped early.
+            for future in pending:
+                future.cancel()
+
+
 def get_module_files(src_directory, blacklist, list_all=False):
     """given a package directory return a list of all available python
     module's files in the package and its subpackages
@@ -462,21 +608,10 @@ def get_module_files(src_directory, blacklist, list_all=False):
     :return:
       the list of all available python module's files in the package and
       its subpackages
+
+    .. seealso:: :func:`iter_module_files`
     """
-    files = []
-    for directory, dirnames, filenames in os.walk(src_directory):
-        if directory in blacklist:
-            continue
-        _handle_blacklist(blacklist, dirnames, filenames)
-        # check for __init__.py
-        if not list_all and "__init__.py" not in filenames:
-            dirnames[:] = ()
-            continue
-        for filename in filenames:
-            if _is_python_file(filename):
-                src = os.path.join(directory, filename)
-                files.append(src)
-    return files
+    return [path for _, path in iter_module_files(src_directory, blacklist, list_all)]
 
 
 def get_source_file(filename, include_no_ext=False):
@@ -512,6 +647,87 @@ def is_python_source(filename):
     return os.path.splitext(filename)[1][1:] in PY_SOURCE_EXTS
 
 
+# names of the top level modules of the standard library, see _std_module_names
+_STD_MODULE_NAMES = None
+
+
+def _top_level_module_names(directory):
+    """Get the names of the modules and packages found in *directory*."""
+    suffixes = sorted(importlib.machinery.all_suffixes(), key=len, reverse=True)
+    try:
+        with os.scandir(directory) as entries:
+            entries = list(entries)
+    except OSError:
+        return
+    for entry in entries:
+        if entry.is_dir():
+            if _has_init(entry.path) and entry.name.isidentifier():
+                yield entry.name
+            continue
+        for suffix in suffixes:
+            if entry.name.endswith(suffix):
+                name = entry.name[: -len(suffix)]
+                if name.isidentifier():
+                    yield name
+                break
+
+
+def _std_module_names():
+    """Get the names of the builtin modules and of the top level modules
+    found in the standard library directories, computed once.
+    """
+    global _STD_MODULE_NAMES  # pylint: disable=global-statement
+    if _STD_MODULE_NAMES is None:
+        names = set(sys.builtin_module_names)
+        for directory in STD_LIB_DIRS:
+            for std_dir in (directory, os.path.join(directory, "lib-dynload")):
+                names.update(_top_level_module_names(std_dir))
+        _STD_MODULE_NAMES = frozenset(names)
+    return _STD_MODULE_NAMES
+
+
+# sys.path, and its entries searched before the standard library directories
+_ENTRIES_BEFORE_STD_LIB = ((), ())
+
+
+def _entries_before_std_lib():
+    """Get the entries of sys.path searched before the standard library
+    directories, along with whether they are archives, computed again when
+    sys.path changes.
+    """
+    global _ENTRIES_BEFORE_STD_LIB  # pylint: disable=global-statement
+    path = tuple(sys.path)
+    if _ENTRIES_BEFORE_STD_LIB[0] != path:
+        std_dirs = {
+            _cache_normalize_path(std_dir)
+            for directory in STD_LIB_DIRS
+            for std_dir in (directory, os.path.join(directory, "lib-dynload"))
+        }
+        entries = []
+        for entry in path:
+            if _cache_normalize_path(entry) in std_dirs:
+                break
+            entries.append((entry, os.path.isfile(entry)))
+        _ENTRIES_BEFORE_STD_LIB = (path, tuple(entries))
+    return _ENTRIES_BEFORE_STD_LIB[1]
+
+
+def _may_shadow_std_module(modname):
+    """Tell whether a module or package called *modname* may be found in
+    one of the entries of sys.path searched before the standard library.
+    """
+    suffixes = importlib.machinery.all_suffixes()
+    for entry, archive in _entries_before_std_lib():
+        if archive:
+            return True
+        listing = spec._listing(_cache_normalize_path(entry))
+        if modname in listing.directories or any(
+            modname + suffix in listing.files for suffix in suffixes
+        ):
+            return True
+    return False
+
+
 def is_standard_module(modname, std_path=None):
     """try to guess if a module is a standard python module (by default,
     see `std_path` parameter's description)
@@ -528,8 +744,19 @@ def is_standard_module(modname, std_path=None):
       true if the module:
       - is located on the path listed in one of the directory in `std_path`
       - is a built-in module
+
+      The modules of the default standard library directories are known
+      by their name without being looked for, unless an entry of sys.path
+      searched before these directories may hold a module of the same name,
+      in which case the location of the module found decides.
     """
     modname = modname.split(".")[0]
+    if (
+        std_path is None
+        and modname in _std_module_names()
+        and (modname in sys.builtin_module_names or not _may_shadow_std_module(modname))
+    ):
+        return True
     try:
         filename = file_from_modpath([modname])
     except ImportError:
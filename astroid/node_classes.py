@@ -36,10 +36,12 @@
 
 import abc
 import builtins as builtins_mod
+import contextlib
 import itertools
 import pprint
 import sys
-from functools import lru_cache, singledispatch as _singledispatch
+import threading
+from functools import singledispatch as _singledispatch
 
 from astroid import as_string
 from astroid import bases
@@ -60,6 +62,44 @@ def _is_const(value):
     return isinstance(value, tuple(CONST_CLS))
 
 
+class _RunningInferences(threading.local):
+    # The number of inferences running in this thread.
+    depth = 0
+
+
+_RUNNING = _RunningInferences()
+
+
+@contextlib.contextmanager
+def _not_memoized():
+    """Do not memoize the inferences run in this block, as if they were
+    nested in another inference.
+    """
+    _RUNNING.depth += 1
+    try:
+        yield
+    finally:
+        _RUNNING.depth -= 1
+
+
+def _is_context_free(context):
+    """Check that inferring with *context* does not depend on the caller.
+
+    Such inferences, started without a call context, a bound node or
+    already visited nodes, give the same results whoever asks for them.
+    """
+    return context is None or (
+        not context.path
+        and context.callcontext is None
+        and context.boundnode is None
+        and not context.extra_context
+    )
+
+
+def _lookupname(context):
+    return context.lookupname if context is not None else None
+
+
 @decorators.raise_if_nothing_inferred
 def unpack_infer(stmt, context=None):
     """recursively generate nodes inferred by the given statement.
@@ -260,6 +300,9 @@ OP_PRECEDENCE = {
 }
 
 
+_MISSING = object()
+
+
 class NodeNG:
     """A node of the new Abstract Syntax Tree (AST).
 
@@ -321,6 +364,14 @@ class NodeNG:
     """
     # instance specific inference function infer(node, context)
     _explicit_inference = None
+    # values computed by the decorators.cached decorator
+    _cache = None
+    # the pending body of functions and classes built lazily, see
+    # rebuilder.LazyBody
+    _lazy_body = None
+    # the manager which built the module, set on modules and recorded on
+    # their nodes by the manager property
+    _manager = None
 
     def __init__(self, lineno=None, col_offset=None, parent=None):
         """
@@ -353,41 +404,127 @@ class NodeNG:
         """
         if context is not None:
             context = context.extra_context.get(self, context)
-        if self._explicit_inference is not None:
+        mgr = self.manager
+        memoizable = not kwargs and mgr.memoize_inference and _is_context_free(context)
+        if memoizable:
+            results = mgr.inference_memo.get(_lookupname(context), self)
+            if results is not None:
+                return iter(results)
+        infer_in_context = self._infer_in_context
+        if mgr.inference_profiler is not None:
+            infer_in_context = mgr.inference_profiler.profile_node(infer_in_context)
+        generator = infer_in_context(mgr, context, memoizable, kwargs)
+        if contextmod.active_budget() is None:
+            if context is not None and context.budget is not None:
+                budget = context.budget
+            elif mgr.inference_budget is not None:
+                budget = mgr.inference_budget.copy()
+            else:
+                return generator
+            return self._infer_with_budget(mgr, budget, generator)
+        return generator
+
+    def _infer_with_budget(self, mgr, budget, generator):
+        """Run the top-level inference done by *generator*, spending *budget*.
+
+        The budget is only active while the inference runs, not while the
+        caller handles its results.
+        """
+        budget.start()
+        try:
+            while True:
+                # Another budget is active when the results are consumed
+                # by an inference running under it.
+                previous = contextmod._ACTIVE.budget
+                contextmod._ACTIVE.budget = budget
+                try:
+                    result = next(generator, _MISSING)
+                finally:
+                    contextmod._ACTIVE.budget = previous
+                if result is _MISSING:
+                    return
+                yield result
+        finally:
+            if budget.exhausted:
+                mgr.record_budget_exhaustion(self)
+
+    def _infer_in_context(self, mgr, context, memoizable, kwargs):
+        """Infer this node, caching the results in the given *context*, and
+        in the inference memo if they are *memoizable*.
+
+        The inference counts as running only while a result is computed,
+        not while the caller handles it.
+        """
+        budget = contextmod.active_budget()
+        if budget is not None and not budget.enter():
+            yield util.Uninferable
+            return
+        # The inferences nested in another one are not memoized, they may
+        # be cut short by the recursion guards of the running ones.
+        memoize = memoizable and not _RUNNING.depth
+        results = []
+        generator = self._infer_results(mgr, context, kwargs)
+        try:
+            while True:
+                _RUNNING.depth += 1
+                try:
+                    result = next(generator, _MISSING)
+                finally:
+                    _RUNNING.depth -= 1
+                if result is _MISSING:
+                    break
+                results.append(result)
+                yield result
+            # Only reached once every result was computed.
+            if memoize and not contextmod.budget_exhausted():
+                mgr.inference_memo.store(_lookupname(context), self, tuple(results))
+        finally:
+            if budget is not None:
+                budget.leave()
+
+    def _infer_results(self, mgr, context, kwargs):
+        """Infer this node, caching the results in the given *context*."""
+        explicit = self._explicit_inference is not None
+        if explicit:
             # explicit_inference is not bound, give it self explicitly
             try:
                 # pylint: disable=not-callable
-                yield from self._explicit_inference(self, context, **kwargs)
-                return
+                if mgr.isolated:
+                    generator = mgr._infer_with_brain(
+                        self._explicit_inference, self, context, kwargs
+                    )
+                else:
+                    generator = self._explicit_inference(self, context, **kwargs)
+                yield from generator
             except exceptions.UseInferenceDefault:
-                pass
+                explicit = False
 
-        if not context:
+        if not explicit and not context:
             yield from self._infer(context, **kwargs)
-            return
-
-        key = (self, context.lookupname, context.callcontext, context.boundnode)
-        if key in context.inferred:
-            yield from context.inferred[key]
-            return
-
-        generator = self._infer(context, **kwargs)
-        results = []
-
-        # Limit inference amount to help with performance issues with
-        # exponentially exploding possible results.
-        limit = MANAGER.max_inferable_values
-        for i, result in enumerate(generator):
-            if i >= limit:
-                yield util.Uninferable
-                break
-            results.append(result)
-            yield result
-
-        # Cache generated results for subsequent inferences of the
-        # same node using the same context
-        context.inferred[key] = tuple(results)
-        return
+        elif not explicit:
+            key = (self, context.lookupname, context.callcontext, context.boundnode)
+            cached = key in context.inferred
+            if mgr.inference_profiler is not None:
+                mgr.inference_profiler.record_lookup(
+                    "node", self.__class__.__name__, cached
+                )
+            if cached:
+                yield from context.inferred[key]
+                return
+            inferred = []
+            # Limit inference amount to help with performance issues with
+            # exponentially exploding possible results.
+            limit = mgr.max_inferable_values
+            for i, result in enumerate(self._infer(context, **kwargs)):
+                if i >= limit:
+                    yield util.Uninferable
+                    break
+                inferred.append(result)
+                yield result
+            # Cache generated results for subsequent inferences of the
+            # same node using the same context
+            if not contextmod.budget_exhausted():
+                context.inferred[key] = tuple(inferred)
 
     def _repr_name(self):
         """Get a name for nice representation.
@@ -525,6 +662,25 @@ class NodeNG:
             return self.parent.scope()
         return None
 
+    @property
+    def manager(self):
+        """The manager which built the module holding this node,
+        the shared manager if it is unknown.
+
+        :type: AstroidManager
+        """
+        return self._bound_manager() or MANAGER
+
+    def _bound_manager(self):
+        # Found once through the parents, since it is read by every
+        # inference, and only recorded once the module is cached.
+        mgr = self._manager
+        if mgr is None and self.parent is not None:
+            mgr = self.parent._bound_manager()
+            if mgr is not None:
+                self._manager = mgr
+        return mgr
+
     def root(self):
         """Return the root node of the syntax tree.
 
@@ -1068,10 +1224,50 @@ class _BaseContainer(
         yield from self.elts
 
 
+class _LookupTable:
+    """The assignments of a name in a scope, with what their filtering needs.
+
+    The table is kept in the cache of the scope, and is thus released
+    along with its module. It is built again when the assignments are
+    replaced or changed, by a brain or a module invalidation for instance.
+    """
+
+    __slots__ = ("stmts", "nodes", "entries", "handlers", "results")
+
+    # Lookups remembered by a table, each holding its looking up node.
+    max_results = 1024
+
+    def __init__(self, stmts):
+        self.stmts = stmts
+        # The assignments are compared with those, since the list of
+        # assignments may have been changed in place.
+        self.nodes = tuple(stmts)
+        # (node, statement, line of the statement, assignment type)
+        self.entries = []
+        for node in stmts:
+            stmt = node.statement()
+            assign_type = node.assign_type() if hasattr(node, "assign_type") else None
+            self.entries.append((node, stmt, stmt.fromlineno, assign_type))
+        # whether every assignment is done by an except handler
+        self.handlers = len(stmts) > 1 and all(
+            isinstance(stmt, ExceptHandler) for _, stmt, _, _ in self.entries
+        )
+        # (looking up node, offset) -> filtered statements
+        self.results = {}
+
+    @classmethod
+    def of(cls, scope, stmts):
+        """Get the table of the assignments *stmts* of a name in *scope*."""
+        tables = decorators._cache_of(scope).setdefault("_lookup_tables", {})
+        table = tables.get(id(stmts))
+        if table is None or table.stmts is not stmts or table.nodes != tuple(stmts):
+            table = tables[id(stmts)] = cls(stmts)
+        return table
+
+
 class LookupMixIn:
     """Mixin to look up a name in the right scope."""
 
-    @lru_cache(maxsize=None)
     def lookup(self, name):
         """Lookup where the given variable is assigned.
 
@@ -1103,24 +1299,20 @@ class LookupMixIn:
         context = contextmod.InferenceContext()
         return bases._infer_stmts(stmts, context, frame)
 
-    def _get_filtered_node_statements(self, nodes):
-        statements = [(node, node.statement()) for node in nodes]
-        # Next we check if we have ExceptHandlers that are parent
+    def _get_filtered_node_statements(self, table):
+        # We check if we have ExceptHandlers that are parent
         # of the underlying variable, in which case the last one survives
-        if len(statements) > 1 and all(
-            isinstance(stmt, ExceptHandler) for _, stmt in statements
-        ):
-            statements = [
-                (node, stmt) for node, stmt in statements if stmt.parent_of(self)
-            ]
-        return statements
+        if table.handlers:
+            return [entry for entry in table.entries if entry[1].parent_of(self)]
+        return table.entries
 
     def _filter_stmts(self, stmts, frame, offset):
         """Filter the given list of statements to remove ignorable statements.
 
         If self is not a frame itself and the name is found in the inner
         frame locals, statements will be filtered to remove ignorable
-        statements according to self's location.
+        statements according to self's location. The result is remembered
+        in the lookup table of the assignments, kept by *frame*.
 
         :param stmts: The statements to filter.
         :type stmts: list(NodeNG)
@@ -1134,6 +1326,18 @@ class LookupMixIn:
         :returns: The filtered statements.
         :rtype: list(NodeNG)
         """
+        table = _LookupTable.of(frame, stmts)
+        key = (self, offset)
+        try:
+            return table.results[key]
+        except KeyError:
+            pass
+        filtered = self._filter_table(table, frame, offset)
+        if len(table.results) < table.max_results and not contextmod.budget_exhausted():
+            table.results[key] = filtered
+        return filtered
+
+    def _filter_table(self, table, frame, offset):
         # if offset == -1, my actual frame is not the inner frame but its parent
         #
         # class A(B): pass
@@ -1171,22 +1375,21 @@ class LookupMixIn:
 
         _stmts = []
         _stmt_parents = []
-        statements = self._get_filtered_node_statements(stmts)
-        for node, stmt in statements:
+        statements = self._get_filtered_node_statements(table)
+        for node, stmt, fromlineno, assign_type in statements:
             # line filtering is on and we have reached our location, break
-            if stmt.fromlineno and stmt.fromlineno > mylineno > 0:
+            if fromlineno and fromlineno > mylineno > 0:
                 break
             # Ignore decorators with the same name as the
             # decorated function
             # Fixes issue #375
             if mystmt is stmt and is_from_decorator(self):
                 continue
-            assert hasattr(node, "assign_type"), (
+            assert assign_type is not None, (
                 node,
                 node.scope(),
                 node.scope().locals,
             )
-            assign_type = node.assign_type()
             if node.has_base(self):
                 break
 
@@ -1207,11 +1410,17 @@ class LookupMixIn:
                 continue
 
             # XXX comment various branches below!!!
-            try:
-                pindex = _stmt_parents.index(stmt.parent)
-            except ValueError:
-                pass
-            else:
+            # Nodes are compared by identity, without list.index whose
+            # error message would format the missing node.
+            pindex = next(
+                (
+                    index
+                    for index, parent in enumerate(_stmt_parents)
+                    if parent is stmt.parent
+                ),
+                None,
+            )
+            if pindex is not None:
                 # we got a parent index, this means the currently visited node
                 # is at the same block level as a previously visited node
                 if _stmts[pindex].assign_type().parent_of(assign_type):
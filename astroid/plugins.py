@@ -0,0 +1,215 @@
+# Licensed under the LGPL: https://www.gnu.org/licenses/old-licenses/lgpl-2.1.en.html
+# For details: https://github.com/PyCQA/astroid/blob/master/LICENSE
+
+"""Loading of the brain plugins, on demand for most of them.
+
+A brain plugin is a module of the ``brain`` directory which registers
+transforms, module extenders or failed import hooks with the manager when
+it is imported. Most plugins only matter for the code using a given
+library, such as numpy or Qt. They are declared in :data:`LAZY_PLUGINS`
+along with the names of the modules triggering them, and are imported
+the first time that one of these modules, or one of their submodules:
+
+* is built, before the transforms are applied to it,
+* is imported by a module being transformed,
+* cannot be found, before the failed import hooks are called.
+
+The other plugins, including those unknown to the registry, are imported
+along with astroid.
+
+Plugins register with the shared manager. The registry hands what they
+register to the isolated managers attached to it as well, so that their
+plugins are loaded on demand too.
+"""
+
+import collections
+import os
+import threading
+import weakref
+
+from astroid import nodes
+
+
+# plugin name -> names of the modules triggering it
+LAZY_PLUGINS = {
+    "brain_argparse": ("argparse",),
+    "brain_attrs": ("attr", "attrs"),
+    "brain_boto3": ("boto3",),
+    "brain_collections": ("collections", "_collections", "_collections_abc"),
+    "brain_crypt": ("crypt",),
+    "brain_curses": ("curses",),
+    "brain_dateutil": ("dateutil",),
+    "brain_gi": ("gi",),
+    "brain_hashlib": ("hashlib",),
+    "brain_http": ("http",),
+    "brain_hypothesis": ("hypothesis",),
+    "brain_io": ("_io", "io"),
+    "brain_mechanize": ("mechanize",),
+    "brain_multiprocessing": ("multiprocessing",),
+    "brain_nose": ("nose",),
+    "brain_numpy_core_fromnumeric": ("numpy",),
+    "brain_numpy_core_function_base": ("numpy",),
+    "brain_numpy_core_multiarray": ("numpy",),
+    "brain_numpy_core_numeric": ("numpy",),
+    "brain_numpy_core_numerictypes": ("numpy",),
+    "brain_numpy_core_umath": ("numpy",),
+    "brain_numpy_ndarray": ("numpy",),
+    "brain_numpy_random_mtrand": ("numpy",),
+    "brain_numpy_utils": ("numpy",),
+    "brain_pkg_resources": ("pkg_resources",),
+    "brain_pytest": ("pytest", "py", "_pytest"),
+    "brain_qt": ("PyQt4", "PyQt5", "PySide", "PySide2"),
+    "brain_random": ("random",),
+    "brain_re": ("re",),
+    "brain_responses": ("responses",),
+    "brain_scipy_signal": ("scipy",),
+    "brain_sqlalchemy": ("sqlalchemy",),
+    "brain_ssl": ("ssl",),
+    "brain_subprocess": ("subprocess",),
+    "brain_threading": ("threading",),
+    "brain_uuid": ("uuid",),
+}
+
+
+class PluginRegistry:
+    """The brain plugins found in *directory*, which must be in ``sys.path``.
+
+    :param lazy_plugins: The plugins loaded on demand, mapped to the names
+        of the modules triggering them, :data:`LAZY_PLUGINS` by default.
+    :type lazy_plugins: dict(str, tuple(str))
+    """
+
+    def __init__(self, directory, lazy_plugins=None):
+        if lazy_plugins is None:
+            lazy_plugins = LAZY_PLUGINS
+        self.directory = directory
+        self.loaded = set()
+        self._eager = []
+        self._triggers = collections.defaultdict(list)
+        # Held while loading, so that no thread goes on before the plugins
+        # it triggered are loaded by another one. Plugins may build modules.
+        self._lock = threading.RLock()
+        self._manager = None
+        # isolated managers getting what the plugins register
+        self._attached = weakref.WeakSet()
+        # numbers of transforms and failed import hooks of the manager
+        # already handed to the attached managers, while loading
+        self._handed = None
+        for filename in sorted(os.listdir(directory)):
+            if not filename.endswith(".py"):
+                continue
+            name = filename[:-3]
+            if name in lazy_plugins:
+                for modname in lazy_plugins[name]:
+                    self._triggers[modname].append(name)
+            else:
+                self._eager.append(name)
+
+    def install(self, manager):
+        """Load the eager plugins and load the others on demand for *manager*."""
+        self._manager = manager
+        manager.brain_plugins = self
+        manager.register_transform(nodes.Import, self._load_for_import)
+        manager.register_transform(nodes.ImportFrom, self._load_for_import_from)
+        for name in self._eager:
+            self._load(name)
+
+    def attach(self, manager):
+        """Give the transforms and failed import hooks registered with the
+        manager in which the registry is installed to *manager*, an isolated
+        one, along with those of the plugins loaded from now on.
+        """
+        with self._lock:
+            installed = self._manager
+            manager._add_setup(
+                installed._transform._registrations, installed._failed_import_hooks
+            )
+            manager.brain_plugins = self
+            self._attached.add(manager)
+
+    def pending(self):
+        """Get the names of the plugins which are not loaded yet.
+
+        :rtype: set(str)
+        """
+        return {
+            name
+            for names in self._triggers.values()
+            for name in names
+            if name not in self.loaded
+        }
+
+    def load_all(self):
+        """Load every plugin, for the tools which must not depend on the order
+        in which modules are built.
+        """
+        with self._lock:
+            for name in self._eager:
+                self._load(name)
+            for name in sorted(self.pending()):
+                self._load(name)
+            self._triggers.clear()
+
+    def load_for(self, modname):
+        """Load the plugins triggered by the module called *modname*,
+        or by one of its parent packages.
+        """
+        triggers = self._triggers
+        if not triggers:
+            return
+        with self._lock:
+            while modname:
+                for name in triggers.pop(modname, ()):
+                    self._load(name)
+                modname = modname.rpartition(".")[0]
+
+    def _load(self, name):
+        if name in self.loaded:
+            return
+        self.loaded.add(name)
+        if self._manager is None:
+            __import__(name)
+            return
+        outermost = self._handed is None
+        if outermost:
+            self._handed = self._setup_sizes()
+        try:
+            __import__(name)
+        finally:
+            # A plugin loaded while importing another one hands over what
+            # both registered until then.
+            self._hand_over()
+            if outermost:
+                self._handed = None
+
+    def _setup_sizes(self):
+        return (
+            len(self._manager._transform._registrations),
+            len(self._manager._failed_import_hooks),
+        )
+
+    def _hand_over(self):
+        """Give what was registered since the last hand over to the attached
+        managers.
+        """
+        registrations, hooks = self._handed
+        for manager in list(self._attached):
+            manager._add_setup(
+                self._manager._transform._registrations[registrations:],
+                self._manager._failed_import_hooks[hooks:],
+            )
+        self._handed = self._setup_sizes()
+
+    # The transforms loading the plugins return the node they are given,
+    # since the transforms of a node stop at the first one returning
+    # something else, None included.
+
+    def _load_for_import(self, node):
+        for name, _ in node.names:
+            self.load_for(name)
+        return node
+
+    def _load_for_import_from(self, node):
+        if not node.level:
+            self.load_for(node.modname)
+        return node
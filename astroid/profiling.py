@@ -0,0 +1,152 @@
+# Licensed under the LGPL: https://www.gnu.org/licenses/old-licenses/lgpl-2.1.en.html
+# For details: https://github.com/PyCQA/astroid/blob/master/LICENSE
+
+"""Instrumentation of the inference, enabled by ``AstroidManager.profile_inference``.
+
+The inferences are nested generators, which profilers attribute poorly.
+The :class:`InferenceProfiler` times each of them while it runs, that is
+from the moment it is resumed until it yields a result or finishes, and
+accounts for it under its node class or its inference tip::
+
+    from astroid import MANAGER
+
+    MANAGER.profile_inference()
+    ...  # infer some nodes
+    for stat in MANAGER.inference_stats()[:10]:
+        print(stat)
+    with open("inference.folded", "w") as stream:
+        MANAGER.inference_profiler.dump_flamegraph(stream)
+
+The flame graph is written in the folded stacks format of ``flamegraph.pl``
+and speedscope, one line per stack of inferences with the time spent in
+its last one, in microseconds.
+"""
+
+import collections
+import json
+import threading
+import time
+
+from astroid import transforms
+
+
+class _Stacks(threading.local):
+    def __init__(self):
+        super().__init__()
+        # names of the running inferences, innermost last
+        self.names = []
+        # time spent in the inferences nested in each running one
+        self.nested = []
+
+
+class InferenceProfiler:
+    """Statistics of the inferences of each node class and inference tip.
+
+    For each of them are recorded the number of ``calls``, the ``time``
+    spent, nested inferences included, the number of ``results`` and the
+    number of ``lookups`` of the cached results, in ``context.inferred``
+    for the nodes and in the inference tip cache for the tips, of which
+    ``hits`` found them. The inferences answered by the inference memo of
+    the manager are not accounted.
+    """
+
+    def __init__(self):
+        # (kind, name) -> [calls, time, results, lookups, hits]
+        self._statistics = collections.defaultdict(lambda: [0, 0.0, 0, 0, 0])
+        # folded stack -> time spent in its last inference
+        self._folded = collections.defaultdict(float)
+        self._stacks = _Stacks()
+        self._tip_names = {}
+
+    def record_lookup(self, kind, name, hit):
+        """Account for a lookup of the cached results of an inference."""
+        statistics = self._statistics[kind, name]
+        statistics[3] += 1
+        if hit:
+            statistics[4] += 1
+
+    def profile(self, kind, name, generator):
+        """Time the inference done by *generator*, yielding its results."""
+        statistics = self._statistics[kind, name]
+        statistics[0] += 1
+        label = name if kind == "node" else f"{kind}:{name}"
+        stacks = self._stacks
+        while True:
+            stacks.names.append(label)
+            stacks.nested.append(0.0)
+            start = time.perf_counter()
+            try:
+                result = next(generator)
+            except StopIteration:
+                return
+            finally:
+                elapsed = time.perf_counter() - start
+                nested = stacks.nested.pop()
+                self._folded[";".join(stacks.names)] += elapsed - nested
+                stacks.names.pop()
+                if stacks.nested:
+                    stacks.nested[-1] += elapsed
+                statistics[1] += elapsed
+            statistics[2] += 1
+            yield result
+
+    def profile_node(self, infer_in_context):
+        """Wrap the ``_infer_in_context`` method of a node to profile it."""
+        name = infer_in_context.__self__.__class__.__name__
+
+        def profiled(*args, **kwargs):
+            return self.profile("node", name, infer_in_context(*args, **kwargs))
+
+        return profiled
+
+    def tip_name(self, func):
+        """Get the name under which the inference tip *func* is accounted."""
+        try:
+            return self._tip_names[func]
+        except KeyError:
+            name = self._tip_names[func] = transforms._describe(func)
+            return name
+
+    def stats(self):
+        """Get the recorded statistics.
+
+        :returns: A dictionary for each node class and inference tip, the
+            most expensive first, giving its ``kind``, ``"node"`` or
+            ``"tip"``, its ``name`` and its statistics, the ``hit_rate``
+            being None without lookups.
+        :rtype: list(dict)
+        """
+        stats = [
+            {
+                "kind": kind,
+                "name": name,
+                "calls": calls,
+                "time": elapsed,
+                "results": results,
+                "lookups": lookups,
+                "hits": hits,
+                "hit_rate": hits / lookups if lookups else None,
+            }
+            for (kind, name), (
+                calls,
+                elapsed,
+                results,
+                lookups,
+                hits,
+            ) in self._statistics.items()
+        ]
+        stats.sort(key=lambda stat: stat["time"], reverse=True)
+        return stats
+
+    def dump_json(self, stream):
+        """Write the statistics to *stream* as JSON."""
+        json.dump(self.stats(), stream, indent=2)
+
+    def dump_flamegraph(self, stream):
+        """Write the time spent in each stack of inferences to *stream*,
+        in the folded stacks format.
+        """
+        for stack, elapsed in sorted(self._folded.items()):
+            microseconds = round(elapsed * 1e6)
+            if microseconds:
+                stream.write(f"{stack} {microseconds}\n")
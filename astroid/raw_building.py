@@ -287,6 +287,16 @@ def _safe_has_attribute(obj, member):
         return False
 
 
+def _builder_manager(given):
+    """Get the manager of a builder asked for the *given* one, the shared
+    manager by default, which the isolated manager running the brain code
+    on this thread, if any, stands for.
+    """
+    if given is not None and given.isolated:
+        return given
+    return manager.acting_manager() or given or MANAGER
+
+
 class InspectBuilder:
     """class for building nodes from living object
 
@@ -294,9 +304,10 @@ class InspectBuilder:
     FunctionDef and ClassDef nodes and some others as guessed.
     """
 
-    def __init__(self):
+    def __init__(self, mgr=None):
         self._done = {}
         self._module = None
+        self._manager = _builder_manager(mgr)
 
     def inspect_build(self, module, modname=None, path=None):
         """build astroid from a living module (i.e. using inspect)
@@ -313,7 +324,7 @@ class InspectBuilder:
             node = build_module(modname)
         node.file = node.path = os.path.abspath(path) if path else path
         node.name = modname
-        MANAGER.cache_module(node)
+        self._manager.cache_module(node)
         node.package = hasattr(module, "__path__")
         self._done = {}
         self.object_build(node, module)
@@ -61,15 +61,50 @@ def _visit_or_none(node, attr, visitor, parent, visit="visit", **kws):
     return None
 
 
+class LazyBody:
+    """The lines holding the body of a function or a class definition,
+    built by the :class:`TreeRebuilder` on first access.
+
+    The locals defined by the signature are kept aside until then.
+    """
+
+    __slots__ = ("rebuilder", "first_line", "last_line", "locals")
+
+    def __init__(self, rebuilder, first_line, last_line, locals_):
+        self.rebuilder = rebuilder
+        self.first_line = first_line
+        self.last_line = last_line
+        self.locals = locals_
+
+    def build(self, node):
+        self.rebuilder.build_lazy_body(node)
+
+
 class TreeRebuilder:
-    """Rebuilds the _ast tree to become an Astroid tree"""
+    """Rebuilds the _ast tree to become an Astroid tree
+
+    When the source *data* is given, the bodies of the functions and of
+    the classes are built lazily, when they are first accessed.
+    """
 
-    def __init__(self, manager, parser_module: Optional[ParserModule] = None):
+    def __init__(
+        self, manager, parser_module: Optional[ParserModule] = None, data=None
+    ):
         self._manager = manager
         self._global_names = []
         self._import_from_nodes = []
         self._delayed_assattr = []
         self._visit_meths = {}
+        # Split the lines as the parser does, the sources having other
+        # line endings are always built eagerly.
+        if data is not None and "\r" not in data:
+            self._lines = data.split("\n")
+        else:
+            self._lines = None
+        # Called with a node whose body was built lazily and with the
+        # ImportFrom and AssignAttr nodes of that body, to run the post
+        # build steps on them.
+        self.lazy_body_built = None
 
         if parser_module is None:
             self._parser_module = get_parser_module()
@@ -97,6 +132,73 @@ class TreeRebuilder:
             pass  # ast built from scratch
         return node, None
 
+    def _lazy_body_lines(self, node):
+        """Get the first and the last lines of the body of the given
+        function or class definition, or None if it must be built now.
+        """
+        if self._lines is None or not node.body:
+            return None
+        if self._global_names and self._global_names[-1]:
+            # Assignments in the body may be bound to global names.
+            return None
+        first = node.body[0]
+        if getattr(first, "decorator_list", None):
+            first = first.decorator_list[0]
+        last_line = getattr(node.body[-1], "end_lineno", None)
+        if last_line is None:
+            return None
+        first_line = first.lineno
+        if self._lines[first_line - 1][: first.col_offset].strip() not in ("", "@"):
+            # The body starts on the line of the definition or of the docstring.
+            return None
+        for line in self._lines[first_line - 1 : last_line]:
+            if "global" in line:
+                return None
+        return first_line, last_line
+
+    def _defer_body(self, newnode, lines):
+        newnode._lazy_body = LazyBody(self, *lines, newnode.locals)
+        del newnode.body
+        del newnode.locals
+
+    def build_lazy_body(self, node):
+        """Build the body of the given function or class definition,
+        which was left pending when the definition was visited.
+        """
+        lazy_body = node._lazy_body
+        node._lazy_body = None
+        # Parse the body alone, in place, so that the positions are kept.
+        source = "\n".join(
+            ["\n" * (lazy_body.first_line - 2) + "if 1:"]
+            + self._lines[lazy_body.first_line - 1 : lazy_body.last_line]
+        )
+        try:
+            tree = self._parser_module.parse(source)
+        except SyntaxError:
+            tree = self._parser_module.parse(source, type_comments=False)
+
+        global_names = self._global_names
+        import_from_nodes = self._import_from_nodes
+        delayed_assattr = self._delayed_assattr
+        self._global_names = [{}] if isinstance(node, nodes.FunctionDef) else []
+        self._import_from_nodes = []
+        self._delayed_assattr = []
+        try:
+            node.locals = lazy_body.locals
+            node.body = [self.visit(child, node) for child in tree.body[0].body]
+            built_import_from_nodes = self._import_from_nodes
+            built_delayed_assattr = self._delayed_assattr
+        finally:
+            self._global_names = global_names
+            self._import_from_nodes = import_from_nodes
+            self._delayed_assattr = delayed_assattr
+        if getattr(node, "_lazy_methods", False):
+            # Completed once the methods are built.
+            node._pending_locals = node.locals
+            del node.locals
+        if self.lazy_body_built is not None:
+            self.lazy_body_built(node, built_import_from_nodes, built_delayed_assattr)
+
     def _get_context(self, node):
         return self._parser_module.context_classes.get(type(node.ctx), astroid.Load)
 
@@ -405,9 +507,10 @@ class TreeRebuilder:
             decorators = self.visit_decorators(node, newnode)
         else:
             decorators = None
+        lazy_lines = self._lazy_body_lines(node)
         newnode.postinit(
             [self.visit(child, newnode) for child in node.bases],
-            [self.visit(child, newnode) for child in node.body],
+            [] if lazy_lines else [self.visit(child, newnode) for child in node.body],
             decorators,
             newstyle,
             metaclass,
@@ -417,6 +520,15 @@ class TreeRebuilder:
                 if kwd.arg != "metaclass"
             ],
         )
+        if lazy_lines:
+            self._defer_body(newnode, lazy_lines)
+        if self._lines is not None:
+            # Assigned in the bodies of the methods, which may be built lazily.
+            del newnode.instance_attrs
+            if not lazy_lines:
+                newnode._pending_locals = newnode.locals
+                del newnode.locals
+            newnode._lazy_methods = True
         return newnode
 
     def visit_const(self, node, parent):
@@ -619,14 +731,19 @@ class TreeRebuilder:
         type_comment_annotation = self.check_function_type_comment(node, newnode)
         if type_comment_annotation:
             type_comment_returns, type_comment_args = type_comment_annotation
+        lazy_lines = self._lazy_body_lines(node)
         newnode.postinit(
             args=self.visit(node.args, newnode),
-            body=[self.visit(child, newnode) for child in node.body],
+            body=[]
+            if lazy_lines
+            else [self.visit(child, newnode) for child in node.body],
             decorators=decorators,
             returns=returns,
             type_comment_returns=type_comment_returns,
             type_comment_args=type_comment_args,
         )
+        if lazy_lines:
+            self._defer_body(newnode, lazy_lines)
         self._global_names.pop()
         return newnode
 
@@ -40,6 +40,7 @@ import builtins
 import sys
 import io
 import itertools
+import operator
 from typing import Optional, List
 
 from astroid import bases
@@ -195,13 +196,16 @@ class LocalsDictNodeNG(node_classes.LookupMixIn, node_classes.NodeNG):
     to locals information
     """
 
-    # attributes below are set by the builder module or by raw factories
-
-    locals = {}
-    """A map of the name of a local variable to the node defining the local.
-
-    :type: dict(str, NodeNG)
-    """
+    def __getattr__(self, name):
+        # The body and the locals of functions and classes built lazily
+        # are missing until they are first accessed.
+        lazy_body = self._lazy_body
+        if lazy_body is not None and name in ("body", "locals"):
+            lazy_body.build(self)
+            return getattr(self, name)
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
 
     def qname(self):
         """Get the 'qualified' name of the node.
@@ -494,6 +498,11 @@ class Module(LocalsDictNodeNG):
         :type: list(NodeNG) or None
         """
         self.future_imports = set()
+        self._foreign_attrs = []
+        """Attributes assigned by this module on objects of other modules.
+
+        :type: list(tuple(dict(str, list(NodeNG)), NodeNG))
+        """
 
     # pylint: enable=redefined-builtin
 
@@ -681,14 +690,17 @@ class Module(LocalsDictNodeNG):
             level = 0
         absmodname = self.relative_to_absolute_name(modname, level)
 
+        mgr = self.manager
         try:
-            return MANAGER.ast_from_module_name(absmodname)
+            module = mgr.ast_from_module_name(absmodname)
         except exceptions.AstroidBuildingError:
             # we only want to import a sub module or package of this module,
             # skip here
             if relative_only:
                 raise
-        return MANAGER.ast_from_module_name(modname)
+            module = mgr.ast_from_module_name(modname)
+        mgr.record_import(self, module)
+        return module
 
     def relative_to_absolute_name(self, modname, level):
         """Get the absolute module name for a relative import.
@@ -1917,6 +1929,94 @@ def get_wrapping_class(node):
     return klass
 
 
+# Marks a result being computed, see ClassDef._context_free_result
+_COMPUTING = object()
+
+
+class _Namespace(dict):
+    """The ``locals`` or the ``instance_attrs`` of a class, counting the
+    changes of its names for the attribute indexes using it.
+    """
+
+    # Incremented whenever names are added or removed.
+    version = 0
+
+    def __setitem__(self, name, value):
+        if name not in self:
+            self.version += 1
+        super().__setitem__(name, value)
+
+    def setdefault(self, name, default=None):
+        if name not in self:
+            self.version += 1
+        return super().setdefault(name, default)
+
+    def __delitem__(self, name):
+        super().__delitem__(name)
+        self.version += 1
+
+    def pop(self, *args):
+        self.version += 1
+        return super().pop(*args)
+
+    def popitem(self):
+        self.version += 1
+        return super().popitem()
+
+    def clear(self):
+        self.version += 1
+        super().clear()
+
+    def update(self, *args, **kwargs):
+        self.version += 1
+        super().update(*args, **kwargs)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+
+_version = operator.attrgetter("version")
+
+
+class _AttributeIndex:
+    """The ancestors of a class defining each name in one of their namespaces,
+    ``locals`` or ``instance_attrs``, in the order of :meth:`ClassDef.ancestors`.
+
+    The index is outdated once names are added to or removed from one of the
+    namespaces, which is noticed through their versions, or once one of them
+    is replaced by another dictionary.
+    """
+
+    __slots__ = ("ancestors", "_namespace_of", "_namespaces", "_versions", "_owners")
+
+    def __init__(self, ancestors, namespace_of, namespaces):
+        self.ancestors = ancestors
+        self._namespace_of = namespace_of
+        self._namespaces = namespaces
+        self._versions = tuple(map(_version, namespaces))
+        self._owners = {}
+        for cls, names in zip(ancestors, namespaces):
+            for name in names:
+                self._owners.setdefault(name, []).append(cls)
+
+    def is_current(self, ancestors):
+        return (
+            ancestors is self.ancestors
+            and all(
+                map(
+                    operator.is_,
+                    map(self._namespace_of, ancestors),
+                    self._namespaces,
+                )
+            )
+            and all(map(operator.eq, map(_version, self._namespaces), self._versions))
+        )
+
+    def owners(self, name):
+        return self._owners.get(name, ())
+
+
 class ClassDef(mixins.FilterStmtsMixin, LocalsDictNodeNG, node_classes.Statement):
     """Class representing an :class:`ast.ClassDef` node.
 
@@ -1948,6 +2048,13 @@ class ClassDef(mixins.FilterStmtsMixin, LocalsDictNodeNG, node_classes.Statement
 
     _type = None
     _metaclass_hack = False
+    # whether the methods are built on the first access to the locals or to
+    # the instance attributes, when the class was built with lazy bodies:
+    # the attributes which they assign to the class and to its instances
+    # are missing until then
+    _lazy_methods = False
+    # the locals of the class body until its methods are built
+    _pending_locals = None
     hide = False
     type = property(
         _class_type,
@@ -1979,8 +2086,8 @@ class ClassDef(mixins.FilterStmtsMixin, LocalsDictNodeNG, node_classes.Statement
         :param parent: The parent node in the syntax tree.
         :type parent: NodeNG or None
         """
-        self.instance_attrs = {}
-        self.locals = {}
+        self.instance_attrs = _Namespace()
+        self.locals = _Namespace()
         """A map of the name of a local variable to the node defining it.
 
         :type: dict(str, NodeNG)
@@ -2025,6 +2132,30 @@ class ClassDef(mixins.FilterStmtsMixin, LocalsDictNodeNG, node_classes.Statement
         for local_name, node in self.implicit_locals():
             self.add_local_node(node, local_name)
 
+    def __getattr__(self, name):
+        if name in ("locals", "instance_attrs") and self._lazy_methods:
+            self._build_methods()
+            return getattr(self, name)
+        return super().__getattr__(name)
+
+    def _build_methods(self):
+        """Build every method, in order, so that the attributes assigned
+        in their bodies are gathered in the locals and the instance
+        attributes of the class.
+        """
+        self._lazy_methods = False
+        self.instance_attrs = _Namespace()
+        if self._lazy_body is not None:
+            self._lazy_body.build(self)
+        else:
+            self.locals = self._pending_locals
+        self._pending_locals = None
+        stack = self.body[::-1]
+        while stack:
+            node = stack.pop()
+            if not isinstance(node, ClassDef):
+                stack.extend(list(node.get_children())[::-1])
+
     def implicit_parameters(self):
         return 1
 
@@ -2289,6 +2420,38 @@ class ClassDef(mixins.FilterStmtsMixin, LocalsDictNodeNG, node_classes.Statement
         """
         return [bnode.as_string() for bnode in self.bases]
 
+    def _context_free_result(self, key, compute):
+        """Get the result of *compute*, cached under *key* since it does not
+        depend on the context.
+
+        The cached results are dropped with the other cached values when a
+        module imported by this one is invalidated.
+
+        :returns: The result, or None if it is being computed already, in
+            which case the caller must compute it in its own context.
+        """
+        cache = decorators_mod._cache_of(self)
+        result = cache.get(key)
+        if result is not None:
+            return None if result is _COMPUTING else result
+        cache[key] = _COMPUTING
+        try:
+            result = compute()
+        except BaseException:
+            cache.pop(key, None)
+            raise
+        if contextmod.budget_exhausted():
+            # Computed with some bases left uninferred.
+            cache.pop(key, None)
+            return result
+        cache[key] = result
+        return result
+
+    def _cached_ancestors(self, recurs=True):
+        return self._context_free_result(
+            ("ancestors", recurs), lambda: tuple(self._infer_ancestors(recurs, None))
+        )
+
     def ancestors(self, recurs=True, context=None):
         """Iterate over the base classes in prefixed depth first order.
 
@@ -2298,6 +2461,50 @@ class ClassDef(mixins.FilterStmtsMixin, LocalsDictNodeNG, node_classes.Statement
         :returns: The base classes
         :rtype: iterable(NodeNG)
         """
+        if node_classes._is_context_free(context):
+            ancestors = self._cached_ancestors(recurs)
+            if ancestors is not None:
+                return iter(ancestors)
+        return self._infer_ancestors(recurs, context)
+
+    def _attribute_index(self, namespace):
+        """Get the index of the ancestors defining each name in their
+        *namespace*, or None if the ancestors are being computed or if
+        one of their namespaces was replaced by a plain dictionary.
+        """
+        ancestors = self._cached_ancestors()
+        if ancestors is None:
+            return None
+        cache = decorators_mod._cache_of(self)
+        key = ("attribute_index", namespace)
+        index = cache.get(key)
+        if index is None or not index.is_current(ancestors):
+            namespace_of = operator.attrgetter(namespace)
+            namespaces = tuple(map(namespace_of, ancestors))
+            if not all(isinstance(names, _Namespace) for names in namespaces):
+                return None
+            index = _AttributeIndex(ancestors, namespace_of, namespaces)
+            if not contextmod.budget_exhausted():
+                cache[key] = index
+        return index
+
+    def _ancestors_defining(self, name, namespace="locals", context=None):
+        """Get the ancestors defining *name* in their *namespace*, ``locals``
+        or ``instance_attrs``, in the order of :meth:`ancestors`.
+
+        :rtype: iterable(ClassDef)
+        """
+        if node_classes._is_context_free(context):
+            index = self._attribute_index(namespace)
+            if index is not None:
+                return index.owners(name)
+        return [
+            ancestor
+            for ancestor in self.ancestors(recurs=True, context=context)
+            if name in getattr(ancestor, namespace)
+        ]
+
+    def _infer_ancestors(self, recurs, context):
         # FIXME: should be possible to choose the resolution order
         # FIXME: inference make infinite loops possible here
         yielded = {self}
@@ -2365,9 +2572,7 @@ class ClassDef(mixins.FilterStmtsMixin, LocalsDictNodeNG, node_classes.Statement
             an instance attribute.
         :rtype: iterable(NodeNG)
         """
-        for astroid in self.ancestors(context=context):
-            if name in astroid.instance_attrs:
-                yield astroid
+        yield from self._ancestors_defining(name, "instance_attrs", context)
 
     def has_base(self, node):
         """Whether this class directly inherits from the given node.
@@ -2486,8 +2691,8 @@ class ClassDef(mixins.FilterStmtsMixin, LocalsDictNodeNG, node_classes.Statement
 
         # don't modify the list in self.locals!
         values = list(values)
-        for classnode in self.ancestors(recurs=True, context=context):
-            values += classnode.locals.get(name, [])
+        for classnode in self._ancestors_defining(name, "locals", context):
+            values += classnode.locals[name]
 
         if class_context:
             values += self._metaclass_lookup_attribute(name, context)
@@ -2947,7 +3152,7 @@ class ClassDef(mixins.FilterStmtsMixin, LocalsDictNodeNG, node_classes.Statement
                 continue
 
             try:
-                mro = base._compute_mro(context=context)
+                mro = base.mro(context=context)
                 bases_mro.append(mro)
             except NotImplementedError:
                 # Some classes have in their ancestors both newstyle and
@@ -2971,6 +3176,11 @@ class ClassDef(mixins.FilterStmtsMixin, LocalsDictNodeNG, node_classes.Statement
         :raises DuplicateBasesError: Duplicate bases in the same class base
         :raises InconsistentMroError: A class' MRO is inconsistent
         """
+        if node_classes._is_context_free(context):
+            mro = self._context_free_result(("mro",), self._compute_mro)
+            if mro is not None:
+                # The merge of the MROs of the subclasses consumes them.
+                return list(mro)
         return self._compute_mro(context=context)
 
     def bool_value(self, context=None):
@@ -7,7 +7,44 @@
 
 
 import collections
-from functools import lru_cache
+import functools
+import operator
+import time
+
+
+def _called_name(node):
+    func = node.func
+    kind = func.__class__.__name__
+    if kind == "Name":
+        return func.name
+    if kind == "Attribute":
+        return func.attrname
+    return None
+
+
+# name of a node class -> function getting the key of its instances
+KEY_FUNCTIONS = {
+    "Module": operator.attrgetter("name"),
+    "ClassDef": operator.attrgetter("name"),
+    "FunctionDef": operator.attrgetter("name"),
+    "Name": operator.attrgetter("name"),
+    "AssignName": operator.attrgetter("name"),
+    "Attribute": operator.attrgetter("attrname"),
+    "AssignAttr": operator.attrgetter("attrname"),
+    "Call": _called_name,
+}
+
+
+def _describe(func):
+    if func is None:
+        return None
+    if isinstance(func, functools.partial):
+        arguments = [repr(arg) for arg in func.args]
+        arguments += [f"{name}={value!r}" for name, value in func.keywords.items()]
+        return "{}({})".format(_describe(func.func), ", ".join(arguments))
+    name = getattr(func, "__qualname__", None) or repr(func)
+    module = getattr(func, "__module__", None)
+    return f"{module}.{name}" if module else name
 
 
 class TransformVisitor:
@@ -16,26 +53,66 @@ class TransformVisitor:
     The standard approach of using it is to call
     :meth:`~visit` with an *astroid* module and the class
     will take care of the rest, walking the tree and running the
-    transforms for each encountered node.
-    """
+    transforms for each encountered node. A node reached several
+    times during a visit is only transformed once.
 
-    TRANSFORM_MAX_CACHE_SIZE = 10000
+    Transforms registered with a *key* are only considered for the nodes
+    having this key, as given by :data:`KEY_FUNCTIONS`: the name of a
+    module, class, function or name, the attribute name of an attribute,
+    or the name of the function called by a call. They are found through
+    a dictionary instead of a predicate being evaluated for every node.
+    """
 
     def __init__(self):
+        # node class -> [(transform, predicate)], for the unkeyed transforms
         self.transforms = collections.defaultdict(list)
+        # node class -> {key: [(transform, predicate)]}
+        self.keyed_transforms = collections.defaultdict(dict)
+        # (node class, key, transform, predicate), in registration order
+        self._registrations = []
+        # (node class, key) -> transforms to consider, built on demand
+        self._dispatch = {}
+        self._key_functions = {}
+        self.profile = False
+        # (node class, key, transform, predicate) -> [checks, calls, time]
+        self._statistics = collections.defaultdict(lambda: [0, 0, 0.0])
+
+    def _transforms_for(self, cls, key):
+        """Get the transforms to consider for a node of class *cls* and *key*,
+        in the order in which they were registered.
+        """
+        try:
+            return self._dispatch[cls, key]
+        except KeyError:
+            pass
+        transforms = [
+            registration[1:]
+            for registration in self._registrations
+            if registration[0] is cls
+            and (registration[1] is None or registration[1] == key)
+        ]
+        self._dispatch[cls, key] = transforms
+        return transforms
 
-    @lru_cache(maxsize=TRANSFORM_MAX_CACHE_SIZE)
     def _transform(self, node):
         """Call matching transforms for the given node if any and return the
         transformed node.
         """
         cls = node.__class__
-        if cls not in self.transforms:
+        if cls not in self.transforms and cls not in self.keyed_transforms:
             # no transform registered for this class of node
             return node
 
-        transforms = self.transforms[cls]
-        for transform_func, predicate in transforms:
+        key = None
+        keyed = self.keyed_transforms.get(cls)
+        if keyed:
+            key = self._key_functions[cls](node)
+            if key not in keyed:
+                key = None
+        transforms = self._transforms_for(cls, key)
+        if self.profile:
+            return self._profiled_transform(node, transforms)
+        for _, transform_func, predicate in transforms:
             if predicate is None or predicate(node):
                 ret = transform_func(node)
                 # if the transformation function returns something, it's
@@ -47,38 +124,143 @@ class TransformVisitor:
                     break
         return node
 
-    def _visit(self, node):
-        if hasattr(node, "_astroid_fields"):
-            for name in node._astroid_fields:
-                value = getattr(node, name)
-                visited = self._visit_generic(value)
-                if visited != value:
-                    setattr(node, name, visited)
-        return self._transform(node)
-
-    def _visit_generic(self, node):
-        if isinstance(node, list):
-            return [self._visit_generic(child) for child in node]
-        if isinstance(node, tuple):
-            return tuple(self._visit_generic(child) for child in node)
-        if not node or isinstance(node, str):
-            return node
+    def _profiled_transform(self, node, transforms):
+        """Same as :meth:`_transform`, recording the statistics of the transforms."""
+        cls = node.__class__
+        for registration in transforms:
+            _, transform_func, predicate = registration
+            statistics = self._statistics[(cls,) + registration]
+            start = time.perf_counter()
+            try:
+                statistics[0] += 1
+                if predicate is not None and not predicate(node):
+                    continue
+                statistics[1] += 1
+                ret = transform_func(node)
+            finally:
+                statistics[2] += time.perf_counter() - start
+            if ret is not None:
+                node = ret
+            if ret.__class__ != cls:
+                break
+        return node
+
+    def _visit(self, node, visited):
+        """Transform the children of *node*, then *node* itself.
 
-        return self._visit(node)
+        :param visited: The nodes transformed during the current visit,
+            mapped to their replacement.
+        :type visited: dict
+        """
+        try:
+            return visited[node]
+        except KeyError:
+            pass
+        for name in getattr(node, "_astroid_fields", ()):
+            if name == "body" and node._lazy_body is not None:
+                # Transformed once built.
+                continue
+            value = getattr(node, name)
+            new_value = self._visit_field(value, visited)
+            if new_value is not value:
+                setattr(node, name, new_value)
+        result = visited[node] = self._transform(node)
+        return result
 
-    def register_transform(self, node_class, transform, predicate=None):
+    def _visit_field(self, value, visited):
+        """Transform the nodes held by a field, returning the field itself
+        unless some of them were replaced.
+        """
+        value_class = value.__class__
+        if value_class is list or value_class is tuple:
+            replaced = None
+            for index, child in enumerate(value):
+                new_child = self._visit_field(child, visited)
+                if new_child is not child:
+                    if replaced is None:
+                        replaced = list(value)
+                    replaced[index] = new_child
+            if replaced is None:
+                return value
+            return replaced if value_class is list else tuple(replaced)
+        if not value or value_class is str:
+            return value
+        return self._visit(value, visited)
+
+    def register_transform(self, node_class, transform, predicate=None, key=None):
         """Register `transform(node)` function to be applied on the given
         astroid's `node_class` if `predicate` is None or returns true
         when called with the node as argument.
 
+        If `key` is given, the transform is only considered for the nodes
+        whose key, as defined by :data:`KEY_FUNCTIONS`, is equal to it.
+
         The transform function may return a value which is then used to
         substitute the original node in the tree.
         """
-        self.transforms[node_class].append((transform, predicate))
+        if key is None:
+            self.transforms[node_class].append((transform, predicate))
+        else:
+            if node_class.__name__ not in KEY_FUNCTIONS:
+                raise ValueError(
+                    f"Transforms of {node_class.__name__} nodes cannot be keyed."
+                )
+            self._key_functions[node_class] = KEY_FUNCTIONS[node_class.__name__]
+            keyed = self.keyed_transforms[node_class]
+            keyed.setdefault(key, []).append((transform, predicate))
+        self._registrations.append((node_class, key, transform, predicate))
+        self._dispatch.clear()
 
-    def unregister_transform(self, node_class, transform, predicate=None):
+    def unregister_transform(self, node_class, transform, predicate=None, key=None):
         """Unregister the given transform."""
-        self.transforms[node_class].remove((transform, predicate))
+        if key is None:
+            self.transforms[node_class].remove((transform, predicate))
+        else:
+            keyed = self.keyed_transforms[node_class]
+            keyed[key].remove((transform, predicate))
+            if not keyed[key]:
+                del keyed[key]
+        self._registrations.remove((node_class, key, transform, predicate))
+        self._dispatch.clear()
+
+    def profile_transforms(self, enabled=True):
+        """Start or stop recording the statistics of the transforms.
+
+        Starting resets the statistics recorded until then. Recording
+        costs two timer calls for every predicate evaluated.
+        """
+        if enabled:
+            self._statistics.clear()
+        self.profile = enabled
+
+    def transform_stats(self):
+        """Get the statistics recorded since the profiling was started.
+
+        :returns: A dictionary for each transform considered at least once,
+            the most expensive first, giving its ``node_class``, ``key``,
+            ``transform`` and ``predicate`` as strings, the number of
+            ``checks`` of its predicate, the number of ``calls`` of the
+            transform and the ``time`` spent in both, in seconds.
+        :rtype: list(dict)
+        """
+        stats = [
+            {
+                "node_class": node_class.__name__,
+                "key": key,
+                "transform": _describe(transform),
+                "predicate": _describe(predicate),
+                "checks": checks,
+                "calls": calls,
+                "time": elapsed,
+            }
+            for (node_class, key, transform, predicate), (
+                checks,
+                calls,
+                elapsed,
+            ) in self._statistics.items()
+        ]
+        stats.sort(key=lambda stat: stat["time"], reverse=True)
+        return stats
 
     def visit(self, module):
         """Walk the given astroid *tree* and transform each encountered node
@@ -86,5 +268,13 @@ class TransformVisitor:
         Only the nodes which have transforms registered will actually
         be replaced or changed.
         """
-        module.body = [self._visit(child) for child in module.body]
+        body = self._visit_field(module.body, {})
+        if body is not module.body:
+            module.body = body
         return self._transform(module)
+
+    def visit_body(self, node):
+        """Walk the body of the given *node*, built after its tree was visited."""
+        body = self._visit_field(node.body, {})
+        if body is not node.body:
+            node.body = body
@@ -0,0 +1,168 @@
+"""Functions and classes going through many kinds of decorators."""
+
+import abc
+import contextlib
+import dataclasses
+import functools
+import typing
+
+
+def traced(func):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+def tagged(*tags):
+    def decorator(func):
+        func.tags = tags
+        return func
+
+    return decorator
+
+
+def register(registry):
+    def decorator(cls):
+        registry[cls.__name__] = cls
+        return cls
+
+    return decorator
+
+
+REGISTRY = {}
+
+
+@functools.lru_cache(maxsize=None)
+def fibonacci(number):
+    if number < 2:
+        return number
+    return fibonacci(number - 1) + fibonacci(number - 2)
+
+
+@traced
+@tagged("math", "pure")
+def scale(value, factor=2):
+    return value * factor
+
+
+@contextlib.contextmanager
+def opened(path):
+    stream = open(path)
+    try:
+        yield stream
+    finally:
+        stream.close()
+
+
+@functools.singledispatch
+def describe(value):
+    return repr(value)
+
+
+@describe.register(int)
+def _describe_int(value):
+    return "int %d" % value
+
+
+@describe.register(list)
+def _describe_list(value):
+    return ", ".join(describe(item) for item in value)
+
+
+class Shape(abc.ABC):
+    @abc.abstractmethod
+    def area(self):
+        """The area of the shape."""
+
+    @property
+    @abc.abstractmethod
+    def name(self):
+        """The name of the shape."""
+
+    @classmethod
+    def unit(cls):
+        return cls()
+
+    @staticmethod
+    def compare(first, second):
+        return first.area() - second.area()
+
+
+@register(REGISTRY)
+@dataclasses.dataclass(frozen=True)
+class Square(Shape):
+    side: float = 1.0
+
+    def area(self):
+        return self.side**2
+
+    @property
+    def name(self):
+        return "square"
+
+    @functools.cached_property
+    def diagonal(self):
+        return self.side * 2**0.5
+
+
+@register(REGISTRY)
+@dataclasses.dataclass
+class Rectangle(Shape):
+    width: float = 1.0
+    height: float = 2.0
+    labels: typing.List[str] = dataclasses.field(default_factory=list)
+
+    def area(self):
+        return self.width * self.height
+
+    @property
+    def name(self):
+        return "rectangle"
+
+    @name.setter
+    def name(self, value):
+        self.labels.append(value)
+
+    @traced
+    def scaled(self, factor):
+        return Rectangle(self.width * factor, self.height * factor)
+
+
+class Temperature:
+    def __init__(self, celsius=0.0):
+        self._celsius = celsius
+
+    @property
+    def celsius(self):
+        return self._celsius
+
+    @celsius.setter
+    def celsius(self, value):
+        self._celsius = value
+
+    @property
+    def fahrenheit(self):
+        return self._celsius * 9 / 5 + 32
+
+    @classmethod
+    @traced
+    def from_fahrenheit(cls, value):
+        return cls((value - 32) * 5 / 9)
+
+    @tagged("conversion")
+    def kelvin(self):
+        return self._celsius + 273.15
+
+
+SQUARE = Square(3.0)
+RECTANGLE = Rectangle(2.0, 5.0)
+AREAS = [shape.area() for shape in (SQUARE, RECTANGLE, Square.unit())]
+DIAGONAL = SQUARE.diagonal
+TEMPERATURE = Temperature.from_fahrenheit(212)
+KELVIN = TEMPERATURE.kelvin()
+SCALED = scale(fibonacci(10))
+DESCRIPTION = describe([1, 2, 3])
+with opened(__file__) as stream:
+    FIRST_LINE = stream.readline()
@@ -0,0 +1,123 @@
+"""Array computations written against the numpy API."""
+
+import numpy as np
+from numpy import linalg, random
+
+
+def normalize(values, axis=0):
+    values = np.asarray(values, dtype=np.float64)
+    mean = values.mean(axis=axis, keepdims=True)
+    std = values.std(axis=axis, keepdims=True)
+    return (values - mean) / np.where(std == 0, 1.0, std)
+
+
+def moving_average(values, window=5):
+    kernel = np.ones(window) / window
+    return np.convolve(values, kernel, mode="valid")
+
+
+def pairwise_distances(points):
+    points = np.atleast_2d(points)
+    squared = np.sum(points**2, axis=1)
+    distances = squared[:, np.newaxis] + squared[np.newaxis, :] - 2 * points @ points.T
+    return np.sqrt(np.maximum(distances, 0))
+
+
+def least_squares(features, targets):
+    features = np.column_stack([np.ones(len(features)), features])
+    coefficients, residuals, rank, _ = linalg.lstsq(features, targets, rcond=None)
+    return coefficients, residuals, rank
+
+
+def histogram(values, bins=10):
+    counts, edges = np.histogram(values, bins=bins)
+    centers = (edges[:-1] + edges[1:]) / 2
+    return np.stack([centers, counts.astype(np.float32)])
+
+
+def grid(size, spacing=1.0):
+    axis = np.arange(size, dtype=np.int32) * spacing
+    xs, ys = np.meshgrid(axis, axis, indexing="ij")
+    return np.dstack((xs, ys)).reshape(-1, 2)
+
+
+def random_walk(steps, seed=0):
+    generator = random.default_rng(seed)
+    moves = generator.choice(np.array([-1, 1]), size=steps)
+    return np.cumsum(moves)
+
+
+def masked_mean(values, threshold):
+    masked = np.ma.masked_less(values, threshold)
+    return float(masked.mean())
+
+
+def rotate(points, angle):
+    cos, sin = np.cos(angle), np.sin(angle)
+    rotation = np.array([[cos, -sin], [sin, cos]])
+    return np.dot(points, rotation.T)
+
+
+def eigen_summary(matrix):
+    matrix = np.asarray(matrix)
+    values, vectors = linalg.eig(matrix)
+    order = np.argsort(values)[::-1]
+    return values[order].real, vectors[:, order].real
+
+
+def clip_outliers(values, low=1, high=99):
+    lower, upper = np.percentile(values, [low, high])
+    return np.clip(values, lower, upper)
+
+
+def one_hot(labels, classes):
+    encoded = np.zeros((len(labels), classes), dtype=np.uint8)
+    encoded[np.arange(len(labels)), labels] = 1
+    return encoded
+
+
+def interpolate(xs, ys, points):
+    order = np.argsort(xs)
+    return np.interp(points, np.take(xs, order), np.take(ys, order))
+
+
+def block_sum(matrix, block):
+    rows, cols = matrix.shape
+    trimmed = matrix[: rows - rows % block, : cols - cols % block]
+    return trimmed.reshape(rows // block, block, -1, block).sum(axis=(1, 3))
+
+
+class RunningStatistics:
+    def __init__(self, shape):
+        self.count = 0
+        self.mean = np.zeros(shape)
+        self.squares = np.zeros(shape)
+
+    def update(self, sample):
+        sample = np.asarray(sample, dtype=np.float64)
+        self.count += 1
+        delta = sample - self.mean
+        self.mean += delta / self.count
+        self.squares += delta * (sample - self.mean)
+
+    @property
+    def variance(self):
+        if self.count < 2:
+            return np.full_like(self.mean, np.nan)
+        return self.squares / (self.count - 1)
+
+    def summary(self):
+        return {
+            "mean": self.mean.tolist(),
+            "std": np.sqrt(self.variance).tolist(),
+            "count": self.count,
+        }
+
+
+SAMPLES = random.default_rng(42).normal(size=(100, 3))
+NORMALIZED = normalize(SAMPLES)
+DISTANCES = pairwise_distances(NORMALIZED[:10])
+STATISTICS = RunningStatistics(3)
+for row in SAMPLES:
+    STATISTICS.update(row)
+SUMMARY = STATISTICS.summary()
@@ -0,0 +1,113 @@
+# Licensed under the LGPL: https://www.gnu.org/licenses/old-licenses/lgpl-2.1.en.html
+# For details: https://github.com/PyCQA/astroid/blob/master/LICENSE
+
+"""Measure the memory used by the nodes of rebuilt module trees.
+
+The trees of the Python files found in a directory, the standard library
+by default, are built without the transforms and the post build steps,
+while tracing the allocations made. The result is reported as the number
+of bytes per node, which can be compared across commits::
+
+    python benchmarks/node_memory.py
+    python benchmarks/node_memory.py --limit 50 /path/to/project
+"""
+
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+# Benchmark the astroid of this checkout, installed or not.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from astroid import builder
+
+
+def _source_files(directory, limit):
+    paths = []
+    for dirpath, dirnames, filenames in os.walk(directory):
+        dirnames[:] = sorted(
+            name
+            for name in dirnames
+            if name not in ("test", "tests", "site-packages", "__pycache__")
+        )
+        paths.extend(
+            os.path.join(dirpath, name)
+            for name in sorted(filenames)
+            if name.endswith(".py")
+        )
+        if limit and len(paths) >= limit:
+            return paths[:limit]
+    return paths
+
+
+def _count_nodes(module):
+    count = 0
+    stack = [module]
+    while stack:
+        node = stack.pop()
+        count += 1
+        stack.extend(node.get_children())
+    return count
+
+
+def measure(paths):
+    """Build the trees of the files at *paths* and measure their memory.
+
+    :returns: The number of built files, of skipped files, of nodes and
+        the number of bytes allocated for the trees.
+    :rtype: tuple(int, int, int, int)
+    """
+    sources = []
+    for path in paths:
+        try:
+            stream, _, data = builder.open_source_file(path)
+        except (OSError, SyntaxError, UnicodeError):
+            continue
+        stream.close()
+        sources.append((path, data))
+
+    rebuilder = builder.AstroidBuilder(apply_transforms=False)
+    modules = []
+    skipped = len(paths) - len(sources)
+    gc.collect()
+    tracemalloc.start()
+    for path, data in sources:
+        try:
+            modules.append(rebuilder._data_build(data, "benchmarked", path))
+        except Exception:  # pylint: disable=broad-except
+            # Syntax which this version of astroid cannot rebuild.
+            skipped += 1
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    nodes = sum(_count_nodes(module) for module in modules)
+    return len(modules), skipped, nodes, size
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "directory",
+        nargs="?",
+        default=os.path.dirname(os.__file__),
+        help="the directory holding the corpus, the standard library by default",
+    )
+    parser.add_argument(
+        "--limit", type=int, default=300, help="the maximum number of files to build"
+    )
+    args = parser.parse_args(argv)
+
+    built, skipped, nodes, size = measure(_source_files(args.directory, args.limit))
+    print(f"files: {built} built, {skipped} skipped")
+    print(f"nodes: {nodes}")
+    print(f"memory: {size / 2 ** 20:.1f} MB")
+    if nodes:
+        print(f"bytes per node: {size / nodes:.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,294 @@
+# Licensed under the LGPL: https://www.gnu.org/licenses/old-licenses/lgpl-2.1.en.html
+# For details: https://github.com/PyCQA/astroid/blob/master/LICENSE
+
+"""Time the phases of building and inferring module trees on fixed corpora.
+
+Every phase is timed separately on each corpus:
+
+* ``parse``: parsing the source with ``builder._parse_string``,
+* ``rebuild``: ``TreeRebuilder.visit_module`` on the parsed tree,
+* ``transform``: ``TransformVisitor.visit`` on the finished tree,
+* ``infer``: inferring every ``Name`` and ``Call`` node of a fresh tree,
+
+and the bootstrap of the builtins module is timed on its own. Each
+measure is repeated, the best and the median times are reported. The
+first repetition of the inferences also builds the imported modules,
+the best time excludes that. The inferences which crashed, instead of
+raising an ``AstroidError``, are counted by exception type and reported
+with the times. The results can be written as JSON and compared with the
+results of another run::
+
+    python benchmarks/phases.py --output before.json
+    python benchmarks/phases.py --compare before.json
+"""
+
+import argparse
+import collections
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+# Benchmark the astroid of this checkout, installed or not.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from astroid import builder
+from astroid import exceptions
+from astroid import nodes
+from astroid import rebuilder
+from astroid.__pkginfo__ import version as astroid_version
+
+# Bump when the layout of the results changes.
+RESULTS_FORMAT_VERSION = 1
+PHASES = ("parse", "rebuild", "transform", "infer")
+CORPORA = ("stdlib", "numpy", "hierarchy", "decorated")
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpus")
+STDLIB_MODULES = (
+    "argparse.py",
+    "ast.py",
+    "collections/__init__.py",
+    "configparser.py",
+    "email/message.py",
+    "functools.py",
+    "json/decoder.py",
+    "logging/__init__.py",
+    "os.py",
+    "pathlib.py",
+    "subprocess.py",
+    "textwrap.py",
+    "unittest/case.py",
+)
+HIERARCHY_DEPTH = 40
+
+
+def _class_hierarchy_source(depth):
+    """Get the source of a chain of *depth* classes overriding each other."""
+    lines = [
+        "class Base0:",
+        "    attribute0 = 0",
+        "    def __init__(self, value=0):",
+        "        self.value0 = value",
+        "    def compute(self, value):",
+        "        return value",
+    ]
+    for level in range(1, depth):
+        lines += [
+            f"class Base{level}(Base{level - 1}):",
+            f"    attribute{level} = {level}",
+            "    def __init__(self, value=0):",
+            "        super().__init__(value)",
+            f"        self.value{level} = value + {level}",
+            "    def compute(self, value):",
+            f"        return super().compute(value) + self.attribute{level}",
+            f"    def method{level}(self):",
+            f"        return self.value{level} + self.attribute{level // 2}",
+        ]
+    lines += [
+        f"LEAF = Base{depth - 1}(1)",
+        "RESULT = LEAF.compute(2)",
+        "ATTRIBUTE = LEAF.attribute0",
+        "VALUE = LEAF.value0",
+        "METHOD = LEAF.method1()",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def _read(path):
+    stream, _, data = builder.open_source_file(path)
+    stream.close()
+    return data
+
+
+def corpora():
+    """Get the corpora, as a mapping of their names to (name, source) pairs."""
+    stdlib = os.path.dirname(os.__file__)
+    return {
+        "stdlib": [
+            (name, _read(os.path.join(stdlib, name)))
+            for name in STDLIB_MODULES
+            if os.path.exists(os.path.join(stdlib, name))
+        ],
+        "numpy": [
+            ("numpy_heavy.py", _read(os.path.join(CORPUS_DIR, "numpy_heavy.py")))
+        ],
+        "hierarchy": [("class_hierarchy.py", _class_hierarchy_source(HIERARCHY_DEPTH))],
+        "decorated": [
+            ("decorated.py", _read(os.path.join(CORPUS_DIR, "decorated.py")))
+        ],
+    }
+
+
+def _timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def _modname(name):
+    return "benchmarked_" + os.path.splitext(name)[0].replace("/", "_")
+
+
+def _build(data, name):
+    """Build a module up to the transforms, which are left to the caller."""
+    astroid_builder = builder.AstroidBuilder(apply_transforms=False)
+    module = astroid_builder._data_build(data, _modname(name), name)
+    return astroid_builder._post_build(module, "utf-8")
+
+
+def _infer_all(module):
+    """Infer the nodes of *module*, counting the crashes by exception type."""
+    crashes = collections.Counter()
+    for node in module.nodes_of_class((nodes.Name, nodes.Call)):
+        try:
+            for _ in node.infer():
+                pass
+        except exceptions.AstroidError:
+            pass
+        except Exception as exc:  # pylint: disable=broad-except
+            # Such as imported modules which this version of astroid
+            # cannot rebuild.
+            crashes[type(exc).__name__] += 1
+    return crashes
+
+
+def _count_nodes(module):
+    count = 0
+    stack = [module]
+    while stack:
+        node = stack.pop()
+        count += 1
+        stack.extend(node.get_children())
+    return count
+
+
+def _run_once(sources):
+    """Time each phase once on the given sources, in seconds.
+
+    :returns: The times of the phases, and the crashes of the inferences.
+    :rtype: tuple(dict, collections.Counter)
+    """
+    manager = builder.MANAGER
+    times = dict.fromkeys(PHASES, 0.0)
+    crashes = collections.Counter()
+    for name, data in sources:
+        elapsed, (tree, parser_module) = _timed(builder._parse_string, data)
+        times["parse"] += elapsed
+        tree_builder = rebuilder.TreeRebuilder(manager, parser_module)
+        elapsed, _ = _timed(
+            tree_builder.visit_module, tree, _modname(name), name, False
+        )
+        times["rebuild"] += elapsed
+
+        module = _build(data, name)
+        elapsed, module = _timed(manager.visit_transforms, module)
+        times["transform"] += elapsed
+
+        module = manager.visit_transforms(_build(data, name))
+        elapsed, infer_crashes = _timed(_infer_all, module)
+        times["infer"] += elapsed
+        crashes.update(infer_crashes)
+    return times, crashes
+
+
+def _summary(samples):
+    return {"best": min(samples), "median": statistics.median(samples)}
+
+
+def run(repeat=5, names=None):
+    """Run the benchmarks on the corpora called *names*, all by default.
+
+    :returns: The results, as written by ``--output``.
+    :rtype: dict
+    """
+    manager = builder.MANAGER
+    bootstrap = [_timed(manager.bootstrap)[0] for _ in range(repeat)]
+    manager.clear_cache()
+
+    results = {}
+    for name, sources in corpora().items():
+        if names and name not in names:
+            continue
+        samples, crashes = zip(*(_run_once(sources) for _ in range(repeat)))
+        results[name] = {
+            "files": len(sources),
+            "lines": sum(data.count("\n") for _, data in sources),
+            "nodes": sum(_count_nodes(_build(data, path)) for path, data in sources),
+            "phases": {
+                phase: _summary([sample[phase] for sample in samples])
+                for phase in PHASES
+            },
+            # The first run also infers the imported modules.
+            "crashes": dict(crashes[0]),
+        }
+    return {
+        "format": RESULTS_FORMAT_VERSION,
+        "astroid": astroid_version,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "bootstrap": _summary(bootstrap),
+        "corpora": results,
+    }
+
+
+def _rows(results):
+    yield "bootstrap", "", results["bootstrap"]["best"]
+    for name, corpus in results["corpora"].items():
+        for phase in PHASES:
+            yield name, phase, corpus["phases"][phase]["best"]
+
+
+def report(results, baseline=None, stream=sys.stdout):
+    """Print the best times of *results*, compared to *baseline* if given."""
+    previous = {}
+    if baseline is not None:
+        previous = {(name, phase): best for name, phase, best in _rows(baseline)}
+    for name, phase, best in _rows(results):
+        line = f"{name:<12}{phase:<12}{best * 1000:>10.2f} ms"
+        before = previous.get((name, phase))
+        if before:
+            line += f"{before * 1000:>12.2f} ms{best / before:>8.2f}x"
+        print(line, file=stream)
+        if phase == "infer":
+            crashes = results["corpora"][name]["crashes"]
+            for error, count in sorted(crashes.items()):
+                print(f"{'':<24}{count:>10} crashes: {error}", file=stream)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="the number of runs of each phase"
+    )
+    parser.add_argument(
+        "--corpus",
+        action="append",
+        choices=CORPORA,
+        help="a corpus to benchmark, every corpus by default",
+    )
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument(
+        "--compare", help="compare with the results written to this file"
+    )
+    args = parser.parse_args(argv)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as stream:
+            baseline = json.load(stream)
+        if baseline.get("format") != RESULTS_FORMAT_VERSION:
+            parser.error(f"{args.compare} was written by another version")
+    results = run(args.repeat, args.corpus)
+    report(results, baseline)
+    if args.output:
+        with open(args.output, "w") as stream:
+            json.dump(results, stream, indent=2, sort_keys=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -385,10 +385,12 @@ class DefaultDictTest(unittest.TestCase):
 
 class ModuleExtenderTest(unittest.TestCase):
     def testExtensionModules(self):
+        MANAGER.brain_plugins.load_all()
         transformer = MANAGER._transform
-        for extender, _ in transformer.transforms[nodes.Module]:
-            n = nodes.Module("__main__", None)
-            extender(n)
+        for extenders in transformer.keyed_transforms[nodes.Module].values():
+            for extender, _ in extenders:
+                n = nodes.Module("__main__", None)
+                extender(n)
 
 
 @unittest.skipUnless(HAS_NOSE, "This test requires nose library.")
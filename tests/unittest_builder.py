@@ -21,6 +21,7 @@
 
 import builtins
 import collections
+import marshal
 import os
 import socket
 import sys
@@ -691,6 +692,228 @@ class FileBuildTest(unittest.TestCase):
             resources.build_file("data/invalid_encoding.py")
 
 
+class DumpLoadTest(unittest.TestCase):
+    def _rebuild(self, code):
+        astroid_builder = builder.AstroidBuilder(apply_transforms=False)
+        return astroid_builder._data_build(code, "dumped", "dumped.py")
+
+    def test_round_trip(self):
+        module = self._rebuild(
+            """
+import os
+from collections import *
+class A(object):
+    \"\"\"doc\"\"\"
+    def method(self, value=b"x", *args, key: int = 1.5j, **kwargs):
+        self.attr = {**kwargs, "key": ...}
+        return [item for item in args if item < value > key]
+first, second = os.sep, os.pathsep
+del os
+"""
+        )
+        loaded = builder.load(builder.dump(module))
+        self.assertIsNot(loaded, module)
+        self.assertEqual(loaded.as_string(), module.as_string())
+        self.assertEqual(loaded.name, "dumped")
+        self.assertIs(loaded.globals, loaded.locals)
+        self.assertEqual(sorted(loaded.locals), sorted(module.locals))
+        self.assertIs(loaded.locals["A"][0], loaded.body[2])
+        self.assertEqual(len(loaded._import_from_nodes), 1)
+        self.assertIs(loaded._import_from_nodes[0], loaded.body[1])
+        self.assertEqual(len(loaded._delayed_assattr), 1)
+        for original, node in zip(
+            module.nodes_of_class(nodes.ALL_NODE_CLASSES),
+            loaded.nodes_of_class(nodes.ALL_NODE_CLASSES),
+        ):
+            self.assertIs(type(node), type(original))
+            self.assertEqual(node.lineno, original.lineno)
+            self.assertEqual(node.col_offset, original.col_offset)
+            self.assertIs(node.root(), loaded)
+        targets = [node.targets[0] for node in (module.body[3], loaded.body[3])]
+        self.assertIs(targets[1].ctx, targets[0].ctx)
+
+    def test_loaded_tree_can_be_finished(self):
+        module = self._rebuild(
+            "class A:\n    def __init__(self):\n        self.a = 1\n"
+        )
+        loaded = builder.AstroidBuilder()._post_build(
+            builder.load(builder.dump(module)), "utf-8"
+        )
+        self.assertIn("a", loaded["A"].instance_attrs)
+        manager.AstroidManager().astroid_cache.pop("dumped", None)
+
+    def test_invalid_data(self):
+        with self.assertRaises(ValueError):
+            builder.load(b"garbage")
+        with self.assertRaises(ValueError):
+            builder.load(marshal.dumps((b"other", 1, (3, 0), [], [])))
+
+    def test_foreign_nodes(self):
+        module = self._rebuild("a = 1")
+        other = self._rebuild("b = 2")
+        module.locals["b"] = other.locals["b"]
+        with self.assertRaises(ValueError):
+            builder.dump(module)
+
+
+class LazyBodiesTest(unittest.TestCase):
+    CODE = """
+import os
+
+class A(object):
+    \"\"\"doc\"\"\"
+    attr = 1
+
+    def __init__(self, value):
+        from os import path
+        self.value = path.join(value)
+
+    @property
+    def prop(self):
+        return self.attr + 1
+
+def function(first, second=2):
+    result = first + second
+    return result
+
+def global_function():
+    global CONSTANT
+    CONSTANT = 1
+
+def one_liner(): return 42
+"""
+
+    def tearDown(self):
+        MANAGER.astroid_cache.pop("lazy", None)
+
+    def _build(self, lazy_bodies=True, apply_transforms=True):
+        astroid_builder = builder.AstroidBuilder(apply_transforms=apply_transforms)
+        module = astroid_builder._data_build(
+            self.CODE, "lazy", "lazy.py", lazy_bodies=lazy_bodies
+        )
+        return astroid_builder._post_build(module, "utf-8")
+
+    def test_bodies_are_built_on_access(self):
+        module = self._build()
+        function = module["function"]
+        self.assertIsNotNone(function._lazy_body)
+        self.assertIsNotNone(module["A"]._lazy_body)
+        self.assertEqual(function.args.as_string(), "first, second=2")
+        self.assertIsNotNone(function._lazy_body)
+        self.assertEqual(sorted(function.locals), ["first", "result", "second"])
+        self.assertIsNone(function._lazy_body)
+        self.assertEqual(len(function.body), 2)
+        for child in function.body:
+            self.assertIs(child.parent, function)
+
+    def test_same_tree_as_eager_build(self):
+        module = self._build()
+        eager = self._build(lazy_bodies=False)
+        self.assertEqual(module.as_string(), eager.as_string())
+        for node, original in zip(
+            module.nodes_of_class(nodes.ALL_NODE_CLASSES),
+            eager.nodes_of_class(nodes.ALL_NODE_CLASSES),
+        ):
+            self.assertIs(type(node), type(original))
+            self.assertEqual(node.lineno, original.lineno)
+            self.assertEqual(node.col_offset, original.col_offset)
+            self.assertEqual(node.tolineno, original.tolineno)
+        self.assertEqual(sorted(module["A"].locals), sorted(eager["A"].locals))
+
+    def test_bodies_which_are_not_lazy(self):
+        module = self._build()
+        self.assertIsNone(module["global_function"]._lazy_body)
+        self.assertIn("CONSTANT", module.locals)
+        self.assertIsNone(module["one_liner"]._lazy_body)
+
+    def test_instance_attrs(self):
+        klass = self._build()["A"]
+        self.assertEqual(list(klass.instance_attrs), ["value"])
+        self.assertIsNone(klass["__init__"]._lazy_body)
+        self.assertIn("path", klass["__init__"].locals)
+
+    def test_transforms_are_applied(self):
+        def transform(node):
+            node.value = 24
+
+        predicate = lambda node: node.value == 42
+        MANAGER.register_transform(nodes.Const, transform, predicate)
+        try:
+            module = self._build()
+        finally:
+            MANAGER.unregister_transform(nodes.Const, transform, predicate)
+        self.assertEqual(module["one_liner"].body[0].value.value, 24)
+        self.assertIsNotNone(module["function"]._lazy_body)
+
+    def test_inference(self):
+        module = self._build()
+        call = builder.extract_node("import lazy\nlazy.function(1)")
+        self.assertEqual(next(call.infer()).value, 3)
+        instance = next(builder.extract_node("import lazy\nlazy.A('a')").infer())
+        self.assertEqual(next(instance.igetattr("prop")).value, 2)
+        self.assertIn("value", module["A"].instance_attrs)
+
+    @staticmethod
+    def _parse_lazily(code):
+        MANAGER.lazy_bodies = True
+        try:
+            return builder.parse(code)
+        finally:
+            MANAGER.lazy_bodies = False
+
+    def test_class_attributes_assigned_in_methods(self):
+        module = self._parse_lazily(
+            """
+        class WebAppObject(object):
+            def registered(cls, application):
+                cls.appli = application
+                cls.schema = application.schema
+                return cls
+            registered = classmethod(registered)
+
+        class Other:
+            def setup(cls):
+                cls.attr = 2
+            setup = classmethod(setup)
+        """
+        )
+        klass = module["WebAppObject"]
+        self.assertIsNotNone(klass._lazy_body)
+        self.assertEqual(
+            sorted(klass.locals),
+            ["__module__", "__qualname__", "appli", "registered", "schema"],
+        )
+        self.assertEqual(len(module["Other"].getattr("attr")), 1)
+
+    def test_class_attributes_after_body_access(self):
+        klass = self._parse_lazily(
+            """
+        class A:
+            def setup(cls):
+                cls.attr = 1
+            setup = classmethod(setup)
+        """
+        )["A"]
+        self.assertEqual(len(klass.body), 2)
+        self.assertIn("attr", klass.locals)
+
+    def test_generic_slots(self):
+        node = self._parse_lazily(
+            """
+        from typing import Generic, TypeVar
+        T = TypeVar('T')
+        class A(Generic[T]):
+            __slots__ = ['value']
+            def __init__(self, value):
+                self.value = value
+        """
+        )["A"]
+        next(node.bases[0].infer())
+        slots = node.slots()
+        self.assertEqual([slot.value for slot in slots], ["value"])
+        self.assertIn("value", node.instance_attrs)
+
+
 def test_module_build_dunder_file():
     """Test that module_build() can work with modules that have the *__file__* attribute"""
     module = builder.AstroidBuilder().module_build(collections)
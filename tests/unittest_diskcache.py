@@ -0,0 +1,100 @@
+# Licensed under the LGPL: https://www.gnu.org/licenses/old-licenses/lgpl-2.1.en.html
+# For details: https://github.com/PyCQA/astroid/blob/master/LICENSE
+
+import os
+import shutil
+import tempfile
+import textwrap
+import unittest
+
+from astroid import builder
+from astroid import diskcache
+from astroid import manager
+from astroid import nodes
+
+
+class DiskCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.manager = manager.AstroidManager()
+        self.cache_dir = tempfile.mkdtemp()
+        self.source_dir = tempfile.mkdtemp()
+        self.cache = diskcache.DiskCache(self.cache_dir)
+        self.manager.disk_cache = self.cache
+
+    def tearDown(self):
+        self.manager.disk_cache = None
+        self.manager.astroid_cache.pop("cached_module", None)
+        shutil.rmtree(self.cache_dir)
+        shutil.rmtree(self.source_dir)
+
+    def _write(self, source):
+        path = os.path.join(self.source_dir, "cached_module.py")
+        with open(path, "w") as stream:
+            stream.write(textwrap.dedent(source))
+        return path
+
+    def _build(self, path):
+        return builder.AstroidBuilder(self.manager).file_build(path, "cached_module")
+
+    def test_hit_after_store(self):
+        path = self._write(
+            """
+        import os
+        class A:
+            def __init__(self):
+                self.attr = os.sep
+        value = A()
+        """
+        )
+        first = self._build(path)
+        self.assertEqual(self.cache.misses, 1)
+        second = self._build(path)
+        self.assertEqual(self.cache.hits, 1)
+        self.assertIsNot(first, second)
+        self.assertEqual(first.as_string(), second.as_string())
+        self.assertEqual(sorted(first.locals), sorted(second.locals))
+        for child in second.body:
+            self.assertIs(child.parent, second)
+        klass = second["A"]
+        self.assertIsInstance(klass, nodes.ClassDef)
+        self.assertIn("attr", klass.instance_attrs)
+        self.assertEqual(next(second["value"].infer()).pytype(), "cached_module.A")
+
+    def test_invalidated_on_change(self):
+        path = self._write("a = 1\n")
+        self._build(path)
+        path = self._write("a = 2\n")
+        module = self._build(path)
+        self.assertEqual(self.cache.hits, 0)
+        self.assertEqual(next(module["a"].infer()).value, 2)
+
+    def test_corrupted_entry_is_a_miss(self):
+        path = self._write("a = 1\n")
+        self._build(path)
+        for entry in self.cache.entries():
+            with open(entry["entry"], "wb") as stream:
+                stream.write(b"garbage")
+        module = self._build(path)
+        self.assertEqual(self.cache.hits, 0)
+        self.assertEqual(next(module["a"].infer()).value, 1)
+
+    def test_entries_and_prune(self):
+        path = self._write("a = 1\n")
+        self._build(path)
+        entries = list(self.cache.entries())
+        self.assertEqual(len(entries), 1)
+        self.assertEqual(entries[0]["modname"], "cached_module")
+        self.assertEqual(self.cache.prune(max_age=3600), 0)
+        self.assertEqual(self.cache.prune(max_size=0), 1)
+        self.assertEqual(list(self.cache.entries()), [])
+
+    def test_command_line(self):
+        path = self._write("a = 1\n")
+        self._build(path)
+        self.assertEqual(diskcache.main([self.cache_dir, "info"]), 0)
+        self.assertEqual(diskcache.main([self.cache_dir, "clear"]), 0)
+        self.assertEqual(list(self.cache.entries()), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
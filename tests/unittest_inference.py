@@ -38,6 +38,7 @@
 # pylint: disable=too-many-lines
 import platform
 import textwrap
+import threading
 from functools import partial
 import unittest
 from unittest.mock import patch
@@ -45,11 +46,12 @@ from unittest.mock import patch
 import pytest
 import sys
 
-from astroid import InferenceError, builder, nodes, Slice
+from astroid import InferenceError, MANAGER, builder, nodes, Slice
 from astroid.builder import parse, extract_node
 from astroid.inference import infer_end as inference_infer_end
 from astroid.bases import Instance, BoundMethod, UnboundMethod, BUILTINS
 from astroid import arguments
+from astroid import context as contextmod
 from astroid import decorators as decoratorsmod
 from astroid import exceptions
 from astroid import helpers
@@ -5962,5 +5964,199 @@ def test_infer_list_of_uninferables_does_not_crash():
     assert not inferred.elts
 
 
+def test_context_free_inference_is_memoized():
+    node = extract_node(
+        """
+    def f(value):
+        return value + 1
+    f(1) #@
+    """
+    )
+    memo = MANAGER.inference_memo
+    return_value = node.inferred()[0]
+    assert return_value.value == 2
+    assert memo.get(None, node) == (return_value,)
+    # The nodes inferred inside the call depend on its arguments.
+    function = next(node.func.infer())
+    assert memo.get(None, function.body[0].value) is None
+    with patch.object(nodes.Call, "_infer_in_context") as infer:
+        assert node.inferred() == [return_value]
+    infer.assert_not_called()
+
+
+@pytest.mark.parametrize("call_first", [False, True])
+def test_memoized_inference_does_not_depend_on_order(call_first):
+    module = parse(
+        """
+    class Message:
+        def __init__(self, policy=None):
+            self.policy = policy
+
+        def make_part(self):
+            part = type(self)(policy=self.policy)
+            part._headers = []
+            return part
+    """
+    )
+    method = module["Message"]["make_part"]
+    call = method.body[0].value
+    name = method.body[-1].value
+    if call_first:
+        call.inferred()
+    inferred = name.inferred()
+    assert len(inferred) == 1
+    assert isinstance(inferred[0], Instance)
+    assert inferred[0].name == "Message"
+
+
+def test_inference_is_memoized_while_another_one_is_suspended():
+    first, second = extract_node(
+        """
+    a = 1
+    b = 2
+    a #@
+    b #@
+    """
+    )
+    results = first.infer()
+    assert next(results).value == 1
+    assert second.inferred()[0].value == 2
+    assert MANAGER.inference_memo.get(None, second) is not None
+    assert list(results) == []
+    assert MANAGER.inference_memo.get(None, first) is not None
+
+
+def test_inference_is_memoized_after_a_generator_closed_on_another_thread():
+    first, second = extract_node(
+        """
+    a = 1
+    b = 2
+    a #@
+    b #@
+    """
+    )
+    results = first.infer()
+    next(results)
+    thread = threading.Thread(target=results.close)
+    thread.start()
+    thread.join()
+    assert second.inferred()[0].value == 2
+    assert MANAGER.inference_memo.get(None, second) is not None
+
+
+def test_inference_memo_can_be_disabled():
+    node = extract_node("a = 1\na #@")
+    MANAGER.memoize_inference = False
+    try:
+        assert node.inferred()[0].value == 1
+    finally:
+        MANAGER.memoize_inference = True
+    assert MANAGER.inference_memo.get(None, node) is None
+
+
+EXPLODING_CODE = """
+import random
+choice = random.random()
+value0 = 1 if choice else 2
+""" + "".join(
+    f"value{i} = (value{i - 1} if choice else -value{i - 1}) + value{i - 1}\n"
+    for i in range(1, 8)
+)
+
+
+def _infer_exploding(budget):
+    module = parse(EXPLODING_CODE, "exploding")
+    context = contextmod.InferenceContext(budget=budget)
+    return module, list(module["value7"].infer(context))
+
+
+def test_inference_budget_visits():
+    expected = parse(EXPLODING_CODE)["value7"].inferred()
+    budget = contextmod.InferenceBudget(max_visits=20)
+    module, inferred = _infer_exploding(budget)
+    assert budget.exhausted
+    assert budget.visits == 21
+    assert budget.depth == 0
+    assert util.Uninferable in inferred
+    assert MANAGER.budget_exhaustions["exploding", 11, "AssignName"] >= 1
+    # The partial results were not cached.
+    assert len(module["value7"].inferred()) == len(expected)
+
+    budget = contextmod.InferenceBudget(max_visits=100000)
+    _, inferred = _infer_exploding(budget)
+    assert not budget.exhausted
+    assert len(inferred) == len(expected)
+
+
+def test_inference_budget_depth_and_timeout():
+    budget = contextmod.InferenceBudget(max_depth=3)
+    _, inferred = _infer_exploding(budget)
+    assert budget.exhausted
+    assert inferred == [util.Uninferable]
+    budget = contextmod.InferenceBudget(timeout=-1)
+    _, inferred = _infer_exploding(budget)
+    assert budget.exhausted
+    assert budget.visits == 1
+
+
+def test_manager_inference_budget():
+    node = extract_node("a = 1\nb = a\nb #@")
+    MANAGER.inference_budget = contextmod.InferenceBudget(max_visits=1)
+    try:
+        assert node.inferred() == [util.Uninferable]
+        # Every top-level inference spends a copy of the budget.
+        assert not MANAGER.inference_budget.exhausted
+    finally:
+        MANAGER.inference_budget = None
+    assert node.inferred()[0].value == 1
+
+
+def test_inference_budget_is_not_spent_by_the_caller():
+    first, second = extract_node("a = 1\nb = 2\na #@\nb #@")
+    budget = contextmod.InferenceBudget(max_visits=3)
+    for inferred in first.infer(contextmod.InferenceContext(budget=budget)):
+        assert contextmod.active_budget() is None
+        # Inferring another node meanwhile spends nothing.
+        assert second.inferred()[0].value == 2
+        assert inferred.value == 1
+    assert budget.visits <= 3
+    assert not budget.exhausted
+
+
+def test_inference_budget_restores_the_active_one():
+    node = extract_node("a = 1\na #@")
+    budget = contextmod.InferenceBudget(max_visits=3)
+    results = node.infer(contextmod.InferenceContext(budget=budget))
+    # Advanced while another top-level inference runs.
+    outer = contextmod.InferenceBudget()
+    contextmod._ACTIVE.budget = outer
+    try:
+        assert next(results).value == 1
+        assert contextmod.active_budget() is outer
+    finally:
+        contextmod._ACTIVE.budget = None
+
+
+def test_exhausted_budget_does_not_poison_caches():
+    code = """
+    class mystatic(staticmethod):
+        pass
+    class A:
+        @mystatic
+        def m():
+            pass
+    A().m #@
+    """
+    node = extract_node(code)
+    budget = contextmod.InferenceBudget(max_visits=5)
+    list(node.infer(contextmod.InferenceContext(budget=budget)))
+    assert budget.exhausted
+    # Values computed with inferences cut short are not cached.
+    assert node.root()["A"]["m"].type == "staticmethod"
+    inferred = node.inferred()
+    assert len(inferred) == 1
+    assert isinstance(inferred[0], nodes.FunctionDef)
+
+
 if __name__ == "__main__":
     unittest.main()
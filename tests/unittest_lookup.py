@@ -15,9 +15,11 @@
 """
 import functools
 import unittest
+from unittest import mock
 
 from astroid import builder
 from astroid import exceptions
+from astroid import node_classes
 from astroid import nodes
 from astroid import scoped_nodes
 from . import resources
@@ -354,6 +356,51 @@ class LookupTest(resources.SysPathSetup, unittest.TestCase):
         stmts = astroid["run1"].lookup("Frobbel")[1]
         self.assertEqual(len(stmts), 0)
 
+    def test_lookup_table(self):
+        module = builder.parse(
+            """
+            a = 1
+            print(a)
+            a = 2
+            def func():
+                return a
+        """
+        )
+        first = module.body[1].value.args[0]
+        name = module.body[3].body[0].value
+        self.assertEqual(first.lookup("a")[1], [module.body[0].targets[0]])
+        self.assertEqual(name.lookup("a")[1], [module.body[2].targets[0]])
+        # The table of the assignments is kept by the scope.
+        (table,) = module._cache["_lookup_tables"].values()
+        self.assertIs(table.stmts, module.locals["a"])
+        self.assertEqual(len(table.results), 2)
+        self.assertIs(name.lookup("a")[1], name.lookup("a")[1])
+        # It is built again when an assignment is added to the scope.
+        assign = builder.extract_node("a = 3")
+        module.set_local("a", assign.targets[0])
+        self.assertEqual(
+            name.lookup("a")[1], [module.body[2].targets[0], assign.targets[0]]
+        )
+        (table,) = module._cache["_lookup_tables"].values()
+        self.assertEqual(len(table.entries), 3)
+        self.assertEqual(len(table.results), 1)
+
+    def test_lookup_table_results_are_bounded(self):
+        module = builder.parse(
+            """
+            a = 1
+            print(a)
+            print(a)
+        """
+        )
+        first = module.body[1].value.args[0]
+        second = module.body[2].value.args[0]
+        with mock.patch.object(node_classes._LookupTable, "max_results", 1):
+            self.assertEqual(first.lookup("a")[1], [module.body[0].targets[0]])
+            self.assertEqual(second.lookup("a")[1], [module.body[0].targets[0]])
+        (table,) = module._cache["_lookup_tables"].values()
+        self.assertEqual(list(table.results), [(first, 0)])
+
 
 if __name__ == "__main__":
     unittest.main()
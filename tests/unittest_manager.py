@@ -20,17 +20,26 @@
 
 import builtins
 import os
+import pickle
 import platform
+import shutil
 import site
 import sys
+import tempfile
+import textwrap
+import threading
 import unittest
+from unittest import mock
 
 import pkg_resources
 import time
 
 import astroid
+from astroid import builder
+from astroid import diskcache
 from astroid import exceptions
 from astroid import manager
+from astroid import modulecache
 from . import resources
 
 
@@ -295,6 +304,541 @@ class AstroidManagerTest(
         del self.manager._failed_import_hooks[0]
 
 
+class InvalidateModuleTest(unittest.TestCase):
+    def setUp(self):
+        self.manager = manager.AstroidManager()
+        self.directory = tempfile.mkdtemp()
+        sys.path.insert(0, self.directory)
+
+    def tearDown(self):
+        sys.path.remove(self.directory)
+        shutil.rmtree(self.directory)
+        for name in ("inv_base", "inv_user", "inv_star", "inv_unrelated"):
+            self.manager.invalidate_module(name)
+
+    def _write(self, modname, source):
+        with open(os.path.join(self.directory, modname + ".py"), "w") as stream:
+            stream.write(textwrap.dedent(source))
+
+    def test_invalidated_module_is_rebuilt(self):
+        self._write("inv_base", "VALUE = 1\n")
+        self._write("inv_user", "from inv_base import VALUE\nresult = VALUE\n")
+        self._write("inv_unrelated", "other = 1\n")
+        user = self.manager.ast_from_module_name("inv_user")
+        unrelated = self.manager.ast_from_module_name("inv_unrelated")
+        self.assertEqual(next(user["result"].infer()).value, 1)
+
+        self._write("inv_base", "VALUE = 2\n")
+        self.manager.invalidate_module("inv_base")
+        self.assertNotIn("inv_base", self.manager.astroid_cache)
+        # Dependents are kept, but their inference results are recomputed.
+        self.assertIs(self.manager.ast_from_module_name("inv_user"), user)
+        self.assertIs(self.manager.ast_from_module_name("inv_unrelated"), unrelated)
+        self.assertEqual(next(user["result"].infer()).value, 2)
+
+    def test_wildcard_importers_are_invalidated(self):
+        self._write("inv_base", "VALUE = 1\n")
+        self._write("inv_star", "from inv_base import *\n")
+        self._write("inv_user", "import inv_star\nresult = inv_star.VALUE\n")
+        user = self.manager.ast_from_module_name("inv_user")
+        self.assertEqual(next(user["result"].infer()).value, 1)
+
+        self._write("inv_base", "OTHER = 2\nVALUE = 3\n")
+        self.manager.invalidate_module("inv_base")
+        self.assertNotIn("inv_star", self.manager.astroid_cache)
+        self.assertIn("inv_user", self.manager.astroid_cache)
+        self.assertEqual(next(user["result"].infer()).value, 3)
+        star = self.manager.ast_from_module_name("inv_star")
+        self.assertIn("OTHER", star.locals)
+
+    def test_cached_mro_is_recomputed(self):
+        self._write("inv_base", "class Base:\n    pass\n")
+        self._write("inv_user", "import inv_base\nclass A(inv_base.Base):\n    pass\n")
+        klass = self.manager.ast_from_module_name("inv_user")["A"]
+        self.assertEqual([cls.name for cls in klass.mro()], ["A", "Base", "object"])
+
+        self._write(
+            "inv_base", "class Parent:\n    pass\nclass Base(Parent):\n    pass\n"
+        )
+        self.manager.invalidate_module("inv_base")
+        self.assertEqual(
+            [cls.name for cls in klass.mro()], ["A", "Base", "Parent", "object"]
+        )
+        self.assertEqual(
+            [cls.name for cls in klass.ancestors()], ["Base", "Parent", "object"]
+        )
+
+    def test_foreign_attributes_are_removed(self):
+        self._write("inv_base", "class A:\n    pass\n")
+        self._write(
+            "inv_user",
+            """
+        import inv_base
+        inv_base.A.attr = 1
+        """,
+        )
+        self.manager.ast_from_module_name("inv_user")
+        klass = self.manager.ast_from_module_name("inv_base")["A"]
+        self.assertIn("attr", klass.locals)
+        self.manager.invalidate_module("inv_user")
+        self.assertNotIn("attr", klass.locals)
+
+    def test_foreign_attributes_are_inferred_once_assigned(self):
+        self._write(
+            "inv_base", "class C:\n    pass\nc = C()\nc.attr = 1\nresult = c.attr\n"
+        )
+        self._write("inv_star", "import inv_base\nresult = inv_base.c.attr\n")
+        self._write("inv_user", "import inv_base\ninv_base.c.attr = 's'\n")
+        base = self.manager.ast_from_module_name("inv_base")
+        star = self.manager.ast_from_module_name("inv_star")
+        self.assertEqual([value.value for value in base["result"].infer()], [1])
+        self.assertEqual([value.value for value in star["result"].infer()], [1])
+        self.manager.ast_from_module_name("inv_user")
+        self.assertEqual([value.value for value in base["result"].infer()], [1, "s"])
+        self.assertEqual([value.value for value in star["result"].infer()], [1, "s"])
+
+    def test_lookup_tables_follow_the_rebuilt_foreign_attributes(self):
+        self._write("inv_base", "class A:\n    attr = 0\n    value = attr\n")
+        self._write("inv_user", "import inv_base\ninv_base.A.attr = 1\n")
+        self.manager.ast_from_module_name("inv_user")
+        klass = self.manager.ast_from_module_name("inv_base")["A"]
+        name = klass.body[1].value
+        old = klass.locals["attr"][1]
+        name.lookup("attr")
+        self.manager.invalidate_module("inv_user")
+        self.manager.ast_from_module_name("inv_user")
+        # The assignment was replaced, the number of assignments is the same.
+        new = klass.locals["attr"][1]
+        self.assertIsNot(new, old)
+        name.lookup("attr")
+        (table,) = klass._cache["_lookup_tables"].values()
+        self.assertEqual([entry[0] for entry in table.entries], klass.locals["attr"])
+
+    def test_imports_are_forgotten_with_the_cache(self):
+        self._write("inv_base", "VALUE = 1\n")
+        self._write("inv_user", "from inv_base import VALUE\nresult = VALUE\n")
+        isolated = manager.AstroidManager(isolated=True)
+        user = isolated.ast_from_module_name("inv_user")
+        self.assertEqual(next(user["result"].infer()).value, 1)
+        importers_of = isolated._import_graph.importers_of
+        self.assertEqual(importers_of("inv_base"), {"inv_user"})
+        isolated.clear_cache()
+        self.assertEqual(importers_of("inv_base"), set())
+
+
+class ModuleFilesTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.package = os.path.join(self.directory, "package")
+        os.mkdir(self.package)
+        for name in ("mf_found.py", os.path.join("package", "mf_sibling.py")):
+            with open(os.path.join(self.directory, name), "w"):
+                pass
+        self._age()
+        self.manager = manager.AstroidManager(isolated=True)
+        self.manager.search_path = [self.directory]
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def _age(self, seconds=1):
+        # Old enough for their listings to be trusted.
+        for path in (self.package, self.directory):
+            os.utime(path, (seconds, seconds))
+
+    def test_siblings_share_the_module_files(self):
+        for name in ("first.py", "second.py"):
+            found = self.manager.file_from_module_name(
+                "mf_found", os.path.join(self.package, name)
+            )
+            self.assertEqual(
+                found.location, os.path.join(self.directory, "mf_found.py")
+            )
+        self.assertEqual(
+            set(self.manager._mod_file_cache),
+            {("mf_found", self.package), ("mf_found", None)},
+        )
+        found = self.manager.file_from_module_name(
+            "mf_sibling", os.path.join(self.package, "first.py")
+        )
+        self.assertEqual(found.location, os.path.join(self.package, "mf_sibling.py"))
+
+    def test_search_path_change_forgets_the_module_files(self):
+        self.manager.search_path = None
+        with self.assertRaises(exceptions.AstroidImportError):
+            self.manager.file_from_module_name("mf_found", None)
+        sys.path.append(self.directory)
+        try:
+            found = self.manager.file_from_module_name("mf_found", None)
+        finally:
+            sys.path.remove(self.directory)
+        self.assertEqual(found.location, os.path.join(self.directory, "mf_found.py"))
+
+    def test_save_and_load_module_files(self):
+        filename = os.path.join(self.directory, "module_files")
+        self.assertEqual(self.manager.load_module_files(filename), 0)
+        self.manager.file_from_module_name("mf_found", None)
+        with self.assertRaises(exceptions.AstroidImportError):
+            self.manager.file_from_module_name("mf_missing", None)
+        self.manager.save_module_files(filename)
+        self._age()
+
+        other = manager.AstroidManager(isolated=True)
+        other.search_path = [self.directory]
+        self.assertEqual(other.load_module_files(filename), 2)
+        with mock.patch.object(
+            manager.modutils, "file_info_from_modpath", side_effect=AssertionError
+        ):
+            found = other.file_from_module_name("mf_found", None)
+            with self.assertRaises(exceptions.AstroidImportError):
+                other.file_from_module_name("mf_missing", None)
+        self.assertEqual(found.location, os.path.join(self.directory, "mf_found.py"))
+
+        # Not loaded once the directories listed to find them are modified.
+        with open(os.path.join(self.directory, "mf_missing.py"), "w"):
+            pass
+        self._age(2)
+        other = manager.AstroidManager(isolated=True)
+        other.search_path = [self.directory]
+        self.assertEqual(other.load_module_files(filename), 0)
+        found = other.file_from_module_name("mf_missing", None)
+        self.assertEqual(found.location, os.path.join(self.directory, "mf_missing.py"))
+        other.search_path = [self.package]
+        self.assertEqual(other.load_module_files(filename), 0)
+
+
+class BuildManyTest(unittest.TestCase):
+    def setUp(self):
+        self.manager = manager.AstroidManager()
+        self.directory = tempfile.mkdtemp()
+        sys.path.insert(0, self.directory)
+
+    def tearDown(self):
+        sys.path.remove(self.directory)
+        shutil.rmtree(self.directory)
+        for name in ("many_first", "many_second", "many_broken"):
+            self.manager.astroid_cache.pop(name, None)
+
+    def _write(self, modname, source):
+        path = os.path.join(self.directory, modname + ".py")
+        with open(path, "w") as stream:
+            stream.write(textwrap.dedent(source))
+        return path
+
+    def _check_build_many(self, workers):
+        first = self._write("many_first", "VALUE = 1\n")
+        second = self._write(
+            "many_second",
+            """
+        from many_first import VALUE
+        class A:
+            def __init__(self):
+                self.attr = VALUE
+        """,
+        )
+        broken = self._write("many_broken", "def broken(:\n")
+        results = self.manager.build_many([first, second, broken], workers=workers)
+        self.assertEqual(len(results), 3)
+        self.assertIsInstance(results[broken], exceptions.AstroidSyntaxError)
+        module = results[second]
+        self.assertIs(self.manager.astroid_cache["many_second"], module)
+        self.assertIs(self.manager.astroid_cache["many_first"], results[first])
+        attr = module["A"].instance_attrs["attr"][0]
+        self.assertEqual(next(attr.infer()).value, 1)
+        # Cached modules are not built again.
+        self.assertIs(
+            self.manager.build_many([second], workers=workers)[second], module
+        )
+
+    def test_build_many(self):
+        self._check_build_many(workers=2)
+
+    def test_build_many_in_process(self):
+        self._check_build_many(workers=1)
+
+    def test_unexpected_errors_are_returned_per_path(self):
+        first = self._write("many_first", "VALUE = 1\n")
+        broken = self._write("many_broken", "VALUE = 2\n")
+        file_tree = builder.AstroidBuilder._file_tree
+
+        def failing_file_tree(self, path, modname=None, lazy_bodies=None):
+            if modname == "many_broken":
+                raise AttributeError("no visitor")
+            return file_tree(self, path, modname, lazy_bodies)
+
+        with mock.patch.object(builder.AstroidBuilder, "_file_tree", failing_file_tree):
+            result = builder._build_in_worker(broken, "many_broken")
+            self.assertEqual(result, (None, "AttributeError: no visitor"))
+            results = self.manager.build_many([first, broken], workers=1)
+        self.assertEqual(results[first].name, "many_first")
+        self.assertIsInstance(results[broken], exceptions.AstroidBuildingError)
+        self.assertIn("no visitor", str(results[broken]))
+        # As sent back by a worker.
+        error = self.manager._finish_build(broken, "many_broken", result)
+        self.assertIsInstance(error, exceptions.AstroidBuildingError)
+        self.assertIn("AttributeError: no visitor", str(error))
+        self.assertNotIn("many_broken", self.manager.astroid_cache)
+
+    def test_workers_are_configured_like_the_manager(self):
+        isolated = manager.AstroidManager(isolated=True)
+        cache_directory = os.path.join(self.directory, "cache")
+        isolated.disk_cache = diskcache.DiskCache(cache_directory)
+        paths = [
+            self._write("many_first", "VALUE = 1\n"),
+            self._write("many_second", "OTHER = 2\n"),
+        ]
+        results = isolated.build_many(paths, workers=2)
+        self.assertEqual(
+            sorted(module.name for module in results.values()),
+            ["many_first", "many_second"],
+        )
+        # The trees were stored by the workers, in the cache of the manager.
+        self.assertEqual(len(list(isolated.disk_cache.entries())), 2)
+        self.assertNotIn("many_first", self.manager.astroid_cache)
+
+
+class IsolatedManagerTest(unittest.TestCase):
+    def setUp(self):
+        self.directories = [tempfile.mkdtemp(), tempfile.mkdtemp()]
+        self.managers = []
+        for directory, value in zip(self.directories, (1, 2)):
+            with open(os.path.join(directory, "iso_base.py"), "w") as stream:
+                stream.write(f"VALUE = {value}\n")
+            with open(os.path.join(directory, "iso_user.py"), "w") as stream:
+                stream.write("import iso_base\nresult = iso_base.VALUE\n")
+            isolated = manager.AstroidManager(isolated=True)
+            isolated.search_path = [directory]
+            self.managers.append(isolated)
+
+    def tearDown(self):
+        for directory in self.directories:
+            shutil.rmtree(directory)
+
+    def test_separate_caches_and_search_paths(self):
+        shared = manager.AstroidManager()
+        values = []
+        for isolated in self.managers:
+            self.assertTrue(isolated.isolated)
+            user = isolated.ast_from_module_name("iso_user")
+            self.assertIs(user.manager, isolated)
+            self.assertIs(user["result"].manager, isolated)
+            values += [inferred.value for inferred in user["result"].infer()]
+            self.assertIn("iso_base", isolated.astroid_cache)
+            self.assertGreater(len(isolated.inference_memo), 0)
+        self.assertEqual(values, [1, 2])
+        self.assertFalse(shared.isolated)
+        self.assertNotIn("iso_base", shared.astroid_cache)
+        with self.assertRaises(exceptions.AstroidImportError):
+            shared.ast_from_module_name("iso_user")
+
+    def test_builtins_are_shared(self):
+        shared = manager.AstroidManager()
+        for isolated in self.managers:
+            self.assertIs(isolated.builtins_module, shared.builtins_module)
+            builtins_module = isolated.ast_from_module_name(BUILTINS)
+            self.assertIs(builtins_module, shared.builtins_module)
+
+    def test_separate_transforms(self):
+        first, second = self.managers
+
+        def transform(node):
+            node.locals["transformed"] = []
+
+        first.register_transform(astroid.Module, transform, key="iso_base")
+        self.assertIn("transformed", first.ast_from_module_name("iso_base").locals)
+        self.assertNotIn("transformed", second.ast_from_module_name("iso_base").locals)
+        shared_module = astroid.parse("", "iso_base")
+        self.assertNotIn("transformed", shared_module.locals)
+
+    def test_brain_transforms_are_copied(self):
+        isolated = self.managers[0]
+        module = builder.AstroidBuilder(isolated).string_build(
+            "import collections\nPoint = collections.namedtuple('Point', 'x y')"
+        )
+        inferred = next(module["Point"].infer())
+        self.assertEqual(inferred.name, "Point")
+        self.assertGreater(len(isolated.inference_tip_cache), 0)
+
+    def test_brainless_manager(self):
+        brainless = manager.AstroidManager(isolated=True, with_brain=False)
+        self.assertIsNone(brainless.brain_plugins)
+        self.assertEqual(brainless._failed_import_hooks, [])
+        module = builder.AstroidBuilder(brainless).string_build(
+            "import collections\nPoint = collections.namedtuple('Point', 'x y')"
+        )
+        inferred = next(module["Point"].infer())
+        self.assertNotEqual(inferred.name, "Point")
+        self.assertEqual(len(brainless.inference_tip_cache), 0)
+        with self.assertRaises(ValueError):
+            manager.AstroidManager(with_brain=False)
+
+    def test_generator_cache_belongs_to_the_manager(self):
+        isolated = self.managers[0]
+        module = builder.AstroidBuilder(isolated).string_build(
+            "class A:\n    @property\n    def prop(self):\n        return 1"
+        )
+        inferred = next(module["A"]["prop"].infer())
+        self.assertEqual(inferred.name, "prop")
+        self.assertEqual(len(isolated.inference_generator_cache), 1)
+        isolated.clear_cache()
+        self.assertEqual(len(isolated.inference_generator_cache), 0)
+
+    def test_nodes_record_the_manager_of_their_module(self):
+        isolated = self.managers[0]
+        module = builder.AstroidBuilder(isolated).string_build("def f():\n    x = 1")
+        name = module["f"].body[0].targets[0]
+        self.assertIs(name.manager, isolated)
+        self.assertIs(name._manager, isolated)
+        self.assertIs(module["f"]._manager, isolated)
+        # Nothing is recorded before the module is cached.
+        unbound = builder.AstroidBuilder(isolated)._data_build("x = 1", "unbound", None)
+        name = unbound.body[0].targets[0]
+        self.assertFalse(name.manager.isolated)
+        self.assertIsNone(name._manager)
+
+    def test_pickled_modules_fall_back_to_the_shared_manager(self):
+        for source_manager in (manager.AstroidManager(), self.managers[0]):
+            module = builder.AstroidBuilder(source_manager).string_build("x = 1")
+            self.assertIs(module.manager, source_manager)
+            loaded = pickle.loads(pickle.dumps(module))
+            self.assertIsNot(loaded, module)
+            self.assertFalse(loaded.manager.isolated)
+            self.assertEqual(next(loaded["x"].infer()).value, 1)
+
+    def test_brain_nodes_belong_to_the_isolated_manager(self):
+        isolated = manager.AstroidManager(isolated=True)
+        module = builder.AstroidBuilder(isolated).string_build(
+            "import typing\nT = typing.TypeVar('T')"
+        )
+        inferred = next(module["T"].infer())
+        self.assertIsInstance(inferred, astroid.ClassDef)
+        self.assertIs(inferred.manager, isolated)
+        self.assertIsNone(manager.acting_manager())
+
+
+class ThreadSafeManagerTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        with open(os.path.join(self.directory, "ts_base.py"), "w") as stream:
+            stream.write("class Base:\n    def method(self):\n        return 1\n")
+        with open(os.path.join(self.directory, "ts_user.py"), "w") as stream:
+            stream.write("import ts_base\nresult = ts_base.Base().method()\n")
+        self.manager = manager.AstroidManager(isolated=True)
+        self.manager.search_path = [self.directory]
+        self.manager.thread_safe = True
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def _run_threads(self, target, count=8):
+        barrier = threading.Barrier(count)
+        results = [None] * count
+
+        def run(index):
+            barrier.wait()
+            results[index] = target()
+
+        threads = [threading.Thread(target=run, args=(i,)) for i in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_caches_share_the_lock(self):
+        self.assertTrue(self.manager.thread_safe)
+        self.assertFalse(manager.AstroidManager().thread_safe)
+        lock = self.manager.astroid_cache.lock
+        self.assertIsNot(lock, modulecache.NO_LOCK)
+        self.assertIs(self.manager.inference_tip_cache.lock, lock)
+        self.assertIs(self.manager.inference_memo.lock, lock)
+        self.assertIs(self.manager.inference_generator_cache.lock, lock)
+        self.manager.thread_safe = False
+        self.assertIs(self.manager.astroid_cache.lock, modulecache.NO_LOCK)
+
+    def test_module_is_built_once(self):
+        built = []
+        self.manager.register_transform(astroid.Module, built.append, key="ts_base")
+        modules = self._run_threads(
+            lambda: self.manager.ast_from_module_name("ts_base")
+        )
+        self.assertEqual(len(built), 1)
+        self.assertTrue(all(module is built[0] for module in modules))
+
+    def test_modules_are_given_once_transformed(self):
+        cached = threading.Event()
+
+        def transform(module):
+            cached.set()
+            time.sleep(0.1)
+            module.transformed = True
+
+        self.manager.register_transform(astroid.Module, transform, key="ts_base")
+        building = threading.Thread(
+            target=self.manager.ast_from_module_name, args=("ts_base",)
+        )
+        building.start()
+        self.assertTrue(cached.wait(5))
+        module = self.manager.ast_from_module_name("ts_base")
+        self.assertTrue(getattr(module, "transformed", False))
+        building.join()
+
+    def test_circular_imports_between_threads(self):
+        for name, imported in (("ts_first", "ts_second"), ("ts_second", "ts_first")):
+            with open(os.path.join(self.directory, name + ".py"), "w") as stream:
+                stream.write("value = 1\n")
+        barrier = threading.Barrier(2, timeout=5)
+        imports = {}
+
+        def importing(imported):
+            def transform(module):
+                # Both modules are cached and being transformed.
+                barrier.wait()
+                imports[module.name] = self.manager.ast_from_module_name(imported)
+
+            return transform
+
+        self.manager.register_transform(
+            astroid.Module, importing("ts_second"), key="ts_first"
+        )
+        self.manager.register_transform(
+            astroid.Module, importing("ts_first"), key="ts_second"
+        )
+        threads = [
+            threading.Thread(target=self.manager.ast_from_module_name, args=(name,))
+            for name in ("ts_first", "ts_second")
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+            self.assertFalse(thread.is_alive())
+        self.assertEqual(sorted(imports), ["ts_first", "ts_second"])
+
+    def test_concurrent_inference(self):
+        user = self.manager.ast_from_module_name("ts_user")
+        results = self._run_threads(lambda: list(user["result"].infer()))
+        for inferred in results:
+            self.assertEqual([const.value for const in inferred], [1])
+        self.assertIs(self.manager.astroid_cache["ts_user"], user)
+
+    def test_bodies_are_not_lazy(self):
+        self.manager.lazy_bodies = True
+        module = self.manager.ast_from_module_name("ts_base")
+        self.assertIsNone(module["Base"]._lazy_body)
+
+    def test_relative_resolution_keeps_working_directory(self):
+        context = os.path.join(self.directory, "package")
+        os.mkdir(context)
+        with open(os.path.join(context, "ts_sibling.py"), "w") as stream:
+            stream.write("sibling = True\n")
+        context_file = os.path.join(context, "ts_context.py")
+        with mock.patch("os.chdir", side_effect=AssertionError):
+            module = self.manager.ast_from_module_name("ts_sibling", context_file)
+        self.assertEqual(module.file, os.path.join(context, "ts_sibling.py"))
+        self.assertIn("sibling", module.locals)
+
+
 class BorgAstroidManagerTC(unittest.TestCase):
     def test_borg(self):
         """test that the AstroidManager is really a borg, i.e. that two different
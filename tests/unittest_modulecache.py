@@ -0,0 +1,258 @@
+# Licensed under the LGPL: https://www.gnu.org/licenses/old-licenses/lgpl-2.1.en.html
+# For details: https://github.com/PyCQA/astroid/blob/master/LICENSE
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+
+import astroid
+from astroid import builder
+from astroid import manager
+from astroid import modulecache
+
+
+def _module(name, source="a = 1"):
+    return builder.AstroidBuilder(apply_transforms=False)._data_build(
+        source, name, None
+    )
+
+
+class ModuleCacheTest(unittest.TestCase):
+    def test_unbounded_by_default(self):
+        cache = modulecache.ModuleCache()
+        for index in range(50):
+            cache["mod%d" % index] = _module("mod%d" % index)
+        self.assertEqual(len(cache), 50)
+        self.assertEqual(cache.evictions, 0)
+
+    def test_hits_and_misses(self):
+        cache = modulecache.ModuleCache()
+        cache["mod"] = module = _module("mod")
+        self.assertIs(cache.get("mod"), module)
+        self.assertIsNone(cache.get("missing"))
+        self.assertIn("mod", cache)
+        self.assertNotIn("missing", cache)
+        self.assertIs(cache.peek("mod"), module)
+        self.assertIsNone(cache.peek("missing"))
+        stats = cache.stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["size"], 1)
+
+    def test_lru_policy(self):
+        cache = modulecache.ModuleCache(policy=modulecache.LRUPolicy(2))
+        cache["builtins"] = _module("builtins")
+        cache["first"] = _module("first")
+        cache["second"] = _module("second")
+        cache.get("first")
+        cache["third"] = _module("third")
+        self.assertEqual(sorted(cache), ["builtins", "first", "third"])
+        self.assertEqual(cache.evictions, 1)
+
+    def test_size_policy(self):
+        cache = modulecache.ModuleCache(policy=modulecache.SizePolicy(10))
+        cache["small"] = _module("small")
+        cache["large"] = _module("large", "a = 1\nb = 2\nc = [1, 2, 3, 4, 5]")
+        self.assertEqual(list(cache), ["large"])
+        self.assertGreater(cache.stats()["weight"], 10)
+        cache["other"] = _module("other")
+        self.assertEqual(list(cache), ["other"])
+
+    def test_total_weight(self):
+        policy = modulecache.SizePolicy(1000)
+        cache = modulecache.ModuleCache(policy=policy)
+        cache["builtins"] = builtins_module = _module("builtins")
+        cache["first"] = _module("first", "a = 1\nb = 2")
+        cache["first"] = first = _module("first")
+        cache["second"] = _module("second")
+        del cache["second"]
+        weight = policy.weight(builtins_module) + policy.weight(first)
+        self.assertEqual(cache.stats()["weight"], weight)
+        self.assertEqual(cache.unpinned_weight(), policy.weight(first))
+        self.assertEqual(cache.unpinned_size(), 1)
+
+    def test_candidates_are_read_lazily(self):
+        cache = modulecache.ModuleCache()
+        for name in ("first", "second", "third"):
+            cache[name] = _module(name)
+        read = []
+
+        def candidates():
+            for name in cache:
+                read.append(name)
+                yield name
+
+        policy = modulecache.LRUPolicy(2)
+        self.assertEqual(list(policy.to_evict(cache, candidates())), ["first"])
+        self.assertEqual(read, ["first"])
+        read.clear()
+        policy = modulecache.SizePolicy(2 * cache.weight("first"))
+        self.assertEqual(list(policy.to_evict(cache, candidates())), ["first"])
+        self.assertEqual(read, ["first", "second"])
+
+    def test_idle_policy(self):
+        cache = modulecache.ModuleCache(policy=modulecache.IdlePolicy(0.01))
+        cache["old"] = _module("old")
+        time.sleep(0.02)
+        cache["new"] = _module("new")
+        self.assertEqual(list(cache), ["new"])
+        # Idle modules are only evicted on insertions, or when asked to.
+        cache["newest"] = _module("newest")
+        time.sleep(0.02)
+        self.assertIsNotNone(cache.get("newest"))
+        self.assertEqual(list(cache), ["new", "newest"])
+        cache.enforce()
+        self.assertEqual(list(cache), ["newest"])
+
+    def test_pinned_modules_are_not_evicted(self):
+        cache = modulecache.ModuleCache(policy=modulecache.LRUPolicy(0))
+        cache.pin("pinned")
+        cache["pinned"] = _module("pinned")
+        cache["first"] = _module("first")
+        cache["second"] = _module("second")
+        self.assertEqual(sorted(cache), ["pinned", "second"])
+
+    def test_eviction_callbacks(self):
+        evicted = []
+        cache = modulecache.ModuleCache(policy=modulecache.LRUPolicy(1))
+        cache.eviction_callbacks.append(evicted.append)
+        cache["first"] = first = _module("first")
+        cache["second"] = _module("second")
+        self.assertEqual(evicted, [first])
+
+
+class InferenceCacheTest(unittest.TestCase):
+    def test_get_and_store(self):
+        cache = modulecache.InferenceCache()
+        module = _module("mod", "a = 1\nb = 2")
+        first, second = module.body
+        self.assertIsNone(cache.get(len, first))
+        cache.store(len, first, [1])
+        cache.store(len, second, [])
+        self.assertEqual(cache.get(len, first), [1])
+        self.assertEqual(cache.get(len, second), [])
+        self.assertIsNone(cache.get(str, first))
+        stats = cache.stats()
+        self.assertEqual(stats["size"], 2)
+        self.assertEqual(stats["modules"], 1)
+        self.assertEqual(stats["hits"], 2)
+        self.assertEqual(stats["misses"], 2)
+
+    def test_lru_eviction(self):
+        cache = modulecache.InferenceCache(maxsize=2)
+        first, second, third = _module("mod", "a = 1\nb = 2\nc = 3").body
+        cache.store(len, first, [1])
+        cache.store(len, second, [2])
+        cache.get(len, first)
+        cache.store(len, third, [3])
+        self.assertIsNone(cache.get(len, second))
+        self.assertEqual(cache.get(len, first), [1])
+        self.assertEqual(cache.evictions, 1)
+        cache.maxsize = 0
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.stats()["modules"], 0)
+
+    def test_drop_module(self):
+        cache = modulecache.InferenceCache()
+        kept = _module("kept").body[0]
+        dropped = _module("dropped").body[0]
+        cache.store(len, kept, [1])
+        cache.store(len, dropped, [2])
+        cache.drop_module(dropped.root())
+        self.assertIsNone(cache.get(len, dropped))
+        self.assertEqual(cache.get(len, kept), [1])
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+
+class ManagerEvictionTest(unittest.TestCase):
+    def setUp(self):
+        self.manager = manager.AstroidManager()
+
+    def tearDown(self):
+        self.manager.astroid_cache.pop("evicted_module", None)
+
+    def test_evicted_module_inference_caches_are_dropped(self):
+        module = astroid.parse(
+            """
+        import collections
+        Point = collections.namedtuple("Point", "x y")
+        Point(1, 2)
+        """,
+            module_name="evicted_module",
+        )
+        call = module.body[-1].value
+        self.assertIsInstance(next(call.infer()), astroid.Instance)
+        self.assertIn(module, self.manager.inference_tip_cache._keys_by_module)
+        self.manager._drop_module_caches(module)
+        self.assertNotIn(module, self.manager.inference_tip_cache._keys_by_module)
+        # Inference still works once the caches were dropped.
+        self.assertIsInstance(next(call.infer()), astroid.Instance)
+
+    def test_importers_of_evicted_module_lose_their_inference_results(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        sys.path.insert(0, directory)
+        self.addCleanup(sys.path.remove, directory)
+        sources = {
+            "ev_base": "class Base:\n    pass\n",
+            "ev_user": "import ev_base\nvalue = ev_base.Base()\ndef func():\n    pass\n",
+            "ev_other": "other = 1\n",
+        }
+        for modname, source in sources.items():
+            with open(os.path.join(directory, modname + ".py"), "w") as stream:
+                stream.write(source)
+        isolated = manager.AstroidManager(isolated=True)
+        memo = isolated.inference_memo
+        base = isolated.ast_from_module_name("ev_base")
+        user = isolated.ast_from_module_name("ev_user")
+        other = isolated.ast_from_module_name("ev_other")
+        # The results are memoized once every one was inferred.
+        (instance,) = user["value"].infer()
+        self.assertIs(instance.root(), base)
+        (constant,) = other["other"].infer()
+        self.assertEqual(constant.value, 1)
+        function = user["func"]
+        function._get_assign_nodes()
+        self.assertEqual(function.blockstart_tolineno, 3)
+        self.assertIn(user, memo._keys_by_module)
+        self.assertIn(other, memo._keys_by_module)
+        isolated._drop_module_caches(base)
+        self.assertNotIn(user, memo._keys_by_module)
+        self.assertIsNone(function._cache)
+        self.assertNotIn("blockstart_tolineno", function.__dict__)
+        # The results of the modules which did not import it are kept.
+        self.assertIn(other, memo._keys_by_module)
+
+    def test_evicted_module_foreign_attributes_are_removed(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        sys.path.insert(0, directory)
+        self.addCleanup(sys.path.remove, directory)
+        sources = {
+            "ev_a": "import ev_b\nev_b.y = 1\n",
+            "ev_b": "x = 0\n",
+            "ev_c": "z = 1\n",
+        }
+        for modname, source in sources.items():
+            with open(os.path.join(directory, modname + ".py"), "w") as stream:
+                stream.write(source)
+        isolated = manager.AstroidManager(isolated=True)
+        isolated.astroid_cache.policy = modulecache.LRUPolicy(maxsize=1)
+        target = isolated.ast_from_module_name("ev_b")
+        isolated.astroid_cache.pin("ev_b")
+        isolated.ast_from_module_name("ev_a")
+        self.assertEqual(len(target.locals["y"]), 1)
+        isolated.ast_from_module_name("ev_c")
+        self.assertNotIn("ev_a", isolated.astroid_cache)
+        self.assertNotIn("y", target.locals)
+        # The rebuilt module assigns the attribute again, only once.
+        isolated.ast_from_module_name("ev_a")
+        self.assertEqual(len(target.locals["y"]), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
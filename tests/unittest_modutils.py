@@ -30,6 +30,7 @@ from xml import etree
 from xml.etree import ElementTree
 import tempfile
 import shutil
+from unittest import mock
 
 import astroid
 from astroid.interpreter._import import spec
@@ -73,6 +74,47 @@ class ModuleFileTest(unittest.TestCase):
         found_spec = spec.find_spec(["distutils", "version"])
         self.assertEqual(found_spec.location, distutils.version.__file__)
 
+    def test_find_module_in_listed_directory(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        os.mkdir(os.path.join(directory, "package"))
+        for name in ("module.py", os.path.join("package", "__init__.py")):
+            with open(os.path.join(directory, name), "w"):
+                pass
+        for path in (os.path.join(directory, "package"), directory):
+            os.utime(path, (1, 1))
+
+        found_spec = spec.find_spec(["module"], [directory])
+        self.assertEqual(found_spec.type, spec.ModuleType.PY_SOURCE)
+        self.assertEqual(found_spec.location, os.path.join(directory, "module.py"))
+        found_spec = spec.find_spec(["package"], [directory])
+        self.assertEqual(found_spec.type, spec.ModuleType.PKG_DIRECTORY)
+        # The listings are reused while the directories are not modified.
+        with mock.patch("os.scandir", side_effect=AssertionError):
+            spec.find_spec(["module"], [directory])
+            spec.find_spec(["package"], [directory])
+            with self.assertRaises(ImportError):
+                spec.find_spec(["other"], [directory])
+
+        with open(os.path.join(directory, "other.py"), "w"):
+            pass
+        os.utime(directory, (2, 2))
+        found_spec = spec.find_spec(["other"], [directory])
+        self.assertEqual(found_spec.location, os.path.join(directory, "other.py"))
+
+    def test_recently_modified_directory_is_listed_again(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        with self.assertRaises(ImportError):
+            spec.find_spec(["module"], [directory])
+        # Not seen through the modification time, in the same clock tick.
+        mtime = os.stat(directory).st_mtime_ns
+        with open(os.path.join(directory, "module.py"), "w"):
+            pass
+        os.utime(directory, ns=(mtime, mtime))
+        found_spec = spec.find_spec(["module"], [directory])
+        self.assertEqual(found_spec.location, os.path.join(directory, "module.py"))
+
 
 class LoadModuleFromNameTest(unittest.TestCase):
     """ load a python module from it's name """
@@ -292,6 +334,33 @@ class StandardLibModuleTest(resources.SysPathSetup, unittest.TestCase):
         self.assertTrue(modutils.is_standard_module("sys.whatever"))
         self.assertFalse(modutils.is_standard_module("xml.whatever", etree.__path__))
 
+    def test_standard_modules_are_known_by_name(self):
+        names = modutils._std_module_names()
+        self.assertLessEqual({"sys", "os", "email", "xml", "unicodedata"}, names)
+        self.assertNotIn("astroid", names)
+        self.assertNotIn("site-packages", names)
+        with mock.patch.object(
+            modutils, "file_from_modpath", side_effect=AssertionError
+        ):
+            self.assertTrue(modutils.is_standard_module("email.mime"))
+            self.assertTrue(modutils.is_standard_module("sys"))
+        # The other modules are still looked for.
+        with mock.patch.object(modutils, "file_from_modpath", side_effect=ImportError):
+            self.assertFalse(modutils.is_standard_module("astroid"))
+
+    def test_shadowed_standard_modules_are_looked_for(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        with open(os.path.join(directory, "colorsys.py"), "w") as stream:
+            stream.write("")
+        self.assertTrue(modutils.is_standard_module("colorsys"))
+        sys.path.insert(0, directory)
+        try:
+            self.assertFalse(modutils.is_standard_module("colorsys"))
+            self.assertTrue(modutils.is_standard_module("email"))
+        finally:
+            sys.path.remove(directory)
+
 
 class IsRelativeTest(unittest.TestCase):
     def test_knownValues_is_relative_1(self):
@@ -337,6 +406,60 @@ class GetModuleFilesTest(unittest.TestCase):
         modules = modutils.get_module_files(non_package, [], list_all=True)
         self.assertEqual(modules, [os.path.join(non_package, "file.py")])
 
+    def test_iter_module_files(self):
+        package = resources.find("data/find_test")
+        expected = {
+            ("find_test", os.path.join(package, "__init__.py")),
+            ("find_test.module", os.path.join(package, "module.py")),
+            ("find_test.module2", os.path.join(package, "module2.py")),
+            ("find_test.nonregr", os.path.join(package, "nonregr.py")),
+        }
+        modules = modutils.iter_module_files(
+            package, ["noendingnewline.py"], patterns=["*.py"], workers=4
+        )
+        self.assertEqual(set(modules), expected)
+        modules = modutils.iter_module_files(package, ignore_patterns=["module*"])
+        self.assertEqual(
+            {modname for modname, _ in modules},
+            {"find_test", "find_test.noendingnewline", "find_test.nonregr"},
+        )
+        non_package = resources.find("data/notamodule")
+        modules = modutils.iter_module_files(non_package, list_all=True)
+        self.assertEqual(
+            list(modules), [("file", os.path.join(non_package, "file.py"))]
+        )
+        with self.assertRaises(TypeError):
+            modutils.iter_module_files(package, [], False, ["*.py"])
+
+    def test_iter_module_files_of_subpackages(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        for path in ("pkg/sub/deep", "pkg/sub/tests", "pkg/data"):
+            os.makedirs(os.path.join(directory, *path.split("/")))
+        for path in (
+            "pkg/__init__.py",
+            "pkg/sub/__init__.py",
+            "pkg/sub/mod.py",
+            "pkg/sub/deep/__init__.py",
+            "pkg/sub/tests/__init__.py",
+            "pkg/data/script.py",
+        ):
+            with open(os.path.join(directory, *path.split("/")), "w"):
+                pass
+        package = os.path.join(directory, "pkg")
+        for workers in (1, 4):
+            modules = modutils.iter_module_files(
+                package, ignore_patterns=["sub/tests"], workers=workers
+            )
+            self.assertEqual(
+                {modname for modname, _ in modules},
+                {"pkg", "pkg.sub", "pkg.sub.mod", "pkg.sub.deep"},
+            )
+        # The scans left are cancelled when the iteration is stopped early.
+        modules = modutils.iter_module_files(package, workers=4)
+        self.assertEqual(next(modules)[0], "pkg")
+        modules.close()
+
     def test_load_module_set_attribute(self):
         del xml.etree.ElementTree
         del sys.modules["xml.etree.ElementTree"]
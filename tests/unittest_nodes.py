@@ -1360,5 +1360,38 @@ def test_is_generator_for_yield_in_aug_assign():
     assert bool(node.is_generator())
 
 
+def test_cached_values_are_stored_in_the_node_cache():
+    node = astroid.extract_node(
+        """
+    def func():
+        return 1
+    """
+    )
+    assert node._cache is None
+    node._get_assign_nodes()
+    assert node._get_assign_nodes in node._cache
+    node._cache = None
+    assert node._get_assign_nodes() == []
+
+
+def test_cached_properties_can_be_deleted():
+    function = astroid.extract_node(
+        """
+    def func():  #@
+        return 1  #@
+    """
+    )
+    function, return_node = function
+    assert function.blockstart_tolineno == 2
+    assert function.__dict__["blockstart_tolineno"] == 2
+    del function.blockstart_tolineno
+    assert "blockstart_tolineno" not in function.__dict__
+    assert return_node.fromlineno == 3
+    return_node.lineno = 5
+    assert return_node.fromlineno == 3
+    del return_node.fromlineno
+    assert return_node.fromlineno == 5
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,169 @@
+# Licensed under the LGPL: https://www.gnu.org/licenses/old-licenses/lgpl-2.1.en.html
+# For details: https://github.com/PyCQA/astroid/blob/master/LICENSE
+
+import os
+import shutil
+import sys
+import tempfile
+import textwrap
+import unittest
+
+import astroid
+from astroid import MANAGER
+from astroid import builder
+from astroid import exceptions
+from astroid import manager
+from astroid import nodes
+from astroid import plugins
+
+
+EAGER_PLUGIN = "astroid_test_eager_plugin"
+LAZY_PLUGIN = "astroid_test_lazy_plugin"
+HOOK_PLUGIN = "astroid_test_hook_plugin"
+HOOK_PLUGIN_SOURCE = """
+import astroid
+
+def _hook(modname):
+    if modname != "hooked_module.sub":
+        raise astroid.AstroidBuildingError(modname=modname)
+    return astroid.parse("hooked = True", modname)
+
+astroid.MANAGER.register_failed_import_hook(_hook)
+"""
+
+
+class PluginRegistryTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        for name, source in (
+            (EAGER_PLUGIN, ""),
+            (LAZY_PLUGIN, ""),
+            (HOOK_PLUGIN, HOOK_PLUGIN_SOURCE),
+        ):
+            with open(os.path.join(self.directory, name + ".py"), "w") as stream:
+                stream.write(textwrap.dedent(source))
+        with open(os.path.join(self.directory, "README"), "w") as stream:
+            stream.write("not a plugin")
+        sys.path.append(self.directory)
+        self.registry = plugins.PluginRegistry(
+            self.directory,
+            {
+                LAZY_PLUGIN: ("lazy_trigger", "other_trigger"),
+                HOOK_PLUGIN: ("hooked_module",),
+            },
+        )
+        self.failed_import_hooks = list(MANAGER._failed_import_hooks)
+
+    def tearDown(self):
+        MANAGER._failed_import_hooks[:] = self.failed_import_hooks
+        sys.path.remove(self.directory)
+        for name in (EAGER_PLUGIN, LAZY_PLUGIN, HOOK_PLUGIN):
+            sys.modules.pop(name, None)
+        shutil.rmtree(self.directory)
+
+    def test_undeclared_plugins_are_eager(self):
+        self.assertEqual(self.registry.pending(), {LAZY_PLUGIN, HOOK_PLUGIN})
+        self.registry.load_all()
+        self.assertEqual(self.registry.pending(), set())
+        self.assertEqual(self.registry.loaded, {EAGER_PLUGIN, LAZY_PLUGIN, HOOK_PLUGIN})
+
+    def test_load_for_module_and_submodules(self):
+        self.registry.load_for("unrelated")
+        self.registry.load_for("lazy")
+        self.assertNotIn(LAZY_PLUGIN, sys.modules)
+        self.registry.load_for("lazy_trigger.sub.module")
+        self.assertIn(LAZY_PLUGIN, sys.modules)
+        self.assertEqual(self.registry.pending(), {HOOK_PLUGIN})
+        # Another trigger of a loaded plugin does not import it again.
+        del sys.modules[LAZY_PLUGIN]
+        self.registry.load_for("other_trigger")
+        self.assertNotIn(LAZY_PLUGIN, sys.modules)
+
+    def test_load_for_imports(self):
+        import_node, relative_node, import_from_node = builder.extract_node(
+            """
+        import os, lazy_trigger.sub as sub #@
+        from . import lazy_trigger #@
+        from hooked_module import name #@
+        """
+        )
+        self.registry._load_for_import_from(relative_node)
+        self.assertEqual(self.registry.loaded, set())
+        self.registry._load_for_import(import_node)
+        self.assertEqual(self.registry.loaded, {LAZY_PLUGIN})
+        self.registry._load_for_import_from(import_from_node)
+        self.assertEqual(self.registry.loaded, {LAZY_PLUGIN, HOOK_PLUGIN})
+
+    def test_manager_loads_plugins_of_built_modules(self):
+        registry, MANAGER.brain_plugins = MANAGER.brain_plugins, self.registry
+        try:
+            astroid.parse("x = 1", "lazy_trigger.module")
+            self.assertEqual(self.registry.loaded, {LAZY_PLUGIN})
+            # The failed import hooks registered by the plugin are used.
+            module = MANAGER.ast_from_module_name("hooked_module.sub")
+        finally:
+            MANAGER.brain_plugins = registry
+        self.assertIn(HOOK_PLUGIN, self.registry.loaded)
+        self.assertEqual(module.name, "hooked_module.sub")
+        self.assertIn("hooked", module.locals)
+        with self.assertRaises(exceptions.AstroidImportError):
+            MANAGER.ast_from_module_name("hooked_module.other")
+
+    def test_isolated_managers_load_plugins_on_demand(self):
+        registry = MANAGER.brain_plugins
+        self.registry.install(MANAGER)
+        try:
+            isolated = manager.AstroidManager(isolated=True)
+            self.assertEqual(self.registry.pending(), {LAZY_PLUGIN, HOOK_PLUGIN})
+            module = isolated.ast_from_module_name("hooked_module.sub")
+        finally:
+            MANAGER.brain_plugins = registry
+            MANAGER.unregister_transform(nodes.Import, self.registry._load_for_import)
+            MANAGER.unregister_transform(
+                nodes.ImportFrom, self.registry._load_for_import_from
+            )
+        self.assertEqual(self.registry.loaded, {EAGER_PLUGIN, HOOK_PLUGIN})
+        # The hook which the plugin registered with the shared manager is
+        # used by the isolated one, building the module for it.
+        self.assertIs(module.manager, isolated)
+        self.assertIs(isolated.astroid_cache["hooked_module.sub"], module)
+        self.assertNotIn("hooked_module.sub", MANAGER.astroid_cache)
+
+    def test_later_import_transforms_are_applied(self):
+        registry = MANAGER.brain_plugins
+        transformed = []
+
+        def transform(node):
+            transformed.append(node.modname)
+
+        self.registry.install(MANAGER)
+        MANAGER.register_transform(nodes.ImportFrom, transform)
+        try:
+            astroid.parse("from lazy_trigger import name")
+        finally:
+            MANAGER.brain_plugins = registry
+            MANAGER.unregister_transform(nodes.ImportFrom, transform)
+            MANAGER.unregister_transform(nodes.Import, self.registry._load_for_import)
+            MANAGER.unregister_transform(
+                nodes.ImportFrom, self.registry._load_for_import_from
+            )
+        self.assertIn(LAZY_PLUGIN, self.registry.loaded)
+        self.assertEqual(transformed, ["lazy_trigger"])
+
+
+class BrainPluginsTest(unittest.TestCase):
+    def test_generic_plugins_are_eager(self):
+        self.assertIn("brain_builtin_inference", MANAGER.brain_plugins.loaded)
+        self.assertIn("brain_typing", MANAGER.brain_plugins.loaded)
+
+    def test_lazy_plugins_exist(self):
+        names = {
+            filename[:-3]
+            for filename in os.listdir(MANAGER.brain_plugins.directory)
+            if filename.endswith(".py")
+        }
+        self.assertLessEqual(set(plugins.LAZY_PLUGINS), names)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+# Licensed under the LGPL: https://www.gnu.org/licenses/old-licenses/lgpl-2.1.en.html
+# For details: https://github.com/PyCQA/astroid/blob/master/LICENSE
+
+import io
+import json
+import unittest
+
+from astroid import MANAGER
+from astroid import builder
+from astroid import inference_tip
+from astroid import nodes
+from astroid import profiling
+
+
+def _infer_answer(node, context=None):
+    return iter([nodes.Const(42)])
+
+
+class InferenceProfilerTest(unittest.TestCase):
+    def setUp(self):
+        MANAGER.profile_inference()
+
+    def tearDown(self):
+        MANAGER.profile_inference(False)
+
+    def test_node_statistics(self):
+        node = builder.extract_node(
+            """
+        def function(value):
+            return [value, value]
+        function(1) #@
+        """
+        )
+        self.assertIsInstance(MANAGER.inference_profiler, profiling.InferenceProfiler)
+        self.assertEqual(len(node.inferred()), 1)
+        stats = {stat["name"]: stat for stat in MANAGER.inference_stats()}
+        self.assertEqual(stats["Call"]["kind"], "node")
+        self.assertEqual(stats["Call"]["calls"], 1)
+        self.assertEqual(stats["Call"]["results"], 1)
+        self.assertGreaterEqual(stats["Name"]["calls"], 1)
+        self.assertGreater(stats["Call"]["time"], 0)
+        for stat in stats.values():
+            if stat["lookups"]:
+                self.assertEqual(stat["hit_rate"], stat["hits"] / stat["lookups"])
+            else:
+                self.assertIsNone(stat["hit_rate"])
+
+        stream = io.StringIO()
+        MANAGER.inference_profiler.dump_json(stream)
+        self.assertEqual(json.loads(stream.getvalue()), MANAGER.inference_stats())
+
+    def test_inference_tip_statistics(self):
+        transform = inference_tip(_infer_answer)
+        MANAGER.register_transform(nodes.Call, transform, key="answer")
+        try:
+            first, second = builder.extract_node(
+                """
+            answer() #@
+            answer() #@
+            """
+            )
+            self.assertEqual(first.inferred()[0].value, 42)
+            self.assertEqual(first.inferred()[0].value, 42)
+            self.assertEqual(second.inferred()[0].value, 42)
+        finally:
+            MANAGER.unregister_transform(nodes.Call, transform, key="answer")
+        stats = {stat["name"]: stat for stat in MANAGER.inference_stats()}
+        name = "tests.unittest_profiling._infer_answer"
+        self.assertEqual(stats[name]["kind"], "tip")
+        self.assertEqual(stats[name]["calls"], 2)
+        self.assertEqual(stats[name]["results"], 2)
+        self.assertEqual(stats[name]["lookups"], 2)
+        self.assertEqual(stats[name]["hits"], 0)
+
+    def test_flamegraph(self):
+        node = builder.extract_node("a = 1\nb = a\nb #@")
+        node.inferred()
+        stream = io.StringIO()
+        MANAGER.inference_profiler.dump_flamegraph(stream)
+        stacks = {}
+        for line in stream.getvalue().splitlines():
+            stack, microseconds = line.rsplit(" ", 1)
+            stacks[stack] = int(microseconds)
+        self.assertTrue(stacks)
+        self.assertTrue(all(stack.startswith("Name") for stack in stacks))
+        self.assertTrue(all(microseconds > 0 for microseconds in stacks.values()))
+
+    def test_disabled(self):
+        MANAGER.profile_inference(False)
+        self.assertIsNone(MANAGER.inference_profiler)
+        self.assertEqual(MANAGER.inference_stats(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
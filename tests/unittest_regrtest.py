@@ -25,7 +25,6 @@ from astroid.builder import AstroidBuilder, extract_node
 from astroid import exceptions
 from astroid.raw_building import build_module
 from astroid.manager import AstroidManager
-from astroid import transforms
 from . import resources
 
 try:
@@ -47,15 +46,9 @@ class NonRegressionTests(resources.AstroidCacheSetupMixin, unittest.TestCase):
         sys.path_importer_cache.pop(resources.find("data"), None)
 
     def brainless_manager(self):
-        manager = AstroidManager()
         # avoid caching into the AstroidManager borg since we get problems
         # with other tests :
-        manager.__dict__ = {}
-        manager._failed_import_hooks = []
-        manager.astroid_cache = {}
-        manager._mod_file_cache = {}
-        manager._transform = transforms.TransformVisitor()
-        return manager
+        return AstroidManager(isolated=True, with_brain=False)
 
     def test_module_path(self):
         man = self.brainless_manager()
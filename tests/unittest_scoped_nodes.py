@@ -35,12 +35,14 @@ import sys
 import textwrap
 from functools import partial
 import unittest
+from unittest.mock import patch
 
 import pytest
 from astroid import builder, objects
 from astroid import nodes
 from astroid import scoped_nodes
 from astroid import util
+from astroid.context import InferenceContext
 from astroid.exceptions import (
     InferenceError,
     AttributeInferenceError,
@@ -1577,6 +1579,96 @@ class ClassNodeTest(ModuleLoader, unittest.TestCase):
         with self.assertRaises(DuplicateBasesError) as ex:
             cls.mro()
 
+    def test_mro_and_ancestors_are_cached(self):
+        cls = builder.extract_node(
+            """
+        class A: pass
+        class B(A): pass
+        class C(B): pass #@
+        """
+        )
+        mro = cls.mro()
+        self.assertEqual([klass.name for klass in mro], ["C", "B", "A", "object"])
+        ancestors = list(cls.ancestors())
+        direct = list(cls.ancestors(recurs=False))
+        with patch.object(scoped_nodes.ClassDef, "_compute_mro") as compute_mro:
+            with patch.object(
+                scoped_nodes.ClassDef, "_infer_ancestors"
+            ) as infer_ancestors:
+                self.assertEqual(cls.mro(), mro)
+                self.assertIsNot(cls.mro(), cls.mro())
+                self.assertEqual(list(cls.ancestors()), ancestors)
+                self.assertEqual(list(cls.ancestors(recurs=False)), direct)
+        compute_mro.assert_not_called()
+        infer_ancestors.assert_not_called()
+        cls._cache = None
+        self.assertEqual(cls.mro(), mro)
+
+    def test_mro_depending_on_the_context_is_not_cached(self):
+        cls = builder.extract_node(
+            """
+        class A:
+            pass
+        class B(A): #@
+            pass
+        """
+        )
+        cls.mro()
+        context = InferenceContext()
+        context.path.add((cls, None))
+        with patch.object(scoped_nodes.ClassDef, "_compute_mro") as compute_mro:
+            cls.mro(context)
+            cls.mro(context)
+        self.assertEqual(compute_mro.call_count, 2)
+
+    def test_attribute_index(self):
+        cls = builder.extract_node(
+            """
+        class A:
+            attr = 1
+            def __init__(self):
+                self.value = 1
+        class B(A):
+            attr = 2
+        class C(B):
+            def __init__(self):
+                self.value = 3
+        C #@
+        """
+        ).inferred()[0]
+        self.assertEqual(
+            [owner.name for owner in cls._ancestors_defining("attr")], ["B", "A"]
+        )
+        self.assertEqual(
+            [
+                owner.name
+                for owner in cls._ancestors_defining("value", "instance_attrs")
+            ],
+            ["A"],
+        )
+        self.assertEqual(list(cls._ancestors_defining("missing")), [])
+        self.assertEqual([value.lineno for value in cls.getattr("attr")], [7, 3])
+        self.assertEqual(len(cls.instance_attr("value")), 2)
+
+        # Names added to an ancestor afterwards are indexed as well.
+        ancestor = next(cls.ancestors())
+        ancestor.locals["added"] = [nodes.Const(1, parent=ancestor)]
+        owners = cls._ancestors_defining("added")
+        self.assertEqual([owner.name for owner in owners], ["B"])
+        self.assertEqual(cls.getattr("added"), ancestor.locals["added"])
+
+        # So are renamed ones, the sizes of the namespaces being unchanged.
+        ancestor.locals["renamed"] = ancestor.locals.pop("added")
+        self.assertEqual(list(cls._ancestors_defining("added")), [])
+        owners = cls._ancestors_defining("renamed")
+        self.assertEqual([owner.name for owner in owners], ["B"])
+
+        # Namespaces replaced by plain dictionaries are scanned instead.
+        ancestor.locals = dict(ancestor.locals, replaced=ancestor.locals["attr"])
+        self.assertIsNone(cls._attribute_index("locals"))
+        owners = cls._ancestors_defining("replaced")
+        self.assertEqual([owner.name for owner in owners], ["B"])
+
     def test_generator_from_infer_call_result_parent(self):
         func = builder.extract_node(
             """
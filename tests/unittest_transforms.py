@@ -11,6 +11,7 @@
 
 
 import contextlib
+import sys
 import time
 import unittest
 
@@ -238,6 +239,140 @@ class TestTransforms(unittest.TestCase):
         """
         )
 
+    def test_shared_node_is_transformed_once(self):
+        calls = []
+
+        def transform_name(node):
+            calls.append(node)
+            return nodes.const_factory(len(calls))
+
+        self.transformer.register_transform(nodes.Name, transform_name)
+        module = parse("a\nb", apply_transforms=False)
+        module.body[1].value = module.body[0].value
+        module = self.transformer.visit(module)
+        self.assertEqual(len(calls), 1)
+        self.assertIs(module.body[0].value, module.body[1].value)
+        self.assertEqual(module.body[0].value.value, 1)
+
+    def test_unchanged_fields_are_kept(self):
+        module = parse("f(a, b)\nx = [c, d]", apply_transforms=False)
+        args = module.body[0].value.args
+        elts = module.body[1].value.elts
+        module = self.transformer.visit(module)
+        self.assertIs(module.body[0].value.args, args)
+        self.assertIs(module.body[1].value.elts, elts)
+
+    def test_visited_nodes_are_released(self):
+        self.transformer.register_transform(nodes.ClassDef, lambda node: node)
+        module = parse("class A: pass", apply_transforms=False)
+        refcount = sys.getrefcount(module.body[0])
+        self.transformer.visit(module)
+        self.assertEqual(sys.getrefcount(module.body[0]), refcount)
+
+    def test_keyed_transforms(self):
+        seen = []
+
+        def transform_call(node):
+            seen.append(("keyed", node.as_string()))
+            return node
+
+        def transform_any_call(node):
+            seen.append(("any", node.as_string()))
+            return node
+
+        self.transformer.register_transform(nodes.Call, transform_any_call)
+        self.transformer.register_transform(nodes.Call, transform_call, key="sample")
+        self.transformer.register_transform(nodes.Call, transform_any_call)
+        self.parse_transform(
+            """
+        random.sample(x, 1)
+        sample(y, 1)
+        other()
+        (lambda: 1)()
+        """
+        )
+        self.assertEqual(
+            seen,
+            [
+                ("any", "random.sample(x, 1)"),
+                ("keyed", "random.sample(x, 1)"),
+                ("any", "random.sample(x, 1)"),
+                ("any", "sample(y, 1)"),
+                ("keyed", "sample(y, 1)"),
+                ("any", "sample(y, 1)"),
+                ("any", "other()"),
+                ("any", "other()"),
+                ("any", "(lambda: 1)()"),
+                ("any", "(lambda: 1)()"),
+            ],
+        )
+
+    def test_keyed_transforms_with_predicate(self):
+        def transform_module(node):
+            node.locals["extended"] = []
+            return node
+
+        self.transformer.register_transform(
+            nodes.Module, transform_module, lambda node: node.file == "<?>", key="mod"
+        )
+        module = self.transformer.visit(parse("", "mod", "mod.py"))
+        self.assertNotIn("extended", module.locals)
+        module = self.transformer.visit(parse("", "mod"))
+        self.assertIn("extended", module.locals)
+        module = self.transformer.visit(parse("", "other"))
+        self.assertNotIn("extended", module.locals)
+
+        with self.assertRaises(ValueError):
+            # Registered with a predicate.
+            self.transformer.unregister_transform(
+                nodes.Module, transform_module, key="mod"
+            )
+
+    def test_unregister_keyed_transform(self):
+        def transform_name(node):
+            return nodes.const_factory(node.name)
+
+        self.transformer.register_transform(nodes.Name, transform_name, key="a")
+        self.transformer.unregister_transform(nodes.Name, transform_name, key="a")
+        module = self.parse_transform("a")
+        self.assertIsInstance(module.body[0].value, nodes.Name)
+        self.assertEqual(self.transformer.keyed_transforms[nodes.Name], {})
+
+    def test_unkeyable_node_class(self):
+        with self.assertRaises(ValueError):
+            self.transformer.register_transform(nodes.Const, lambda node: node, key=1)
+
+    def test_transform_stats(self):
+        def transform_name(node):
+            return node
+
+        def is_a(node):
+            return node.name == "a"
+
+        self.transformer.register_transform(nodes.Name, transform_name, is_a)
+        self.transformer.register_transform(nodes.Name, transform_name, key="b")
+        self.parse_transform("a, b, c")
+        self.assertEqual(self.transformer.transform_stats(), [])
+
+        self.transformer.profile_transforms()
+        self.parse_transform("a, b, c")
+        stats = sorted(
+            self.transformer.transform_stats(), key=lambda stat: stat["key"] or ""
+        )
+        self.assertEqual(len(stats), 2)
+        self.assertEqual(stats[0]["node_class"], "Name")
+        self.assertTrue(stats[0]["predicate"].endswith("is_a"))
+        self.assertEqual((stats[0]["checks"], stats[0]["calls"]), (3, 1))
+        self.assertEqual(stats[1]["key"], "b")
+        self.assertIsNone(stats[1]["predicate"])
+        self.assertEqual((stats[1]["checks"], stats[1]["calls"]), (1, 1))
+        self.assertGreaterEqual(stats[0]["time"], 0)
+
+        self.transformer.profile_transforms(False)
+        self.parse_transform("a, b, c")
+        stats = self.transformer.transform_stats()
+        self.assertEqual(sum(stat["checks"] for stat in stats), 4)
+
 
 if __name__ == "__main__":
     unittest.main()